@@ -0,0 +1,74 @@
+"""
+Broadcast cost vs client count for the dashboard WebSocket manager.
+
+Compares encoding the payload once per client (the old send_json path)
+with the shared Frame path, for plain JSON and deflated frames.
+
+Usage:
+    python benchmarks/bench_broadcast.py [--clients 1,10,100,500] [--rounds 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from server import Frame, WS_FRAME_DEFLATE_LEVEL  # noqa: E402
+
+
+def sample_event() -> dict:
+    return {
+        "type": "brain_event",
+        "data": {
+            "id": 123456,
+            "instance_id": "igris-main",
+            "project": "crimson-arena",
+            "event": "task_completed",
+            "detail": {"summary": "refactor websocket fan-out " * 8, "files": [f"f{i}.py" for i in range(20)]},
+        },
+    }
+
+
+def per_client(data: dict, clients: int, deflate: bool):
+    for _ in range(clients):
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        if deflate:
+            zlib.compress(text.encode("utf-8"), WS_FRAME_DEFLATE_LEVEL)
+
+
+def shared(data: dict, clients: int, deflate: bool):
+    frame = Frame(data)
+    encoding = "json.deflate" if deflate else "json"
+    for _ in range(clients):
+        frame.encode(encoding)
+
+
+def timeit(fn, data, clients, deflate, rounds) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(data, clients, deflate)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", default="1,10,100,500")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    data = sample_event()
+    print(f"{'clients':>8} {'format':>13} {'per-client us':>14} {'shared us':>10} {'speedup':>8}")
+    for clients in (int(c) for c in args.clients.split(",")):
+        for deflate in (False, True):
+            old = timeit(per_client, data, clients, deflate, args.rounds)
+            new = timeit(shared, data, clients, deflate, args.rounds)
+            label = "json.deflate" if deflate else "json"
+            print(f"{clients:>8} {label:>13} {old:>14.1f} {new:>10.1f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Frame size and encode/decode time per WebSocket wire format.
+
+Builds payloads shaped like the dashboard's largest frames (state,
+brain_tasks with 100 tasks, brain_events with 50 events) and reports,
+for json, json.deflate and msgpack (when installed), the encoded size
+and the mean encode/decode time.
+
+Usage:
+    python benchmarks/bench_frames.py [--rounds 500]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from server import WS_SUBPROTOCOLS, encode_frame, msgpack  # noqa: E402
+
+random.seed(7)
+PROJECTS = ["crimson-arena", "igris-core", "brain-sync", "hunt-tools"]
+AGENTS = ["architect", "implementer", "reviewer", "tester", "scout", "scribe"]
+
+
+def iso(n: int) -> str:
+    return f"2026-10-{1 + n % 28:02d}T{n % 24:02d}:{n % 60:02d}:00+00:00"
+
+
+def state_payload() -> dict:
+    agents = {
+        name: {
+            "invocations": random.randint(10, 900),
+            "level": random.randint(1, 20),
+            "avg_duration_s": round(random.uniform(5, 300), 2),
+            "total_tokens": random.randint(10_000, 5_000_000),
+            "stats": {k: random.randint(1, 99) for k in ("STR", "INT", "SPD", "VIT", "CRI", "MP")},
+        }
+        for name in AGENTS
+    }
+    return {
+        "type": "state",
+        "data": {
+            "agents": agents,
+            "recent_events": [
+                {
+                    "ts": iso(i), "event": random.choice(["start", "stop"]),
+                    "agent": random.choice(AGENTS), "project_slug": random.choice(PROJECTS),
+                    "duration_s": round(random.uniform(0, 120), 2),
+                    "input_tokens": random.randint(0, 50_000), "output_tokens": random.randint(0, 8_000),
+                }
+                for i in range(50)
+            ],
+            "skill_heatmap": {
+                f"skill-{i}": {iso(d)[:10]: random.randint(0, 12) for d in range(14)}
+                for i in range(20)
+            },
+            "budget": {"daily_limit": 50.0, "spent_today": 12.37, "remaining": 37.63},
+            "totals": {"events": 48213, "agents": len(AGENTS), "tokens": 91_234_112},
+        },
+    }
+
+
+def tasks_payload() -> dict:
+    return {
+        "type": "brain_tasks",
+        "data": {
+            "tasks": [
+                {
+                    "id": i, "title": f"Task {i}: " + "refine websocket fan-out " * 2,
+                    "status": random.choice(["open", "in_progress", "done"]),
+                    "project": random.choice(PROJECTS), "priority": random.randint(1, 5),
+                    "created_at": iso(i), "updated_at": iso(i + 3),
+                    "assignee": random.choice(AGENTS), "tags": random.sample(["perf", "ws", "db", "ui"], 2),
+                }
+                for i in range(100)
+            ],
+            "count": 100,
+        },
+    }
+
+
+def events_payload() -> dict:
+    return {
+        "type": "brain_events",
+        "data": {
+            "events": [
+                {
+                    "id": 10_000 + i, "event_name": random.choice(["brief_started", "task_done", "sync"]),
+                    "instance_id": f"inst-{i % 7}", "project": random.choice(PROJECTS),
+                    "ts": iso(i), "payload": {"summary": "agent finished step " * 3, "step": i},
+                }
+                for i in range(50)
+            ],
+        },
+    }
+
+
+def decoder(encoding: str):
+    if encoding == "msgpack":
+        return lambda b: msgpack.unpackb(b, raw=False)
+    if encoding == "json.deflate":
+        return lambda b: json.loads(zlib.decompress(b))
+    return json.loads
+
+
+def bench(payload: dict, encoding: str, rounds: int) -> tuple[int, float, float]:
+    encoded = encode_frame(payload, encoding)
+    decode = decoder(encoding)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encode_frame(payload, encoding)
+    enc_us = (time.perf_counter() - start) / rounds * 1e6
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decode(encoded)
+    dec_us = (time.perf_counter() - start) / rounds * 1e6
+    return len(encoded), enc_us, dec_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    encodings = sorted(set(WS_SUBPROTOCOLS.values()))
+    print(f"{'payload':>12} {'format':>13} {'bytes':>8} {'encode us':>10} {'decode us':>10}")
+    for name, payload in (("state", state_payload()), ("brain_tasks", tasks_payload()),
+                          ("brain_events", events_payload())):
+        for encoding in encodings:
+            size, enc_us, dec_us = bench(payload, encoding, args.rounds)
+            print(f"{name:>12} {encoding:>13} {size:>8} {enc_us:>10.1f} {dec_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Proxy-route cost: decode and re-encode vs raw passthrough.
+
+Builds a gzip-compressed brain /api/tasks body with N tasks (what the
+brain sends for ?limit=N) and times, per request, the two ways a proxy
+route can answer a gzip-accepting client:
+
+    decoded      gunzip, json.loads, JSONResponse render, gzip again
+                 (what the compression middleware does for large JSON)
+    passthrough  passthrough_response: forward the upstream bytes
+
+Reports mean and p99 per request and total CPU time.
+
+Usage:
+    python benchmarks/bench_passthrough.py [--items 100,500,1000] [--rounds 500]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi import Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from server import GZIP_LEVEL, RawBrainBody, passthrough_response  # noqa: E402
+
+random.seed(7)
+STATUSES = ["pending", "running", "done", "failed"]
+
+
+def tasks_body(items: int) -> bytes:
+    tasks = [
+        {
+            "id": f"T-{n:05d}",
+            "title": f"Task {n} " + "x" * random.randint(20, 80),
+            "status": random.choice(STATUSES),
+            "task_type": "build",
+            "project_slug": "crimson-arena",
+            "assignee": f"agent-{n % 7}",
+            "created_at": f"2026-10-{1 + n % 28:02d}T{n % 24:02d}:{n % 60:02d}:00+00:00",
+            "payload": {"attempt": n % 3, "tags": ["a", "b", "c"][: 1 + n % 3]},
+        }
+        for n in range(items)
+    ]
+    body = {"tasks": tasks, "total": items, "limit": items, "offset": 0, "summary": {}}
+    return json.dumps(body).encode()
+
+
+def time_mode(fn, rounds: int) -> tuple[float, float, float]:
+    samples = []
+    cpu = time.process_time()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    cpu = time.process_time() - cpu
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return mean * 1e6, p99 * 1e6, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", default="100,500,1000")
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    request = SimpleNamespace(headers={"accept-encoding": "gzip, br"})
+    print(f"{'items':>6} {'mode':>12} {'wire bytes':>11} {'mean us':>9} {'p99 us':>9} {'cpu s':>7}")
+    for items in (int(n) for n in args.items.split(",")):
+        wire = gzip.compress(tasks_body(items), GZIP_LEVEL)
+        raw = RawBrainBody(wire, "application/json", "gzip", '"tasks-1"')
+
+        def decoded():
+            data = json.loads(gzip.decompress(wire))
+            gzip.compress(JSONResponse(data).body, GZIP_LEVEL)
+
+        def passthrough():
+            passthrough_response(request, raw, Response())
+
+        for name, fn in (("decoded", decoded), ("passthrough", passthrough)):
+            mean, p99, cpu = time_mode(fn, args.rounds)
+            print(f"{items:>6} {name:>12} {len(wire):>11} {mean:>9.1f} {p99:>9.1f} {cpu:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+REST throughput vs uvicorn worker count.
+
+For each worker count, starts ``uvicorn server:app --workers N`` against
+a scratch database (DASHBOARD_DB_PATH) with DASHBOARD_WORKERS=N, drives
+it from several load-generator processes for a fixed duration, and
+prints requests/second and scaling efficiency relative to one worker.
+Run it on a machine with at least as many cores as the largest worker
+count plus the load generators, or the numbers measure CPU contention.
+
+Usage:
+    python benchmarks/bench_rest_scaling.py [--workers 1,2,4] [--duration 10]
+        [--procs 4] [--concurrency 32] [--path /api/agents?range=today]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def wait_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not become ready")
+
+
+async def hammer(url: str, duration: float, concurrency: int) -> tuple[int, int]:
+    ok = errors = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        async def worker():
+            nonlocal ok, errors
+            while time.monotonic() < deadline:
+                try:
+                    resp = await client.get(url)
+                    if resp.status_code == 200:
+                        ok += 1
+                    else:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return ok, errors
+
+
+def load_proc(args):
+    url, duration, concurrency = args
+    return asyncio.run(hammer(url, duration, concurrency))
+
+
+def run(workers: int, port: int, opts) -> tuple[float, int]:
+    scratch = tempfile.mkdtemp(prefix="arena-bench-")
+    env = {
+        **os.environ,
+        "DASHBOARD_WORKERS": str(workers),
+        "DASHBOARD_DB_PATH": os.path.join(scratch, "arena.db"),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    try:
+        url = f"http://127.0.0.1:{port}{opts.path}"
+        wait_ready(url)
+        # Warm-up so every worker has finished startup
+        load_proc((url, 1.0, 4))
+        with multiprocessing.Pool(opts.procs) as pool:
+            results = pool.map(load_proc, [(url, opts.duration, opts.concurrency)] * opts.procs)
+        ok = sum(r[0] for r in results)
+        errors = sum(r[1] for r in results)
+        return ok / opts.duration, errors
+    finally:
+        server.terminate()
+        server.wait(timeout=15)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--procs", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--path", default="/api/agents?range=today")
+    parser.add_argument("--port", type=int, default=8765)
+    opts = parser.parse_args()
+
+    print(f"cores: {os.cpu_count()}  path: {opts.path}")
+    print(f"{'workers':>8} {'req/s':>10} {'errors':>7} {'scaling':>8}")
+    baseline = None
+    for workers in (int(w) for w in opts.workers.split(",")):
+        rps, errors = run(workers, opts.port, opts)
+        baseline = baseline or rps
+        print(f"{workers:>8} {rps:>10.0f} {errors:>7} {rps / baseline / workers:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,9 @@ class ApiConstants {
   static const String events = '$apiBase/events';
   static const String pricing = '$apiBase/pricing';
 
+  /// Several GET endpoints in one round trip (see [BrainApiService.getBatch]).
+  static const String batch = '$apiBase/batch';
+
   // Brain proxy endpoints
   static const String brainHealth = '$apiBase/brain/health';
   static const String brainInstances = '$apiBase/brain/instances';
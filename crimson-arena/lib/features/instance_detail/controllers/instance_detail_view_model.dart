@@ -1,6 +1,7 @@
 import 'package:get/get.dart';
 
 import '../../../core/constants/agent_constants.dart';
+import '../../../core/constants/api_constants.dart';
 import '../../../data/models/agent_nexus_entry.dart';
 import '../../../data/models/brain_event_model.dart';
 import '../../../data/models/execution_log_entry.dart';
@@ -14,7 +15,8 @@ import '../../../services/brain_websocket_service.dart';
 ///
 /// Loads all data scoped to a single instance: agent nexus, execution log,
 /// brain events (paginated), tasks (filtered by project slug), and team
-/// status. Subscribes to WebSocket streams for live updates.
+/// status. The initial load and refreshes go through one batch request.
+/// Subscribes to WebSocket streams for live updates.
 class InstanceDetailViewModel extends GetxController {
   final BrainApiService _api = Get.find();
   final BrainWebSocketService _ws = Get.find();
@@ -79,8 +81,9 @@ class InstanceDetailViewModel extends GetxController {
 
   /// Load all instance-scoped data for the given [instanceId].
   ///
-  /// Finds the instance from the cached instance list, then fetches
-  /// agents, execution log, events, and tasks in parallel.
+  /// Fetches the instance list, agents, execution log, events, and team
+  /// status in one batch request, then the project's tasks once the
+  /// instance (and so its project slug) is resolved.
   Future<void> loadInstance(String instanceId) async {
     if (instanceId == currentInstanceId.value && instance.value != null) return;
 
@@ -98,32 +101,7 @@ class InstanceDetailViewModel extends GetxController {
     eventOffset.value = 0;
     eventTotal.value = 0;
 
-    // Resolve instance from the brain instances list.
-    final instancesData = await _api.getBrainInstances();
-    if (instancesData != null) {
-      final raw = instancesData['instances'] as List<dynamic>? ?? [];
-      final allInstances = raw
-          .whereType<Map<String, dynamic>>()
-          .map(InstanceModel.fromJson)
-          .toList();
-      instance.value =
-          allInstances.firstWhereOrNull((i) => i.id == instanceId);
-    }
-
-    // Parallel fetch of scoped data.
-    await Future.wait([
-      _fetchAgents(instanceId),
-      _fetchExecutionLog(instanceId),
-      _fetchEvents(instanceId),
-      if (instance.value != null)
-        _fetchTasks(instance.value!.projectSlug),
-    ]);
-
-    // Fetch team status.
-    final teamData = await _api.getTeamStatus();
-    if (teamData != null) {
-      teamStatus.value = TeamStatusModel.fromJson(teamData);
-    }
+    await _fetchScoped(instanceId, includeTeam: true);
 
     isLoading.value = false;
   }
@@ -131,11 +109,31 @@ class InstanceDetailViewModel extends GetxController {
   /// Force refresh all data for the current instance.
   Future<void> refreshData() async {
     if (currentInstanceId.value.isEmpty) return;
-    final instanceId = currentInstanceId.value;
+    await _fetchScoped(currentInstanceId.value);
+  }
+
+  // ---------------------------------------------------------------------------
+  // REST data fetching
+  // ---------------------------------------------------------------------------
+
+  Future<void> _fetchScoped(String instanceId, {bool includeTeam = false}) async {
+    final results = await _api.getBatch({
+      'instances': const BatchCall(ApiConstants.brainInstances),
+      'agents': BatchCall(ApiConstants.instanceAgents(instanceId)),
+      'log': BatchCall(
+        ApiConstants.instanceLog(instanceId),
+        queryParams: {'limit': '50'},
+      ),
+      'events': BatchCall(
+        ApiConstants.brainEvents,
+        queryParams: _eventParams(instanceId),
+      ),
+      if (includeTeam) 'team': const BatchCall(ApiConstants.teamStatus),
+    });
 
     // Re-resolve instance (may have updated).
-    final instancesData = await _api.getBrainInstances();
-    if (instancesData != null) {
+    final instancesData = results['instances'];
+    if (instancesData is Map<String, dynamic>) {
       final raw = instancesData['instances'] as List<dynamic>? ?? [];
       final allInstances = raw
           .whereType<Map<String, dynamic>>()
@@ -145,32 +143,42 @@ class InstanceDetailViewModel extends GetxController {
           allInstances.firstWhereOrNull((i) => i.id == instanceId);
     }
 
-    await Future.wait([
-      _fetchAgents(instanceId),
-      _fetchExecutionLog(instanceId),
-      _fetchEvents(instanceId),
-      if (instance.value != null)
-        _fetchTasks(instance.value!.projectSlug),
-    ]);
-  }
+    final agentsData = results['agents'];
+    if (agentsData is Map<String, dynamic>) _applyAgents(agentsData);
 
-  // ---------------------------------------------------------------------------
-  // REST data fetching
-  // ---------------------------------------------------------------------------
+    final logData = results['log'];
+    if (logData is List<dynamic>) {
+      _applyExecutionLog(logData.whereType<Map<String, dynamic>>().toList());
+    }
 
-  Future<void> _fetchAgents(String instanceId) async {
-    final data = await _api.getInstanceAgents(instanceId);
-    if (data != null) {
-      final raw = data['agents'] as List<dynamic>? ?? [];
-      nexusData.value = raw
-          .whereType<Map<String, dynamic>>()
-          .map(AgentNexusEntry.fromJson)
-          .toList();
+    final eventsData = results['events'];
+    if (eventsData is Map<String, dynamic>) _applyEvents(eventsData);
+
+    final teamData = results['team'];
+    if (teamData is Map<String, dynamic>) {
+      teamStatus.value = TeamStatusModel.fromJson(teamData);
     }
+
+    if (instance.value != null) {
+      await _fetchTasks(instance.value!.projectSlug);
+    }
+  }
+
+  Map<String, String> _eventParams(String instanceId) => {
+        'limit': '$_eventPageSize',
+        'offset': '${eventOffset.value}',
+        'instance_id': instanceId,
+      };
+
+  void _applyAgents(Map<String, dynamic> data) {
+    final raw = data['agents'] as List<dynamic>? ?? [];
+    nexusData.value = raw
+        .whereType<Map<String, dynamic>>()
+        .map(AgentNexusEntry.fromJson)
+        .toList();
   }
 
-  Future<void> _fetchExecutionLog(String instanceId) async {
-    final data = await _api.getInstanceLog(instanceId);
+  void _applyExecutionLog(List<Map<String, dynamic>> data) {
     executionLogs.value =
         data.map((e) => ExecutionLogEntry.fromJson(e)).toList();
 
@@ -185,14 +193,16 @@ class InstanceDetailViewModel extends GetxController {
       limit: _eventPageSize,
       offset: eventOffset.value,
     );
-    if (data != null) {
-      final raw = data['events'] as List<dynamic>? ?? [];
-      instanceEvents.value = raw
-          .whereType<Map<String, dynamic>>()
-          .map(BrainEventModel.fromJson)
-          .toList();
-      eventTotal.value = data['total'] as int? ?? instanceEvents.length;
-    }
+    if (data != null) _applyEvents(data);
+  }
+
+  void _applyEvents(Map<String, dynamic> data) {
+    final raw = data['events'] as List<dynamic>? ?? [];
+    instanceEvents.value = raw
+        .whereType<Map<String, dynamic>>()
+        .map(BrainEventModel.fromJson)
+        .toList();
+    eventTotal.value = data['total'] as int? ?? instanceEvents.length;
   }
 
   Future<void> _fetchTasks(String projectSlug) async {
@@ -1,5 +1,6 @@
 import 'package:get/get.dart';
 
+import '../../../core/constants/api_constants.dart';
 import '../../../data/models/project_model.dart';
 import '../../../data/models/session_model.dart';
 import '../../../services/brain_api_service.dart';
@@ -11,7 +12,7 @@ import '../../../services/brain_websocket_service.dart';
 /// registered projects, and recent sessions.
 ///
 /// Data flows from two sources:
-/// 1. REST (initial load)
+/// 1. REST (initial load, one `POST /api/batch` for all panels)
 /// 2. WebSocket streams (real-time updates)
 class OperationsViewModel extends GetxController {
   final BrainApiService _apiService = Get.find();
@@ -63,15 +64,7 @@ class OperationsViewModel extends GetxController {
 
   Future<void> _fetchInitialData() async {
     isLoading.value = true;
-
-    await Future.wait([
-      _fetchBrainHealth(),
-      _fetchSyncStatus(),
-      _fetchKnowledge(),
-      _fetchProjects(),
-      _fetchSessions(),
-    ]);
-
+    await _fetchAll();
     isLoading.value = false;
   }
 
@@ -79,39 +72,33 @@ class OperationsViewModel extends GetxController {
   // REST data fetching
   // ---------------------------------------------------------------------------
 
-  Future<void> _fetchBrainHealth() async {
-    final data = await _apiService.getBrainHealth();
-    if (data != null) {
-      brainHealth.value = data;
-    }
-  }
+  /// Fetch every panel's data in one batch request.
+  Future<void> _fetchAll() async {
+    final results = await _apiService.getBatch({
+      'health': const BatchCall(ApiConstants.brainHealth),
+      'sync': const BatchCall(ApiConstants.syncStatus),
+      'knowledge': const BatchCall(ApiConstants.brainKnowledge),
+      'projects': const BatchCall(ApiConstants.brainProjects),
+      'sessions': const BatchCall(
+        ApiConstants.brainSessions,
+        queryParams: {'days': '7'},
+      ),
+    });
 
-  Future<void> _fetchSyncStatus() async {
-    final data = await _apiService.getSyncStatus();
-    if (data != null) {
-      syncStatus.value = data;
-    }
-  }
+    final health = results['health'];
+    if (health is Map<String, dynamic>) brainHealth.value = health;
 
-  Future<void> _fetchKnowledge() async {
-    final data = await _apiService.getBrainKnowledge();
-    if (data != null) {
-      knowledgeState.value = data;
-    }
-  }
+    final sync = results['sync'];
+    if (sync is Map<String, dynamic>) syncStatus.value = sync;
 
-  Future<void> _fetchProjects() async {
-    final data = await _apiService.getBrainProjects();
-    if (data != null) {
-      _parseProjects(data);
-    }
-  }
+    final knowledge = results['knowledge'];
+    if (knowledge is Map<String, dynamic>) knowledgeState.value = knowledge;
 
-  Future<void> _fetchSessions() async {
-    final data = await _apiService.getBrainSessions();
-    if (data != null) {
-      _parseSessions(data);
-    }
+    final projectsData = results['projects'];
+    if (projectsData is Map<String, dynamic>) _parseProjects(projectsData);
+
+    final sessionsData = results['sessions'];
+    if (sessionsData is Map<String, dynamic>) _parseSessions(sessionsData);
   }
 
   // ---------------------------------------------------------------------------
@@ -189,13 +176,5 @@ class OperationsViewModel extends GetxController {
   // ---------------------------------------------------------------------------
 
   /// Refresh all operations data.
-  Future<void> refreshData() async {
-    await Future.wait([
-      _fetchBrainHealth(),
-      _fetchSyncStatus(),
-      _fetchKnowledge(),
-      _fetchProjects(),
-      _fetchSessions(),
-    ]);
-  }
+  Future<void> refreshData() => _fetchAll();
 }
@@ -5,6 +5,23 @@ import 'package:http/http.dart' as http;
 
 import '../core/constants/api_constants.dart';
 
+/// One GET request inside a [BrainApiService.getBatch] call.
+class BatchCall {
+  const BatchCall(this.path, {this.queryParams});
+
+  /// Endpoint path, one of the [ApiConstants] REST paths.
+  final String path;
+
+  /// Optional query parameters.
+  final Map<String, String>? queryParams;
+
+  Map<String, dynamic> toJson(String id) => {
+        'id': id,
+        'path': path,
+        if (queryParams != null) 'params': queryParams,
+      };
+}
+
 /// REST API service for all Crimson Arena dashboard HTTP calls.
 ///
 /// Wraps the `http` package. Since the Flutter Web app is served from
@@ -56,6 +73,42 @@ class BrainApiService extends GetxService {
     }
   }
 
+  // ---------------------------------------------------------------------------
+  // Batch
+  // ---------------------------------------------------------------------------
+
+  /// Fetch several endpoints in one `POST /api/batch` round trip.
+  ///
+  /// Returns the decoded body for each key of [calls] that answered 200;
+  /// failed sub-requests are left out, so callers treat a missing key the
+  /// way they treat a `null` from the single-endpoint getters. Returns an
+  /// empty map when the batch itself fails.
+  Future<Map<String, dynamic>> getBatch(Map<String, BatchCall> calls) async {
+    try {
+      final response = await _client.post(
+        Uri.parse('$_baseUrl${ApiConstants.batch}'),
+        headers: {'Content-Type': 'application/json'},
+        body: jsonEncode({
+          'requests': [
+            for (final entry in calls.entries) entry.value.toJson(entry.key),
+          ],
+        }),
+      );
+      if (response.statusCode != 200) return {};
+      final decoded = jsonDecode(response.body);
+      if (decoded is! Map<String, dynamic>) return {};
+      final results = <String, dynamic>{};
+      for (final item in decoded['responses'] as List<dynamic>? ?? []) {
+        if (item is Map<String, dynamic> && item['status'] == 200) {
+          results[item['id'] as String] = item['body'];
+        }
+      }
+      return results;
+    } catch (_) {
+      return {};
+    }
+  }
+
   // ---------------------------------------------------------------------------
   // State & Agents
   // ---------------------------------------------------------------------------
@@ -9,23 +9,63 @@ Usage:
 
 Dependencies:
     fastapi, uvicorn, aiosqlite, watchfiles
+    brotli (optional, enables br response compression)
+    numpy (optional, vectorizes RPG stats for large agent sets)
+    msgpack (optional, enables the arena.msgpack WebSocket subprotocol)
+    h2 (optional, enables HTTP/2 to the brain server)
+
+WebSocket subprotocols:
+    arena.json          JSON text frames (default when none is requested)
+    arena.json.deflate  zlib-compressed JSON in binary frames
+    arena.msgpack       MessagePack in binary frames, same schema (needs msgpack)
 """
 
 import asyncio
+import base64
+import bisect
+import fcntl
+import functools
+import inspect
+import gzip
 import json
 import logging
 import os
-import urllib.request
+import time
+import weakref
+import zlib
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
+from urllib.parse import parse_qs
 import httpx
 import aiosqlite
 from pydantic import BaseModel, Field
 from typing import Literal, Optional
-from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect, Query
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # optional: gzip-only compression without it
+    brotli = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: batched RPG stats fall back to pure Python
+    np = None
+
+try:
+    import msgpack
+except ImportError:  # optional: the arena.msgpack subprotocol is not offered
+    msgpack = None
+
+try:
+    import h2
+except ImportError:  # optional: upstream clients speak HTTP/1.1 only
+    h2 = None
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -47,7 +87,10 @@ PROJECT_DIR = os.environ.get(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
 )
 METRICS_DIR = os.path.join(PROJECT_DIR, "ai", "session", "metrics")
-DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "arena.db")
+DB_PATH = os.environ.get(
+    "DASHBOARD_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "arena.db"),
+)
 METRICS_FILE = os.path.join(METRICS_DIR, "agent-metrics.json")
 EVENTS_FILE = os.path.join(METRICS_DIR, "events.jsonl")
 BUDGET_FILE = os.path.join(METRICS_DIR, "budget.json")
@@ -55,6 +98,35 @@ BUDGET_FILE = os.path.join(METRICS_DIR, "budget.json")
 STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 logger.info("Serving dashboard from %s", STATIC_DIR)
 
+# ---------------------------------------------------------------------------
+# Transport Tuning
+# ---------------------------------------------------------------------------
+
+# JSON responses smaller than this are sent uncompressed.
+COMPRESS_MIN_SIZE = int(os.environ.get("DASHBOARD_COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.environ.get("DASHBOARD_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.environ.get("DASHBOARD_BROTLI_QUALITY", "4"))
+# JSON bodies at least this large are compressed in a worker thread.
+COMPRESS_THREAD_MIN_SIZE = int(os.environ.get("DASHBOARD_COMPRESS_THREAD_MIN_SIZE", "65536"))
+# permessage-deflate on /ws is negotiated by uvicorn's websocket protocol, not
+# by this app: uvicorn enables it by default with its own fixed settings, and
+# this switch only takes effect when started via ``python server.py`` (it is
+# passed to uvicorn.run). The deflate level and on-wire sizes are not visible
+# through ASGI, so no WebSocket compression ratio can be measured here.
+WS_PER_MESSAGE_DEFLATE = os.environ.get("DASHBOARD_WS_DEFLATE", "1") != "0"
+# Per-client outbound queue depth and what to do when a client falls behind
+# ("drop_oldest" or "disconnect"); a single send may block at most this long.
+WS_SEND_QUEUE_SIZE = int(os.environ.get("DASHBOARD_WS_QUEUE_SIZE", "256"))
+WS_OVERFLOW_POLICY = os.environ.get("DASHBOARD_WS_OVERFLOW_POLICY", "drop_oldest")
+WS_SEND_TIMEOUT = float(os.environ.get("DASHBOARD_WS_SEND_TIMEOUT", "10"))
+# Broadcast frames kept for replay to reconnecting clients (?last_seq=).
+WS_REPLAY_SIZE = int(os.environ.get("DASHBOARD_WS_REPLAY_SIZE", "1024"))
+# Window (ms) for coalescing event bursts into "events_batch" frames for
+# clients that opt in with ?batch=1; 0 sends every event immediately.
+WS_COALESCE_MS = int(os.environ.get("DASHBOARD_WS_COALESCE_MS", "100"))
+# zlib level for the app-level "arena.json.deflate" frame encoding.
+WS_FRAME_DEFLATE_LEVEL = int(os.environ.get("DASHBOARD_WS_FRAME_DEFLATE_LEVEL", "6"))
+
 # ---------------------------------------------------------------------------
 # Pricing Data
 # ---------------------------------------------------------------------------
@@ -82,6 +154,165 @@ FALLBACK_PRICING = {
     },
 }
 
+# ---------------------------------------------------------------------------
+# Request Coalescing
+# ---------------------------------------------------------------------------
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls onto one in-flight task.
+
+    A caller that arrives while a call with the same key is running awaits
+    that task instead of starting its own. The key is released as soon as
+    the task finishes, so this never serves results after the fact -- it
+    only collapses overlapping work (e.g. a burst of WebSocket reconnects).
+    Shared results must be treated as read-only by callers.
+    """
+
+    def __init__(self):
+        self._inflight: dict = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, fn, *args, **kwargs):
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+        else:
+            self.shared += 1
+        # Shield so one cancelled waiter does not cancel the shared work.
+        return await asyncio.shield(task)
+
+    def running(self, key) -> bool:
+        return key in self._inflight
+
+    def _forget(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._inflight)}
+
+
+inflight = SingleFlight()
+
+# ---------------------------------------------------------------------------
+# Upstream HTTP Clients
+# ---------------------------------------------------------------------------
+
+# Pool limits for request/response traffic (brain proxy, polling, pricing).
+HTTP_MAX_CONNECTIONS = int(os.environ.get("DASHBOARD_HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.environ.get("DASHBOARD_HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("DASHBOARD_HTTP_KEEPALIVE_EXPIRY", "30"))
+# Long-lived streams (the brain SSE bridge) get their own small pool so they
+# never hold request slots.
+HTTP_STREAM_CONNECTIONS = 2
+# HTTP/2 multiplexes brain requests over one connection; needs h2.
+HTTP2_ENABLED = h2 is not None and os.environ.get("DASHBOARD_HTTP2", "1") != "0"
+
+
+class HTTPPool:
+    """One shared ``httpx.AsyncClient`` plus counters for its connection pool."""
+
+    def __init__(self, name: str, timeout: httpx.Timeout, limits: httpx.Limits, http2: bool):
+        self.name = name
+        self.max_connections = limits.max_connections
+        self.requests = 0
+        self.opened = 0
+        self._seen = weakref.WeakSet()
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            event_hooks={"response": [self._on_response]},
+        )
+
+    def _connections(self) -> list:
+        pool = getattr(self.client._transport, "_pool", None)
+        return list(getattr(pool, "connections", []))
+
+    async def _on_response(self, response: httpx.Response):
+        self.requests += 1
+        for conn in self._connections():
+            if conn not in self._seen:
+                self._seen.add(conn)
+                self.opened += 1
+
+    def stats(self) -> dict:
+        conns = self._connections()
+        idle = sum(1 for c in conns if c.is_idle())
+        return {
+            "requests": self.requests,
+            "connections_opened": self.opened,
+            "connections": len(conns),
+            "active": len(conns) - idle,
+            "idle": idle,
+            "http2": sum(1 for c in conns if "HTTP/2" in c.info()),
+            "max_connections": self.max_connections,
+        }
+
+
+class HTTPClients:
+    """Shared upstream clients, opened in lifespan and closed on shutdown.
+
+    ``request`` carries request/response traffic with keep-alive and
+    (when h2 is installed) HTTP/2; ``stream`` holds long-lived streaming
+    responses with no read timeout.
+    """
+
+    def __init__(self):
+        self.pools: dict[str, HTTPPool] = {}
+
+    @property
+    def request(self) -> httpx.AsyncClient:
+        return self._pool("request").client
+
+    @property
+    def stream(self) -> httpx.AsyncClient:
+        return self._pool("stream").client
+
+    def _pool(self, name: str) -> HTTPPool:
+        pool = self.pools.get(name)
+        if pool is None:
+            if name == "stream":
+                pool = HTTPPool(
+                    name,
+                    httpx.Timeout(connect=10.0, read=None, write=10.0, pool=10.0),
+                    httpx.Limits(max_connections=HTTP_STREAM_CONNECTIONS, keepalive_expiry=HTTP_KEEPALIVE_EXPIRY),
+                    http2=False,
+                )
+            else:
+                pool = HTTPPool(
+                    name,
+                    httpx.Timeout(10.0),
+                    httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                    ),
+                    http2=HTTP2_ENABLED,
+                )
+            self.pools[name] = pool
+        return pool
+
+    async def close(self):
+        pools, self.pools = self.pools, {}
+        for pool in pools.values():
+            await pool.client.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "http2": HTTP2_ENABLED,
+            "keepalive_expiry_s": HTTP_KEEPALIVE_EXPIRY,
+            "pools": {name: pool.stats() for name, pool in self.pools.items()},
+        }
+
+
+http_clients = HTTPClients()
+
 # ---------------------------------------------------------------------------
 # Brain Configuration
 # ---------------------------------------------------------------------------
@@ -113,41 +344,257 @@ def load_brain_config() -> dict:
     return config
 
 
-async def brain_request(app, path: str, params: dict = None) -> dict | None:
-    """Make authenticated GET request to brain server. Returns None on any error."""
+# Upper bound on concurrent upstream requests issued by one poll_brain cycle.
+BRAIN_CONCURRENCY = int(os.environ.get("DASHBOARD_BRAIN_CONCURRENCY", "8"))
+
+# (path prefix, fresh TTL seconds); first match wins, longest prefixes first.
+BRAIN_CACHE_TTLS = (
+    ("/api/instances/", 10),
+    ("/api/instances", 15),
+    ("/api/events", 10),
+    ("/api/tasks", 30),
+    ("/api/sync-status", 30),
+    ("/api/brain-stats", 30),
+    ("/health", 30),
+    ("/api/projects", 120),
+    ("/api/briefs", 120),
+    ("/api/sessions", 120),
+    ("/api/agent-metrics", 60),
+)
+BRAIN_CACHE_DEFAULT_TTL = 15
+# Past its TTL an entry is served while one background refresh runs, for
+# up to this many extra seconds...
+BRAIN_CACHE_SWR = int(os.environ.get("DASHBOARD_BRAIN_CACHE_SWR", "300"))
+# ...and is served instead of an upstream failure for up to this long.
+BRAIN_CACHE_STALE_IF_ERROR = int(os.environ.get("DASHBOARD_BRAIN_CACHE_STALE_IF_ERROR", "3600"))
+BRAIN_CACHE_MAX_ENTRIES = 1024
+
+
+def brain_cache_ttl(path: str) -> int:
+    for prefix, ttl in BRAIN_CACHE_TTLS:
+        if path.startswith(prefix):
+            return ttl
+    return BRAIN_CACHE_DEFAULT_TTL
+
+
+class BrainCache:
+    """TTL cache of brain GET responses keyed by path and params.
+
+    Entries are the parsed JSON and are shared between callers, so they
+    must be treated as read-only. Only successful responses are stored.
+    """
+
+    def __init__(self, max_entries: int = BRAIN_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: dict[tuple, tuple] = {}  # key -> (data, stored_at)
+        self.hits = 0
+        self.stale = 0
+        self.stale_if_error = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.background: set[asyncio.Task] = set()
+
+    def get(self, key: tuple) -> tuple | None:
+        """Return (data, age_seconds) or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry[0], time.monotonic() - entry[1]
+
+    def put(self, key: tuple, data):
+        self.entries.pop(key, None)
+        if len(self.entries) >= self.max_entries:
+            # Insertion order: drop the least recently stored entry
+            del self.entries[next(iter(self.entries))]
+        self.entries[key] = (data, time.monotonic())
+
+    def invalidate(self, path: str):
+        for key in [k for k in self.entries if k[0] == path]:
+            del self.entries[key]
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "stale": self.stale,
+            "stale_if_error": self.stale_if_error,
+            "misses": self.misses,
+            "background_refreshes": self.refreshes,
+        }
+
+
+brain_cache = BrainCache()
+
+
+def set_age_header(response: Response | None, age: float):
+    """Set ``Age`` on a route's response, keeping the oldest of several reads."""
+    if response is None:
+        return
+    age = int(age)
+    current = response.headers.get("Age")
+    if current is None or int(current) < age:
+        response.headers["Age"] = str(age)
+
+
+# Consecutive brain failures that open the circuit breaker.
+BRAIN_BREAKER_THRESHOLD = int(os.environ.get("DASHBOARD_BRAIN_BREAKER_THRESHOLD", "5"))
+# Seconds the breaker stays open before letting one probe through.
+BRAIN_BREAKER_COOLDOWN = float(os.environ.get("DASHBOARD_BRAIN_BREAKER_COOLDOWN", "30"))
+# Per-call deadlines, well under the client's 10s timeout.
+BRAIN_GET_DEADLINE = float(os.environ.get("DASHBOARD_BRAIN_GET_DEADLINE", "3"))
+BRAIN_PUT_DEADLINE = float(os.environ.get("DASHBOARD_BRAIN_PUT_DEADLINE", "5"))
+
+
+class CircuitBreaker:
+    """Fails brain calls fast while the brain is down.
+
+    ``closed``: calls go through; ``threshold`` consecutive failures
+    (errors, timeouts, 5xx) open the breaker. ``open``: calls are
+    rejected without touching the network until ``cooldown`` has
+    passed. ``half_open``: one probe call is let through; success
+    closes the breaker, failure re-opens it for another cooldown.
+    """
+
+    def __init__(self, threshold: int = BRAIN_BREAKER_THRESHOLD, cooldown: float = BRAIN_BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.rejected = 0
+        self.opens = 0
+        self.last_error: str | None = None
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown:
+            self.state = "half_open"
+        if self.state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self):
+        """Forget an in-flight probe that never completed (cancelled)."""
+        self.probing = False
+
+    def record_success(self):
+        if self.state != "closed":
+            logger.info("Brain circuit breaker closed")
+        self.state = "closed"
+        self.failures = 0
+        self.probing = False
+
+    def record_failure(self, error: str):
+        self.failures += 1
+        self.last_error = error
+        self.probing = False
+        if self.state == "half_open" or (self.state == "closed" and self.failures >= self.threshold):
+            if self.state == "closed":
+                logger.warning("Brain circuit breaker opened after %d failures: %s", self.failures, error)
+                self.opens += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        retry_in = None
+        if self.state == "open":
+            retry_in = round(max(self.opened_at + self.cooldown - time.monotonic(), 0.0), 1)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "threshold": self.threshold,
+            "cooldown_s": self.cooldown,
+            "retry_in_s": retry_in,
+            "opens": self.opens,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+        }
+
+
+brain_breaker = CircuitBreaker()
+
+
+async def brain_request(
+    app, path: str, params: dict = None, response: Response = None, refresh: bool = False,
+    raw: bool = False,
+):
+    """Make authenticated GET request to brain server. Returns None on any error.
+
+    Responses are cached per path and params (``BRAIN_CACHE_TTLS``):
+    fresh entries are returned without a network call; entries past
+    their TTL are returned immediately while one background refresh
+    runs (stale-while-revalidate); and a failed fetch falls back to the
+    last good entry (stale-if-error). Cached answers set ``Age`` on
+    ``response`` when one is passed. ``refresh=True`` always goes
+    upstream and re-seeds the cache (used by ``poll_brain``).
+
+    Concurrent requests for the same path and params share one upstream call.
+
+    ``raw=True`` returns the undecoded upstream body as a ``RawBrainBody``
+    (cached separately) for routes that pass it through unchanged.
+    """
     # Validate path to prevent traversal attacks
     if not path.startswith("/") or ".." in path:
         raise HTTPException(status_code=400, detail="Invalid brain request path")
 
-    brain_config = app.state.brain_config
-    if not brain_config.get("url"):
-        return None
+    if not refresh:
+        brain_scheduler.note_rest(path)
+    key = (path, tuple(sorted((params or {}).items())))
+    if raw:
+        key += ("raw",)
+    cached = None if refresh else brain_cache.get(key)
+    if cached is not None:
+        data, age = cached
+        ttl = brain_cache_ttl(path)
+        if age < ttl:
+            brain_cache.hits += 1
+            set_age_header(response, age)
+            return data
+        if age < ttl + BRAIN_CACHE_SWR:
+            brain_cache.stale += 1
+            if not inflight.running(("brain", key)):
+                brain_cache.refreshes += 1
+                task = asyncio.ensure_future(_brain_fetch(app, key, path, params, raw))
+                brain_cache.background.add(task)
+                task.add_done_callback(brain_cache.background.discard)
+            set_age_header(response, age)
+            return data
 
-    if not app.state.brain_client:
-        return None
+    brain_cache.misses += 1
+    data = await _brain_fetch(app, key, path, params, raw)
+    if data is None:
+        stale = brain_cache.get(key)
+        if stale is not None and stale[1] < BRAIN_CACHE_STALE_IF_ERROR:
+            brain_cache.stale_if_error += 1
+            set_age_header(response, stale[1])
+            return stale[0]
+    return data
 
-    try:
-        url = f"{brain_config['url'].rstrip('/')}{path}"
-        headers = {}
-        if brain_config.get("api_key"):
-            headers["Authorization"] = f"Bearer {brain_config['api_key']}"
 
-        resp = await app.state.brain_client.get(url, params=params, headers=headers)
-        if resp.status_code == 200:
-            return resp.json()
-        else:
-            logger.warning("Brain request %s returned %d", path, resp.status_code)
-            return None
-    except Exception as exc:
-        logger.warning("Brain request %s failed: %s", path, exc)
-        return None
+async def _brain_fetch(app, key: tuple, path: str, params: dict = None, raw: bool = False):
+    data = await inflight.do(("brain", key), _brain_get, app, path, params, raw)
+    if data is not None:
+        brain_cache.put(key, data)
+    return data
+
+
+async def _brain_get(app, path: str, params: dict = None, raw: bool = False):
+    return await _brain_call(app, "GET", path, BRAIN_GET_DEADLINE, raw=raw, params=params)
 
 
 async def brain_put(app, path: str, body: dict) -> dict | None:
     """Make authenticated PUT request to brain server. Returns None on any error."""
     if not path.startswith("/") or ".." in path:
         raise HTTPException(status_code=400, detail="Invalid brain request path")
+    return await _brain_call(app, "PUT", path, BRAIN_PUT_DEADLINE, json=body)
+
 
+async def _brain_call(app, method: str, path: str, deadline: float, raw: bool = False, **kwargs):
+    """One brain HTTP call under ``brain_breaker`` and a per-call deadline."""
     brain_config = app.state.brain_config
     if not brain_config.get("url"):
         return None
@@ -155,22 +602,219 @@ async def brain_put(app, path: str, body: dict) -> dict | None:
     if not app.state.brain_client:
         return None
 
+    if not brain_breaker.allow():
+        return None
+
     try:
         url = f"{brain_config['url'].rstrip('/')}{path}"
-        headers = {"Content-Type": "application/json"}
+        headers = {}
         if brain_config.get("api_key"):
             headers["Authorization"] = f"Bearer {brain_config['api_key']}"
 
-        resp = await app.state.brain_client.put(url, json=body, headers=headers)
-        if resp.status_code == 200:
-            return resp.json()
-        else:
-            logger.warning("Brain PUT %s returned %d", path, resp.status_code)
-            return None
+        async with asyncio.timeout(deadline):
+            if method == "PUT":
+                resp = await app.state.brain_client.put(url, headers=headers, **kwargs)
+            elif raw:
+                # Keep the wire bytes: no decompression, no JSON decode
+                client = app.state.brain_client
+                headers["Accept-Encoding"] = "gzip"
+                resp = await client.send(client.build_request("GET", url, headers=headers, **kwargs), stream=True)
+                try:
+                    body = b"".join([chunk async for chunk in resp.aiter_raw()])
+                finally:
+                    await resp.aclose()
+            else:
+                resp = await app.state.brain_client.get(url, headers=headers, **kwargs)
+        if resp.status_code == 200 and not raw:
+            # A non-JSON or truncated body counts as a failure like any other
+            data = resp.json()
+    except TimeoutError:
+        brain_breaker.record_failure(f"{method} {path} exceeded {deadline:g}s deadline")
+        logger.warning("Brain %s %s exceeded %gs deadline", method, path, deadline)
+        return None
+    except asyncio.CancelledError:
+        brain_breaker.release()
+        raise
     except Exception as exc:
-        logger.warning("Brain PUT %s failed: %s", path, exc)
+        brain_breaker.record_failure(f"{method} {path}: {exc}")
+        logger.warning("Brain %s %s failed: %s", method, path, exc)
         return None
 
+    if resp.status_code >= 500:
+        brain_breaker.record_failure(f"{method} {path} returned {resp.status_code}")
+    else:
+        brain_breaker.record_success()
+    if resp.status_code == 200:
+        if raw:
+            return RawBrainBody(
+                body,
+                resp.headers.get("content-type", "application/json"),
+                resp.headers.get("content-encoding"),
+                resp.headers.get("etag"),
+            )
+        return data
+    logger.warning("Brain %s %s returned %d", method, path, resp.status_code)
+    return None
+
+
+class RawBrainBody:
+    """An upstream brain response body kept exactly as received."""
+
+    __slots__ = ("body", "content_type", "encoding", "etag")
+
+    def __init__(self, body: bytes, content_type: str, encoding: str | None, etag: str | None):
+        self.body = body
+        self.content_type = content_type
+        self.encoding = encoding
+        self.etag = etag
+
+
+def passthrough_response(request: Request, raw: RawBrainBody, response: Response) -> Response:
+    """Send a raw brain body as-is, with its type, encoding, ETag and Age.
+
+    The body is only decompressed for clients that do not accept its
+    encoding (per ``parse_accept_encoding``); that representation gets
+    an ``-identity`` suffixed ETag. A matching ``If-None-Match`` gets a
+    bodyless 304.
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    if "age" in response.headers:
+        headers["Age"] = response.headers["age"]
+    decode = None
+    if raw.encoding:
+        accepted = parse_accept_encoding(request.headers.get("accept-encoding", ""))
+        if accepted.get(raw.encoding, accepted.get("*", 0)) > 0:
+            headers["Content-Encoding"] = raw.encoding
+        elif raw.encoding == "gzip":
+            decode = gzip.decompress
+        elif raw.encoding == "deflate":
+            decode = zlib.decompress
+        elif raw.encoding == "br" and brotli is not None:
+            decode = brotli.decompress
+        else:
+            headers["Content-Encoding"] = raw.encoding
+    if raw.etag:
+        etag = raw.etag if decode is None else etag_for_encoding(raw.etag, "identity")
+        headers["ETag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+    body = raw.body if decode is None else decode(raw.body)
+    return Response(content=body, media_type=raw.content_type, headers=headers)
+
+
+class BrainSnapshot:
+    """Last brain payloads fetched by ``poll_brain``, with their fetch times.
+
+    WebSocket bootstrap reads from here instead of calling the brain, so
+    connect latency does not depend on brain latency. Sections are only
+    replaced by successful fetches; a brain outage leaves the last good
+    data in place and its age keeps growing. The sync section is the
+    exception: it carries an online/offline status, so poll_brain
+    stores offline results too.
+    """
+
+    def __init__(self):
+        self.sections: dict[str, dict] = {}
+        self.fetched_at: dict[str, float] = {}
+
+    def update(self, section: str, data, relay: bool = True):
+        if data:
+            self.sections[section] = data
+            self.fetched_at[section] = time.monotonic()
+            if relay:
+                fabric.publish("snapshot", section=section, data=data)
+
+    def get(self, section: str):
+        return self.sections.get(section)
+
+    def age(self, section: str) -> float | None:
+        fetched = self.fetched_at.get(section)
+        return round(time.monotonic() - fetched, 1) if fetched is not None else None
+
+    def ages(self, *sections: str) -> dict:
+        return {name: self.age(name) for name in sections if name in self.fetched_at}
+
+
+# Latest brain events kept for the brain_events topic and bootstrap.
+BRAIN_EVENTS_WINDOW = 50
+# Page size for incremental (since-cursor) gap-fill fetches.
+BRAIN_EVENTS_FETCH_LIMIT = 200
+
+
+class BrainEventLog:
+    """Merged view of brain events from the SSE bridge and gap-fill polls.
+
+    Events are deduplicated by ``id``; ``merge`` returns only the ones
+    not seen before (events without an id are skipped here, and the SSE
+    bridge forwards them unmerged). ``since`` is the ``created_at`` high-water mark
+    used for incremental fetches (the brain's filter is inclusive, so
+    the boundary event comes back and is dropped as a duplicate).
+    ``poll_brain`` only fetches while the SSE bridge is disconnected,
+    plus one catch-up fetch after each reconnect.
+    """
+
+    def __init__(self, window: int = BRAIN_EVENTS_WINDOW):
+        self.window = window
+        self.events: dict[int, dict] = {}  # id -> event, latest window only
+        self.seen: deque = deque(maxlen=window * 20)
+        self._seen_ids: set = set()
+        self.since: str | None = None
+        self.meta: dict = {}
+        self.seeded = False  # first poll fetch done
+        self.sse_connected = False
+        self.catch_up = True
+        self.from_sse = 0
+        self.from_poll = 0
+        self.duplicates = 0
+
+    def merge(self, events: list, source: str) -> list:
+        """Record ``events``; return the new ones, oldest first."""
+        new = []
+        for event in events:
+            if not isinstance(event, dict) or event.get("id") is None:
+                continue
+            event_id = event["id"]
+            if event_id in self._seen_ids:
+                self.duplicates += 1
+                continue
+            if len(self.seen) == self.seen.maxlen:
+                self._seen_ids.discard(self.seen[0])
+            self.seen.append(event_id)
+            self._seen_ids.add(event_id)
+            new.append(event)
+            created = event.get("created_at") or event.get("timestamp")
+            if created and (self.since is None or created > self.since):
+                self.since = created
+        new.sort(key=lambda e: e["id"])
+        for event in new:
+            self.events[event["id"]] = event
+        if len(self.events) > self.window:
+            for event_id in sorted(self.events)[:len(self.events) - self.window]:
+                del self.events[event_id]
+        if source == "sse":
+            self.from_sse += len(new)
+        else:
+            self.from_poll += len(new)
+        return new
+
+    def payload(self) -> dict:
+        """The brain_events topic payload: latest events, newest first."""
+        events = [self.events[i] for i in sorted(self.events, reverse=True)]
+        return {**self.meta, "events": events}
+
+    def stats(self) -> dict:
+        return {
+            "sse_connected": self.sse_connected,
+            "since": self.since,
+            "window": len(self.events),
+            "from_sse": self.from_sse,
+            "from_poll": self.from_poll,
+            "duplicates": self.duplicates,
+        }
+
+
+brain_event_log = BrainEventLog()
+
 
 # ---------------------------------------------------------------------------
 # Agent Leveling System
@@ -197,27 +841,16 @@ EVOLUTION_TIERS = {
 }
 
 
-def get_level(invocations: int) -> dict:
-    """Compute level info from invocation count.
+_LEVEL_STARTS = [threshold for threshold, _name, _tier in LEVEL_THRESHOLDS]
 
-    Returns dict with keys: name, tier, evolution, next_at, progress.
-    """
-    level_name = "Trainee"
-    level_tier = 0
-    current_threshold = 0
-
-    for threshold, name, tier in LEVEL_THRESHOLDS:
-        if invocations >= threshold:
-            level_name = name
-            level_tier = tier
-            current_threshold = threshold
-
-    # Find next threshold
-    next_threshold = None
-    for threshold, _name, _tier in LEVEL_THRESHOLDS:
-        if threshold > invocations:
-            next_threshold = threshold
-            break
+
+@functools.lru_cache(maxsize=4096)
+def _level_info(invocations: int) -> tuple:
+    # bisect_right finds the first threshold above ``invocations``; the one
+    # before it is the current level (clamped to Trainee for negatives).
+    idx = bisect.bisect_right(_LEVEL_STARTS, invocations)
+    current_threshold, level_name, level_tier = LEVEL_THRESHOLDS[max(idx - 1, 0)]
+    next_threshold = _LEVEL_STARTS[idx] if idx < len(_LEVEL_STARTS) else None
 
     # Progress toward next level
     if next_threshold is not None:
@@ -227,13 +860,27 @@ def get_level(invocations: int) -> dict:
         progress = 1.0
 
     evolution = EVOLUTION_TIERS.get(level_tier, "In-Training")
+    return (
+        level_name,
+        level_tier,
+        evolution,
+        next_threshold if next_threshold else current_threshold,
+        round(progress, 3),
+    )
 
+
+def get_level(invocations: int) -> dict:
+    """Compute level info from invocation count.
+
+    Returns dict with keys: name, tier, evolution, next_at, progress.
+    """
+    name, tier, evolution, next_at, progress = _level_info(invocations)
     return {
-        "name": level_name,
-        "tier": level_tier,
+        "name": name,
+        "tier": tier,
         "evolution": evolution,
-        "next_at": next_threshold if next_threshold else current_threshold,
-        "progress": round(progress, 3),
+        "next_at": next_at,
+        "progress": progress,
     }
 
 
@@ -272,6 +919,80 @@ def compute_rpg_stats(agent_data: dict, all_agents: dict) -> dict:
     return {"STR": str_val, "INT": int_val, "SPD": spd_val, "VIT": vit_val}
 
 
+# Below this many agents the plain-Python pass beats NumPy's setup cost.
+RPG_NUMPY_MIN_AGENTS = 64
+_RPG_CACHE_SIZE = 8
+_rpg_cache: dict = {}
+
+
+def _rpg_batch_python(outputs, durations, inputs, cache_reads, cache_creates, success_rates) -> list:
+    max_output = max(outputs, default=1) or 1
+    max_duration = max(durations, default=1) or 1
+    stats = []
+    for out, dur, inp, cr, cc, sr in zip(
+        outputs, durations, inputs, cache_reads, cache_creates, success_rates
+    ):
+        total_cache_input = inp + cr + cc
+        stats.append({
+            "STR": round(out / max_output * 100),
+            "INT": round(cr / total_cache_input * 100) if total_cache_input > 0 else 0,
+            "SPD": round(100 - min(dur / max_duration * 100, 100)),
+            "VIT": round(sr * 100),
+        })
+    return stats
+
+
+def _rpg_batch_numpy(outputs, durations, inputs, cache_reads, cache_creates, success_rates) -> list:
+    out = np.asarray(outputs, dtype=np.float64)
+    dur = np.asarray(durations, dtype=np.float64)
+    cr = np.asarray(cache_reads, dtype=np.float64)
+    total_cache_input = np.asarray(inputs, dtype=np.float64) + cr + np.asarray(cache_creates, dtype=np.float64)
+
+    max_output = out.max() or 1
+    max_duration = dur.max() or 1
+    str_vals = np.round(out / max_output * 100)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        int_vals = np.where(total_cache_input > 0, np.round(cr / total_cache_input * 100), 0)
+    spd_vals = np.round(100 - np.minimum(dur / max_duration * 100, 100))
+    vit_vals = np.round(np.asarray(success_rates, dtype=np.float64) * 100)
+
+    return [
+        {"STR": int(s), "INT": int(i), "SPD": int(p), "VIT": int(v)}
+        for s, i, p, v in zip(str_vals.tolist(), int_vals.tolist(), spd_vals.tolist(), vit_vals.tolist())
+    ]
+
+
+def compute_all_rpg_stats(agents: dict) -> dict:
+    """Compute RPG stats for every agent in one pass.
+
+    Equivalent to calling ``compute_rpg_stats(data, agents)`` per agent,
+    but the cross-agent maxima are computed once (O(n) instead of O(n^2))
+    and large batches are vectorized with NumPy when it is installed.
+    Results are memoized on the input columns, so ranges whose inputs are
+    identical (e.g. ``today`` and ``week`` early in the week) share work.
+    """
+    names = list(agents)
+    columns = (
+        tuple(agents[n].get("total_output_tokens", 0) for n in names),
+        tuple(agents[n].get("avg_duration_seconds", 0) for n in names),
+        tuple(agents[n].get("total_input_tokens", 0) for n in names),
+        tuple(agents[n].get("total_cache_read_tokens", 0) for n in names),
+        tuple(agents[n].get("total_cache_create_tokens", 0) for n in names),
+        tuple(agents[n].get("success_rate", 1.0) for n in names),
+    )
+    key = (tuple(names), columns)
+    stats = _rpg_cache.get(key)
+    if stats is None:
+        if np is not None and len(names) >= RPG_NUMPY_MIN_AGENTS:
+            stats = _rpg_batch_numpy(*columns)
+        else:
+            stats = _rpg_batch_python(*columns)
+        if len(_rpg_cache) >= _RPG_CACHE_SIZE:
+            _rpg_cache.pop(next(iter(_rpg_cache)))
+        _rpg_cache[key] = stats
+    return {name: dict(stat) for name, stat in zip(names, stats)}
+
+
 # ---------------------------------------------------------------------------
 # Budget Config
 # ---------------------------------------------------------------------------
@@ -306,17 +1027,14 @@ async def fetch_pricing() -> dict:
         "cache_creation_input_token_cost",
     )
     try:
-        loop = asyncio.get_running_loop()
-
-        def _fetch():
-            req = urllib.request.Request(
-                LITELLM_URL,
-                headers={"User-Agent": "igris-ai-dashboard/1.0"},
-            )
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-
-        data = await loop.run_in_executor(None, _fetch)
+        resp = await http_clients.request.get(
+            LITELLM_URL,
+            headers={"User-Agent": "igris-ai-dashboard/1.0"},
+            timeout=15.0,
+            follow_redirects=True,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         pricing = {}
         for key, entry in data.items():
@@ -344,41 +1062,1054 @@ async def fetch_pricing() -> dict:
 # ---------------------------------------------------------------------------
 
 
-class ConnectionManager:
-    """Manages active WebSocket connections and broadcasts events."""
+WS_SUBPROTOCOLS = {
+    "arena.json": "json",
+    "arena.json.deflate": "json.deflate",
+}
+if msgpack is not None:
+    WS_SUBPROTOCOLS["arena.msgpack"] = "msgpack"
+
+# Every message type the server pushes; clients subscribe by type.
+WS_TOPICS = frozenset({
+    "state", "event", "skill_event",
+    "brain_state", "brain_health", "brain_instances", "brain_projects",
+    "brain_briefs", "brain_sessions", "brain_events", "brain_tasks",
+    "brain_event", "instance_agent_event", "brain_knowledge",
+    "sync_status", "team_status",
+})
+
+# High-rate per-event topics that batching clients receive as events_batch.
+WS_COALESCE_TOPICS = frozenset({"event", "skill_event", "brain_event"})
+
+# Subscription filter name -> payload keys that carry it.
+WS_FILTER_KEYS = {
+    "project": ("project_slug", "project"),
+    "instance_id": ("instance_id",),
+    "agent": ("agent",),
+}
+
+
+def parse_subscription(topics, filters) -> tuple[set | None, dict]:
+    """Normalize a subscription request into (topics, filters).
+
+    ``topics`` may be a list or a comma-separated string; unknown topics
+    are ignored and an empty/absent value means "all topics". Filters
+    keep only the known names with non-empty string values.
+    """
+    if isinstance(topics, str):
+        topics = [t for t in topics.split(",") if t]
+    wanted = {t for t in (topics or []) if t in WS_TOPICS} or None
+    clean = {}
+    for name in WS_FILTER_KEYS:
+        value = (filters or {}).get(name)
+        if isinstance(value, str) and value:
+            clean[name] = value
+    return wanted, clean
+
+
+def message_matches(message: dict, filters: dict) -> bool:
+    """True when a message passes a client's project/instance/agent filters.
+
+    Filters only apply to messages about a single entity; payloads that
+    do not carry the filtered field (e.g. full instance lists) pass.
+    """
+    if not filters:
+        return True
+    data = message.get("data")
+    if not isinstance(data, dict):
+        return True
+    for name, value in filters.items():
+        for key in WS_FILTER_KEYS[name]:
+            field = data.get(key)
+            if field:
+                if field != value:
+                    return False
+                break
+    return True
+
+
+# Topics published as versioned lists; value is the list key in the payload.
+DELTA_TOPICS = {
+    "brain_instances": "instances",
+    "brain_tasks": "tasks",
+    "brain_events": "events",
+}
+
+
+def diff_items(previous: dict, items: list) -> dict | None:
+    """Diff a list of id-keyed dicts against the previous ``{id: item}`` map.
+
+    Returns ``{"added": [...], "changed": [...], "removed": [ids]}`` or
+    None when an item has no ``id`` (the caller then sends a snapshot).
+    """
+    added, changed, seen = [], [], set()
+    for item in items:
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is None:
+            return None
+        seen.add(item_id)
+        old = previous.get(item_id)
+        if old is None:
+            added.append(item)
+        elif old != item:
+            changed.append(item)
+    removed = [item_id for item_id in previous if item_id not in seen]
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+class TopicVersion:
+    """Last published version of one list topic (brain_instances, ...)."""
+
+    __slots__ = ("version", "items", "data")
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.version = 0
+        self.items: dict = {}
+        self.data: dict | None = None
+
+    def publish(self, data: dict, list_key: str) -> tuple[int, dict | None] | None:
+        """Record a new payload; return (base_version, delta) or None if unchanged.
+
+        ``delta`` is None when the payload cannot be diffed by id.
+        """
+        items = data.get(list_key)
+        if not isinstance(items, list):
+            items = []
+        if data == self.data:
+            return None
+        delta = diff_items(self.items, items)
+        if delta is not None:
+            meta = {k: v for k, v in data.items() if k != list_key}
+            if self.data is not None and meta != {k: v for k, v in self.data.items() if k != list_key}:
+                delta["meta"] = meta
+        base_version = self.version
+        self.version += 1
+        self.data = data
+        self.items = {
+            item["id"]: item for item in items
+            if isinstance(item, dict) and item.get("id") is not None
+        }
+        return base_version, delta
+
+
+frame_stats = {
+    "json": {"frames": 0, "bytes": 0},
+    "json.deflate": {"frames": 0, "bytes_in": 0, "bytes_out": 0},
+    "msgpack": {"frames": 0, "bytes": 0},
+}
+
+
+def encode_frame(data: dict, encoding: str = "json") -> str | bytes:
+    """Encode one WebSocket message for a wire format.
+
+    ``json`` matches Starlette's ``send_json`` text. ``json.deflate`` is
+    the same text zlib-compressed into a binary frame, for clients that
+    negotiate the ``arena.json.deflate`` subprotocol. ``msgpack`` packs
+    the same message schema into a binary frame.
+    """
+    if encoding == "msgpack":
+        packed = msgpack.packb(data, use_bin_type=True)
+        frame_stats["msgpack"]["frames"] += 1
+        frame_stats["msgpack"]["bytes"] += len(packed)
+        return packed
+    text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    if encoding == "json.deflate":
+        raw = text.encode("utf-8")
+        packed = zlib.compress(raw, WS_FRAME_DEFLATE_LEVEL)
+        stats = frame_stats["json.deflate"]
+        stats["frames"] += 1
+        stats["bytes_in"] += len(raw)
+        stats["bytes_out"] += len(packed)
+        return packed
+    frame_stats["json"]["frames"] += 1
+    frame_stats["json"]["bytes"] += len(text)
+    return text
+
+
+class Frame:
+    """A message queued for one or more clients, encoded at most once per format.
+
+    The first sender that needs a format encodes it; every other client
+    using the same format reuses those bytes, so a broadcast to N clients
+    costs one serialization (and one compression) instead of N.
+    """
+
+    __slots__ = ("data", "_encoded")
+
+    def __init__(self, data: dict):
+        self.data = data
+        self._encoded: dict = {}
+
+    def encode(self, encoding: str) -> str | bytes:
+        payload = self._encoded.get(encoding)
+        if payload is None:
+            payload = encode_frame(self.data, encoding)
+            self._encoded[encoding] = payload
+        return payload
+
+
+class ClientConnection:
+    """One WebSocket client with a bounded outbound queue and its own sender task.
+
+    The sender drains the queue in order, so a slow socket only ever
+    delays its own frames. Each send is bounded by ``WS_SEND_TIMEOUT``;
+    a send that times out or fails ends the sender and the client is
+    dropped by the manager.
+    """
+
+    def __init__(self, websocket: WebSocket, queue_size: int, encoding: str = "json"):
+        self.websocket = websocket
+        self.encoding = encoding
+        self.topics: set | None = None  # None = every topic
+        self.filters: dict = {}
+        self.deltas = False  # opted in to *_delta frames for DELTA_TOPICS
+        self.topic_version: dict[str, int] = {}
+        self.resumed = False
+        self.batch = False  # opted in to events_batch frames
+        self.max_fps = 0.0  # 0 = no per-connection frame-rate cap
+        self.pending: list = []  # [(seq, topic, data)] awaiting flush, seq order
+        self.flush_handle: asyncio.TimerHandle | None = None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.sender: asyncio.Task | None = None
+        self.dropped = 0
+
+    def set_batching(self, batch, max_fps=None):
+        self.batch = bool(batch)
+        try:
+            self.max_fps = max(float(max_fps or 0), 0.0)
+        except (TypeError, ValueError):
+            self.max_fps = 0.0
+
+    def wants(self, topic: str) -> bool:
+        return self.topics is None or topic in self.topics
+
+    def subscribe(self, topics, filters=None):
+        wanted, clean = parse_subscription(topics, filters)
+        if wanted is None:
+            self.topics = None
+        elif self.topics is not None:
+            self.topics |= wanted
+        else:
+            self.topics = wanted
+        if filters is not None:
+            self.filters = clean
+
+    def unsubscribe(self, topics):
+        wanted, _ = parse_subscription(topics, None)
+        if wanted is None:
+            return
+        current = set(WS_TOPICS) if self.topics is None else self.topics
+        self.topics = current - wanted
+
+    def enqueue(self, frame: Frame) -> bool:
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def drop_oldest(self):
+        try:
+            self.queue.get_nowait()
+            self.dropped += 1
+        except asyncio.QueueEmpty:
+            return
+        # A dropped frame may have been a delta; resync with snapshots.
+        self.topic_version.clear()
+
+    async def run_sender(self):
+        loop = asyncio.get_running_loop()
+        last_sent = float("-inf")
+        while True:
+            frame = await self.queue.get()
+            if self.max_fps:
+                # Per-connection frame cap: frames wait in the queue, where
+                # the overflow policy applies if the client keeps falling behind
+                delay = last_sent + 1 / self.max_fps - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            payload = frame.encode(self.encoding)
+            async with asyncio.timeout(WS_SEND_TIMEOUT):
+                if isinstance(payload, bytes):
+                    await self.websocket.send_bytes(payload)
+                else:
+                    await self.websocket.send_text(payload)
+            last_sent = loop.time()
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+
+class ConnectionManager:
+    """Manages active WebSocket connections and broadcasts events.
+
+    Each client carries a topic subscription (message types, default all)
+    plus optional project/instance_id/agent filters, set from the
+    ``?topics=&project=`` query on connect or ``subscribe`` messages.
+    List topics in ``DELTA_TOPICS`` go through ``publish_state``, which
+    sends diffs to clients that opt in with ``deltas``.
+
+    Every broadcast frame carries a global ``seq`` and is kept in a
+    bounded replay ring. A client reconnecting with
+    ``?last_seq=N&epoch=E`` gets only the frames it missed; if the epoch
+    changed (server restart) or N fell out of the ring it gets a full
+    bootstrap instead.
+
+    Clients that opt in with ``?batch=1`` receive event/skill_event/
+    brain_event bursts as ``events_batch`` frames per coalescing window
+    instead of one frame per event. Buffered events are flushed before
+    any later-seq frame reaches the client, so ``last_seq`` never skips
+    them. ``?max_fps=N`` caps the frames sent to one connection per
+    second (all topics) and widens its coalescing window to 1/N.
+
+    ``broadcast`` never awaits a socket: it wraps the message in a single
+    ``Frame`` and enqueues it onto each client's bounded queue, so its
+    latency is independent of the slowest client and the payload is
+    serialized once per wire format, not once per client. When a queue
+    is full the overflow policy decides: ``drop_oldest`` discards that
+    client's oldest pending frame, while ``disconnect`` evicts the client
+    (close code 1013, try again later).
+    """
+
+    def __init__(self, queue_size: int = None, overflow_policy: str = None,
+                 replay_size: int = None, coalesce_ms: int = None):
+        self.queue_size = queue_size or WS_SEND_QUEUE_SIZE
+        self.overflow_policy = overflow_policy or WS_OVERFLOW_POLICY
+        self.clients: dict[WebSocket, ClientConnection] = {}
+        self.evicted = 0
+        self.broadcasts = 0
+        self.versions: dict[str, TopicVersion] = {}
+        self.deltas_sent = 0
+        self.epoch = os.urandom(6).hex()
+        self.seq = 0
+        # (seq, topic, data, frame); data is kept for per-client filtering
+        self.replay: deque = deque(maxlen=replay_size or WS_REPLAY_SIZE)
+        self.resumes = 0
+        self.bootstraps = 0
+        self.coalesce_ms = WS_COALESCE_MS if coalesce_ms is None else coalesce_ms
+        self._batch_frames: dict[tuple, Frame] = {}
+        self.batches_sent = 0
+        self.events_coalesced = 0
+        self.listeners: dict[str, list] = {}
+
+    @property
+    def active_connections(self) -> list[WebSocket]:
+        return list(self.clients)
+
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
+        """Accept a client, apply its query options and start its sender.
+
+        Returns the ClientConnection; ``client.resumed`` is True when
+        missed frames were replayed and no bootstrap is needed.
+        """
+        requested = websocket.scope.get("subprotocols") or []
+        subprotocol = next((p for p in requested if p in WS_SUBPROTOCOLS), None)
+        await websocket.accept(subprotocol=subprotocol)
+        encoding = WS_SUBPROTOCOLS[subprotocol] if subprotocol else "json"
+        client = ClientConnection(websocket, self.queue_size, encoding)
+        query = parse_qs(websocket.scope.get("query_string", b"").decode("latin-1"))
+        if query:
+            client.topics, client.filters = parse_subscription(
+                query.get("topics", [""])[0],
+                {name: query[name][0] for name in WS_FILTER_KEYS if name in query},
+            )
+            client.deltas = query.get("deltas", ["0"])[0] in ("1", "true")
+            client.set_batching(
+                query.get("batch", ["0"])[0] in ("1", "true"),
+                query.get("max_fps", [None])[0],
+            )
+        client.sender = asyncio.create_task(self._sender(client))
+        self.clients[websocket] = client
+        # No await between registering and replaying, so replayed frames
+        # are queued ahead of any new broadcast.
+        self._start_session(client, query)
         logger.info(
-            "WebSocket client connected (total: %d)", len(self.active_connections)
+            "WebSocket client connected (total: %d, resumed: %s)",
+            len(self.clients), client.resumed,
         )
+        return client
+
+    def _start_session(self, client: ClientConnection, query: dict):
+        last_seq = query.get("last_seq", [""])[0]
+        epoch = query.get("epoch", [""])[0]
+        missed = None
+        if last_seq.isdigit() and epoch == self.epoch:
+            missed = self._missed_since(int(last_seq), client)
+        client.resumed = missed is not None
+        if client.resumed:
+            self.resumes += 1
+        else:
+            self.bootstraps += 1
+        self._deliver(client, Frame({
+            "type": "hello",
+            "data": {"epoch": self.epoch, "seq": self.seq, "resumed": client.resumed},
+        }))
+        for frame in missed or ():
+            self._deliver(client, frame)
+
+    def _missed_since(self, last_seq: int, client: ClientConnection) -> list | None:
+        """Frames after last_seq that the client subscribes to, or None.
+
+        None means the gap cannot be replayed (last_seq is ahead of us,
+        older than the ring, or more frames than the client queue holds).
+        List topics only replay their latest snapshot.
+        """
+        if last_seq > self.seq:
+            return None
+        if last_seq < self.seq and (not self.replay or self.replay[0][0] > last_seq + 1):
+            return None
+        missed, latest = [], {}
+        for seq, topic, data, frame in self.replay:
+            if seq <= last_seq or not client.wants(topic):
+                continue
+            if topic in DELTA_TOPICS:
+                latest[topic] = len(missed)
+            elif not message_matches(data, client.filters):
+                continue
+            missed.append((topic, frame))
+        frames = [
+            frame for i, (topic, frame) in enumerate(missed)
+            if topic not in DELTA_TOPICS or latest[topic] == i
+        ]
+        if len(frames) >= client.queue.maxsize:
+            return None
+        for topic in latest:
+            client.topic_version[topic] = self.versions[topic].version
+        return frames
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        client = self.clients.pop(websocket, None)
+        if client and client.flush_handle:
+            client.flush_handle.cancel()
+        if client and client.sender and not client.sender.done():
+            client.sender.cancel()
         logger.info(
-            "WebSocket client disconnected (total: %d)", len(self.active_connections)
+            "WebSocket client disconnected (total: %d)", len(self.clients)
         )
 
-    async def broadcast(self, data: dict):
-        """Send data to all connected clients, removing dead connections."""
-        disconnected = []
-        for conn in self.active_connections:
-            try:
-                await conn.send_json(data)
-            except Exception:
-                disconnected.append(conn)
-        for conn in disconnected:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+    async def _sender(self, client: ClientConnection):
+        try:
+            await client.run_sender()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.info("Dropping WebSocket client after failed send: %s", exc or type(exc).__name__)
+            self.clients.pop(client.websocket, None)
+            await self._close(client.websocket)
+
+    async def _close(self, websocket: WebSocket, code: int = 1011):
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    def _deliver(self, client: ClientConnection, frame: Frame):
+        if client.enqueue(frame):
+            return
+        if self.overflow_policy == "disconnect":
+            logger.warning("Evicting slow WebSocket client (queue full)")
+            self.evicted += 1
+            self.disconnect(client.websocket)
+            asyncio.create_task(self._close(client.websocket, code=1013))
+        else:
+            client.drop_oldest()
+            client.enqueue(frame)
+
+    def _next_frame(self, topic: str, data: dict) -> Frame:
+        """Stamp a broadcast with the next global seq and keep it for replay."""
+        self.seq += 1
+        frame = Frame({**data, "seq": self.seq})
+        self.replay.append((self.seq, topic, data, frame))
+        return frame
+
+    def send(self, websocket: WebSocket, data: dict):
+        """Queue a message for a single client (bootstrap frames, pongs)."""
+        client = self.clients.get(websocket)
+        if client is not None:
+            self._deliver(client, Frame(data))
+
+    async def publish_state(self, topic: str, data: dict, relay: bool = True):
+        """Publish the latest full payload of a list topic.
+
+        Unchanged payloads are not sent at all. Clients that opted in to
+        deltas and hold the previous version get a ``<topic>_delta``
+        frame with the added/changed/removed items; everyone else
+        (legacy clients, or delta clients that are behind) gets the full
+        snapshot tagged with ``version``.
+        """
+        version = self.versions.setdefault(topic, TopicVersion())
+        published = version.publish(data, DELTA_TOPICS[topic])
+        if published is None:
+            return
+        base_version, delta = published
+        if relay:
+            fabric.publish("publish_state", topic=topic, data=data)
+        self.broadcasts += 1
+        full = self._next_frame(topic, {"type": topic, "version": version.version, "data": data})
+        delta_frame = None
+        for client in list(self.clients.values()):
+            if not client.wants(topic):
+                continue
+            if client.queue.full() and self.overflow_policy != "disconnect":
+                # Make room first so a drop resets topic_version before we pick
+                client.drop_oldest()
+            if (client.deltas and delta is not None
+                    and client.topic_version.get(topic) == base_version):
+                if delta_frame is None:
+                    delta_frame = Frame({
+                        "type": f"{topic}_delta",
+                        "base_version": base_version,
+                        "version": version.version,
+                        "seq": self.seq,
+                        "data": delta,
+                    })
+                frame = delta_frame
+                self.deltas_sent += 1
+            else:
+                frame = full
+            self._deliver_in_order(client, frame)
+            client.topic_version[topic] = version.version
+
+    def send_snapshot(self, websocket: WebSocket, topic: str, **extra) -> bool:
+        """Send the last published version of a list topic, if there is one."""
+        client = self.clients.get(websocket)
+        version = self.versions.get(topic)
+        if client is None or version is None or version.data is None:
+            return False
+        self._deliver(client, Frame({
+            "type": topic, "version": version.version, "data": version.data, **extra,
+        }))
+        client.topic_version[topic] = version.version
+        return True
+
+    def add_listener(self, topic: str, callback):
+        """Call ``callback(data)`` for every broadcast of ``topic``, local or relayed."""
+        self.listeners.setdefault(topic, []).append(callback)
+
+    async def broadcast(self, data: dict, relay: bool = True):
+        """Queue data for every subscribed client without awaiting any socket.
+
+        Clients receive a message only if they subscribe to its type and
+        it passes their filters. Batching clients get per-event topics
+        buffered into one ``events_batch`` frame per window instead.
+        Local broadcasts are relayed to the other workers' managers.
+        """
+        if relay:
+            fabric.publish("broadcast", data=data)
+        self.broadcasts += 1
+        topic = data.get("type")
+        for callback in self.listeners.get(topic, ()):
+            callback(data.get("data"))
+        frame = self._next_frame(topic, data)
+        batchable = topic in WS_COALESCE_TOPICS
+        for client in list(self.clients.values()):
+            if not client.wants(topic) or not message_matches(data, client.filters):
+                continue
+            if batchable and client.batch and (self.coalesce_ms > 0 or client.max_fps > 0):
+                self._buffer(client, topic, data)
+            else:
+                self._deliver_in_order(client, frame)
+
+    def _deliver_in_order(self, client: ClientConnection, frame: Frame):
+        """Deliver a seq'd frame after the client's buffered (lower-seq) events."""
+        if client.pending:
+            if client.flush_handle:
+                client.flush_handle.cancel()
+            self._flush(client)
+        self._deliver(client, frame)
+
+    def _buffer(self, client: ClientConnection, topic: str, data: dict):
+        client.pending.append((self.seq, topic, data.get("data")))
+        if client.flush_handle is None:
+            window = self.coalesce_ms / 1000
+            if client.max_fps:
+                window = max(window, 1 / client.max_fps)
+            client.flush_handle = asyncio.get_running_loop().call_later(
+                window, self._flush, client
+            )
+
+    def _flush(self, client: ClientConnection):
+        """Send a batching client its buffered events as events_batch frames.
+
+        One frame per run of same-topic events in seq order, so every
+        frame's events are newer than the previous frame's ``seq`` and a
+        client resuming from any ``last_seq`` it saw misses nothing.
+        Clients flushing the same events (same topic and seqs) share one
+        Frame, so the batch is still serialized once.
+        """
+        client.flush_handle = None
+        pending, client.pending = client.pending, []
+        if client.websocket not in self.clients:
+            return
+        if len(self._batch_frames) > 256:
+            self._batch_frames.clear()
+        runs = []
+        for seq, topic, data in pending:
+            if runs and runs[-1][0] == topic:
+                runs[-1][1].append((seq, data))
+            else:
+                runs.append((topic, [(seq, data)]))
+        for topic, items in runs:
+            key = (topic, tuple(seq for seq, _ in items))
+            frame = self._batch_frames.get(key)
+            if frame is None:
+                frame = Frame({
+                    "type": "events_batch",
+                    "topic": topic,
+                    "seq": items[-1][0],
+                    "data": [data for _, data in items],
+                })
+                self._batch_frames[key] = frame
+            self.batches_sent += 1
+            self.events_coalesced += len(items)
+            self._deliver(client, frame)
+
+    async def shutdown(self):
+        """Cancel every sender task (server shutdown)."""
+        senders = [c.sender for c in self.clients.values() if c.sender]
+        for client in self.clients.values():
+            if client.flush_handle:
+                client.flush_handle.cancel()
+        self.clients.clear()
+        for sender in senders:
+            sender.cancel()
+        if senders:
+            await asyncio.wait(senders, timeout=5)
+
+    def stats(self) -> dict:
+        deflate = frame_stats["json.deflate"]
+        ratio = deflate["bytes_out"] / deflate["bytes_in"] if deflate["bytes_in"] else None
+        return {
+            "clients": len(self.clients),
+            "broadcasts": self.broadcasts,
+            "evicted": self.evicted,
+            "overflow_policy": self.overflow_policy,
+            "queue_size": self.queue_size,
+            "queued": sum(c.queue.qsize() for c in self.clients.values()),
+            "dropped": sum(c.dropped for c in self.clients.values()),
+            "deltas_sent": self.deltas_sent,
+            "topic_versions": {topic: v.version for topic, v in self.versions.items()},
+            "coalescing": {
+                "window_ms": self.coalesce_ms,
+                "batch_clients": sum(1 for c in self.clients.values() if c.batch),
+                "batches_sent": self.batches_sent,
+                "events_coalesced": self.events_coalesced,
+            },
+            "replay": {
+                "epoch": self.epoch,
+                "seq": self.seq,
+                "buffered": len(self.replay),
+                "capacity": self.replay.maxlen,
+                "resumes": self.resumes,
+                "bootstraps": self.bootstraps,
+            },
+            "frames": {
+                "json": dict(frame_stats["json"]),
+                "msgpack": dict(frame_stats["msgpack"]),
+                "json.deflate": {
+                    **deflate,
+                    "ratio": round(ratio, 4) if ratio is not None else None,
+                    "level": WS_FRAME_DEFLATE_LEVEL,
+                },
+            },
+        }
 
 
 manager = ConnectionManager()
 
+# ---------------------------------------------------------------------------
+# Multi-Worker Fabric
+# ---------------------------------------------------------------------------
+# With DASHBOARD_WORKERS > 1 every uvicorn worker has its own manager,
+# aggregator and DB connection. Workers exchange broadcasts, list-topic
+# publishes, brain snapshot sections and aggregate updates over a Unix
+# socket hub, and one elected leader runs the file watcher, brain poller
+# and SSE bridge.
+
+WORKERS = int(os.environ.get("DASHBOARD_WORKERS", "1"))
+FABRIC_SOCKET = os.environ.get("DASHBOARD_FABRIC_SOCKET", DB_PATH + ".fabric.sock")
+LEADER_LOCK_FILE = os.environ.get("DASHBOARD_LEADER_LOCK", DB_PATH + ".leader.lock")
+# Per-worker bytes buffered toward the hub before publishes are dropped.
+FABRIC_MAX_BUFFER = 4 * 1024 * 1024
+
+
+class LeaderLock:
+    """Non-blocking ``flock`` on a shared file; held for the process lifetime.
+
+    The kernel releases the lock when the holder exits, so a follower's
+    next ``try_acquire`` succeeds after the leader dies.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class WorkerFabric:
+    """Newline-delimited JSON pub/sub between workers over a Unix socket.
+
+    The leader runs the hub (``serve_hub``), which relays each line to
+    every other connected worker. Every worker, leader included, keeps
+    one client connection (``run_client``) that publishes its local
+    messages and dispatches remote ones to handlers registered with
+    ``on``. ``publish`` never awaits: while disconnected, or when the
+    hub falls behind, messages are dropped and counted.
+
+    A dropped message is never retried. Instead the gap is repaired on
+    the next connection: ``on_connect`` runs after every (re)join, a
+    backed-up hub or peer connection is closed so that side rejoins,
+    and a worker that dropped its own messages asks the others to
+    ``resync`` once it is back.
+    """
+
+    def __init__(self, socket_path: str | None = None):
+        self.socket_path = socket_path
+        self.handlers: dict = {}
+        self.on_connect = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._hub: asyncio.AbstractServer | None = None
+        self._peers: set = set()
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+        self.relayed = 0
+        self.reconnects = 0
+        self.resyncs = 0
+        self._reported_drops = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.socket_path)
+
+    def on(self, kind: str, handler):
+        self.handlers[kind] = handler
+
+    def publish(self, kind: str, **payload):
+        if not self.enabled:
+            return
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            self.dropped += 1
+            return
+        if writer.transport.get_write_buffer_size() > FABRIC_MAX_BUFFER:
+            # The hub is not draining us; rejoin and resync instead
+            self.dropped += 1
+            writer.close()
+            return
+        line = json.dumps({"kind": kind, **payload}, separators=(",", ":"), default=str)
+        writer.write(line.encode("utf-8") + b"\n")
+        self.published += 1
+
+    async def serve_hub(self):
+        """Bind the hub socket (leader only), replacing a stale socket file."""
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        self._hub = await asyncio.start_unix_server(
+            self._serve_peer, path=self.socket_path, limit=FABRIC_MAX_BUFFER,
+        )
+        logger.info("Worker fabric hub listening on %s", self.socket_path)
+
+    async def _serve_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._peers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                for peer in list(self._peers):
+                    if peer is writer or peer.is_closing():
+                        continue
+                    if peer.transport.get_write_buffer_size() > FABRIC_MAX_BUFFER:
+                        # Cut the slow peer loose; it resyncs when it rejoins
+                        self.dropped += 1
+                        peer.close()
+                        continue
+                    peer.write(line)
+                    self.relayed += 1
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._peers.discard(writer)
+            writer.close()
+
+    async def run_client(self):
+        """Stay connected to the hub and dispatch remote messages; retries forever."""
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self.socket_path, limit=FABRIC_MAX_BUFFER,
+                )
+            except (FileNotFoundError, ConnectionRefusedError):
+                await asyncio.sleep(0.5)
+                continue
+            self._writer = writer
+            logger.info("Worker %d joined fabric", os.getpid())
+            if self.dropped != self._reported_drops:
+                # Peers missed messages this worker could not send
+                self._reported_drops = self.dropped
+                self.publish("resync")
+            try:
+                if self.on_connect is not None:
+                    await self.on_connect()
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    await self._dispatch(line)
+            except (ConnectionError, ValueError):
+                pass
+            finally:
+                self._writer = None
+                writer.close()
+            self.reconnects += 1
+            await asyncio.sleep(0.5)
+
+    async def _dispatch(self, line: bytes):
+        try:
+            message = json.loads(line)
+            handler = self.handlers.get(message.pop("kind"))
+        except (json.JSONDecodeError, KeyError, AttributeError):
+            return
+        if handler is None:
+            return
+        self.received += 1
+        try:
+            result = handler(**message)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as exc:
+            logger.warning("Fabric handler failed: %s", exc)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._hub is not None:
+            self._hub.close()
+            for peer in list(self._peers):
+                peer.close()
+            await self._hub.wait_closed()
+            self._hub = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "connected": self._writer is not None,
+            "hub": self._hub is not None,
+            "peers": len(self._peers),
+            "published": self.published,
+            "received": self.received,
+            "relayed": self.relayed,
+            "dropped": self.dropped,
+            "reconnects": self.reconnects,
+            "resyncs": self.resyncs,
+        }
+
+
+fabric = WorkerFabric(FABRIC_SOCKET if WORKERS > 1 else None)
+
+
+async def resync_aggregator(app: FastAPI):
+    """Reload this worker's aggregates from SQLite after a fabric gap.
+
+    Relayed ``aggregate`` messages lost while disconnected (or sent
+    before this worker joined) are recovered from the shared database.
+    The load reads one WAL snapshot on its own connection; events
+    applied meanwhile are journaled and replayed onto the fresh state.
+    """
+    async with app.state.aggregator_resync:
+        aggregator = app.state.aggregator
+        aggregator.journal = []
+        try:
+            async with aiosqlite.connect(DB_PATH) as db:
+                await db.execute("PRAGMA busy_timeout = 5000")
+                await db.execute("BEGIN")
+                fresh = await StateAggregator.load(db)
+                await db.rollback()
+        except Exception as exc:
+            aggregator.journal = None
+            logger.warning("Aggregate resync failed: %s", exc)
+            return
+        aggregator.replace_with(fresh)
+        fabric.resyncs += 1
+
+
+def register_fabric_handlers(app: FastAPI):
+    """Apply messages relayed from other workers to this worker's state."""
+
+    async def on_broadcast(data):
+        await manager.broadcast(data, relay=False)
+
+    async def on_publish_state(topic, data):
+        await manager.publish_state(topic, data, relay=False)
+
+    def on_snapshot(section, data):
+        app.state.brain_snapshot.update(section, data, relay=False)
+
+    def on_aggregate(skill=None, **applied):
+        app.state.aggregator.apply_event(skill=tuple(skill) if skill else None, **applied)
+
+    fabric.on("broadcast", on_broadcast)
+    fabric.on("publish_state", on_publish_state)
+    fabric.on("snapshot", on_snapshot)
+    fabric.on("aggregate", on_aggregate)
+    fabric.on("interest", brain_scheduler.note_remote)
+    fabric.on("resync", lambda: resync_aggregator(app))
+    app.state.aggregator_resync = asyncio.Lock()
+    # Every (re)join may have missed messages, including the first one:
+    # events inserted between StateAggregator.load and joining the hub
+    fabric.on_connect = lambda: resync_aggregator(app)
+
+
+def start_leader_tasks(app: FastAPI) -> list[asyncio.Task]:
+    """Background tasks that must run in exactly one worker."""
+    return [
+        asyncio.create_task(watch_events_file(app)),
+        asyncio.create_task(poll_brain(app)),
+        asyncio.create_task(stream_brain_events(app)),
+    ]
+
+
+async def run_leader_election(app: FastAPI):
+    """Wait for the leader lock, then run the fabric hub and leader tasks."""
+    lock = app.state.leader_lock
+    while not lock.try_acquire():
+        await asyncio.sleep(2)
+    logger.info("Worker %d elected leader", os.getpid())
+    await fabric.serve_hub()
+    app.state.leader_tasks.extend(start_leader_tasks(app))
+
+
+@asynccontextmanager
+async def startup_lock():
+    """Serialize DB init and file sync across workers starting together."""
+    if not fabric.enabled:
+        yield
+        return
+    fd = os.open(LEADER_LOCK_FILE + ".init", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, fcntl.flock, fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+# ---------------------------------------------------------------------------
+# Brain SSE Multiplexer
+# ---------------------------------------------------------------------------
+# /api/brain/events/stream subscribers share the single upstream stream
+# held by stream_brain_events: its brain_event broadcasts are filtered
+# locally and fanned out through bounded per-subscriber queues.
+
+SSE_QUEUE_SIZE = int(os.environ.get("DASHBOARD_SSE_QUEUE_SIZE", "256"))
+SSE_REPLAY_SIZE = int(os.environ.get("DASHBOARD_SSE_REPLAY_SIZE", "512"))
+SSE_KEEPALIVE = 15.0
+
+
+class SSESubscriber:
+    __slots__ = ("component", "project", "queue", "dropped")
+
+    def __init__(self, component: str | None, project: str | None):
+        self.component = component
+        self.project = project
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+        self.dropped = 0
+
+    def matches(self, event: dict) -> bool:
+        if self.component is not None and event.get("component") != self.component:
+            return False
+        if self.project is not None and (event.get("project_slug") or event.get("project")) != self.project:
+            return False
+        return True
+
+    def offer(self, item: tuple):
+        """Enqueue without blocking; a full queue sheds its oldest event."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+
+
+class SSEHub:
+    """Fans brain events out to SSE subscribers with Last-Event-ID replay.
+
+    Event ids are ``<epoch>-<n>``; a reconnect carrying an id from this
+    epoch replays the buffered events after it that match the
+    subscriber's filters. Ids from another epoch (server restart) or
+    older than the buffer replay whatever is still buffered.
+    """
+
+    def __init__(self, replay_size: int = None):
+        self.epoch = os.urandom(4).hex()
+        self.next_id = 0
+        self.buffer: deque = deque(maxlen=replay_size or SSE_REPLAY_SIZE)
+        self.subscribers: set[SSESubscriber] = set()
+        self.published = 0
+        self.replayed = 0
+
+    def publish(self, event):
+        if not isinstance(event, dict):
+            return
+        self.next_id += 1
+        item = (f"{self.epoch}-{self.next_id}", event)
+        self.buffer.append((self.next_id, item))
+        self.published += 1
+        for sub in self.subscribers:
+            if sub.matches(event):
+                sub.offer(item)
+
+    def subscribe(self, component: str | None = None, project: str | None = None,
+                  last_event_id: str | None = None) -> SSESubscriber:
+        sub = SSESubscriber(component, project)
+        if last_event_id:
+            epoch, _, n = last_event_id.partition("-")
+            after = int(n) if epoch == self.epoch and n.isdigit() else 0
+            for seq, item in self.buffer:
+                if seq > after and sub.matches(item[1]):
+                    sub.offer(item)
+                    self.replayed += 1
+        self.subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: SSESubscriber):
+        self.subscribers.discard(sub)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self.subscribers),
+            "published": self.published,
+            "replayed": self.replayed,
+            "buffered": len(self.buffer),
+            "dropped": sum(sub.dropped for sub in self.subscribers),
+        }
+
+
+sse_hub = SSEHub()
+manager.add_listener("brain_event", sse_hub.publish)
+
+
 # ---------------------------------------------------------------------------
 # Database Initialization
 # ---------------------------------------------------------------------------
@@ -401,6 +2132,7 @@ CREATE TABLE IF NOT EXISTS events (
 
 CREATE INDEX IF NOT EXISTS idx_events_agent ON events(agent);
 CREATE INDEX IF NOT EXISTS idx_events_session_date ON events(session_date);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
 CREATE UNIQUE INDEX IF NOT EXISTS idx_events_dedup ON events(ts, agent, event, input_tokens, output_tokens, cache_read, cache_create);
 
 CREATE TABLE IF NOT EXISTS agent_levels (
@@ -424,6 +2156,21 @@ CREATE TABLE IF NOT EXISTS sync_state (
     value TEXT NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS brain_events (
+    id INTEGER PRIMARY KEY,
+    event_name TEXT NOT NULL,
+    component TEXT,
+    project_slug TEXT,
+    instance_id TEXT,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_brain_events_created ON brain_events(created_at);
+CREATE INDEX IF NOT EXISTS idx_brain_events_name ON brain_events(event_name, id);
+CREATE INDEX IF NOT EXISTS idx_brain_events_component ON brain_events(component, id);
+CREATE INDEX IF NOT EXISTS idx_brain_events_project ON brain_events(project_slug, id);
+CREATE INDEX IF NOT EXISTS idx_brain_events_instance ON brain_events(instance_id, id);
+
 CREATE TABLE IF NOT EXISTS skill_invocations (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     ts TEXT NOT NULL,
@@ -435,6 +2182,7 @@ CREATE TABLE IF NOT EXISTS skill_invocations (
 CREATE INDEX IF NOT EXISTS idx_skill_name ON skill_invocations(skill_name);
 CREATE INDEX IF NOT EXISTS idx_skill_session_date ON skill_invocations(session_date);
 CREATE INDEX IF NOT EXISTS idx_skill_project ON skill_invocations(project_slug);
+CREATE INDEX IF NOT EXISTS idx_skill_name_ts ON skill_invocations(skill_name, ts);
 
 CREATE TABLE IF NOT EXISTS context_window (
     id INTEGER PRIMARY KEY CHECK (id = 1),
@@ -462,6 +2210,20 @@ CREATE TABLE IF NOT EXISTS context_breakdown (
 );
 """
 
+CONTEXT_BREAKDOWN_FIELDS = (
+    "system_prompt",
+    "system_tools",
+    "mcp_tools",
+    "custom_agents",
+    "rules",
+    "claude_md",
+    "memory",
+    "skills",
+    "messages",
+    "autocompact_buffer",
+    "free_space",
+)
+
 
 async def init_db(db: aiosqlite.Connection):
     """Create tables and indexes if they do not exist."""
@@ -561,8 +2323,12 @@ def build_date_where(range_key: str) -> tuple:
     return "", ()  # "all" = no filter
 
 
-async def insert_event(db: aiosqlite.Connection, event: dict):
-    """Insert a single event into the events table and update aggregates."""
+async def insert_event(db: aiosqlite.Connection, event: dict, aggregator=None):
+    """Insert a single event into the events table and update aggregates.
+
+    When an in-memory ``StateAggregator`` is given, it is updated with the
+    same deltas after the rows are committed.
+    """
     ts = event.get("ts", datetime.now(timezone.utc).isoformat())
     event_type = event.get("event", "unknown")
     agent = event.get("agent", "unknown")
@@ -598,6 +2364,12 @@ async def insert_event(db: aiosqlite.Connection, event: dict):
     # Skip aggregate updates if this was a duplicate (already inserted)
     if cursor.rowcount == 0:
         return False
+    event_id = cursor.lastrowid
+
+    new_count = None
+    context = None
+    breakdown = None
+    skill_inserted = False
 
     # Update daily_budget for stop events (which carry token data)
     if event_type == "stop":
@@ -640,6 +2412,12 @@ async def insert_event(db: aiosqlite.Connection, event: dict):
                 ctx_used = int(event.get("context_used", 0))
                 ctx_remaining = int(event.get("context_remaining", 0))
                 model_id = event.get("model_id", "")
+                context = {
+                    "context_used": ctx_used,
+                    "context_max": ctx_max,
+                    "context_remaining": ctx_remaining,
+                    "model_id": model_id,
+                }
                 await db.execute(
                     """INSERT OR REPLACE INTO context_window
                        (id, context_used, context_max, context_remaining, model_id, updated_at)
@@ -649,27 +2427,17 @@ async def insert_event(db: aiosqlite.Connection, event: dict):
 
                 # Update context_breakdown if present
                 breakdown = event.get("context_breakdown")
-                if isinstance(breakdown, dict):
+                if not isinstance(breakdown, dict):
+                    breakdown = None
+                else:
+                    breakdown = {key: int(breakdown.get(key, 0)) for key in CONTEXT_BREAKDOWN_FIELDS}
                     await db.execute(
                         """INSERT OR REPLACE INTO context_breakdown
                            (id, system_prompt, system_tools, mcp_tools, custom_agents,
                             rules, claude_md, memory, skills, messages,
                             autocompact_buffer, free_space, updated_at)
                            VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            int(breakdown.get("system_prompt", 0)),
-                            int(breakdown.get("system_tools", 0)),
-                            int(breakdown.get("mcp_tools", 0)),
-                            int(breakdown.get("custom_agents", 0)),
-                            int(breakdown.get("rules", 0)),
-                            int(breakdown.get("claude_md", 0)),
-                            int(breakdown.get("memory", 0)),
-                            int(breakdown.get("skills", 0)),
-                            int(breakdown.get("messages", 0)),
-                            int(breakdown.get("autocompact_buffer", 0)),
-                            int(breakdown.get("free_space", 0)),
-                            now,
-                        ),
+                        (*(breakdown[key] for key in CONTEXT_BREAKDOWN_FIELDS), now),
                     )
 
     # Handle skill_invoke: insert into skill_invocations table
@@ -677,15 +2445,198 @@ async def insert_event(db: aiosqlite.Connection, event: dict):
         skill_name = event.get("skill_name", "")
         project_slug = event.get("project_slug", "")
         if skill_name:
-            await db.execute(
+            skill_cursor = await db.execute(
                 "INSERT OR IGNORE INTO skill_invocations (ts, skill_name, session_date, project_slug) VALUES (?, ?, ?, ?)",
                 (ts, skill_name, session_date, project_slug),
             )
+            skill_inserted = skill_cursor.rowcount > 0
 
     await db.commit()
+
+    if aggregator is not None:
+        applied = dict(
+            event_id=event_id,
+            row={
+                "ts": ts,
+                "event": event_type,
+                "agent": agent,
+                "agent_id": agent_id,
+                "raw_type": raw_type,
+                "duration_s": duration_s,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read": cache_read,
+                "cache_create": cache_create,
+            },
+            session_date=session_date,
+            level_count=new_count,
+            context=context,
+            breakdown=breakdown,
+            skill=(skill_name, project_slug) if skill_inserted else None,
+        )
+        aggregator.apply_event(**applied)
+        fabric.publish("aggregate", **applied)
     return True
 
 
+# ---------------------------------------------------------------------------
+# Brain Event Mirror
+# ---------------------------------------------------------------------------
+
+# Mirrored brain events older than this are pruned.
+BRAIN_EVENTS_RETENTION_DAYS = int(os.environ.get("DASHBOARD_BRAIN_EVENTS_RETENTION_DAYS", "30"))
+BRAIN_EVENTS_PRUNE_INTERVAL = 3600
+# /api/brain/events filter name -> mirror column.
+BRAIN_EVENT_FILTERS = {
+    "event_name": "event_name",
+    "component": "component",
+    "project": "project_slug",
+    "instance_id": "instance_id",
+}
+
+
+class BrainEventMirror:
+    """Local ``brain_events`` table fed by the SSE bridge and polling.
+
+    ``complete_since`` (kept in ``sync_state``) marks where the mirror
+    is known to hold every brain event from that ``created_at`` up to
+    now: ``""`` means all history, ``None`` means nothing yet. A
+    gap-fill fetch that hits its page limit moves it forward, since
+    older events may be missing. Queries that stay inside that range
+    are answered locally; anything older goes to the brain.
+    """
+
+    def __init__(self):
+        self.complete_since: str | None = None
+        self.last_prune = time.monotonic()
+        self.written = 0
+        self.served_local = 0
+        self.served_upstream = 0
+
+    async def load(self, db: aiosqlite.Connection) -> str | None:
+        """Read coverage state and prune; return the newest mirrored ``created_at``."""
+        self.complete_since = await self.coverage(db)
+        await self.prune(db)
+        await db.commit()
+        async with db.execute("SELECT MAX(created_at) FROM brain_events") as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    async def coverage(db: aiosqlite.Connection) -> str | None:
+        # Read per call: in multi-worker mode only the leader writes
+        async with db.execute(
+            "SELECT value FROM sync_state WHERE key = 'brain_events_complete_since'"
+        ) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def write(self, db: aiosqlite.Connection, events: list, complete_since: str | None = None):
+        if events:
+            await db.executemany(
+                """INSERT OR IGNORE INTO brain_events
+                   (id, event_name, component, project_slug, instance_id, created_at, data)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        e["id"], e.get("event_name") or "", e.get("component"),
+                        e.get("project_slug"), e.get("instance_id"),
+                        e.get("created_at") or e.get("timestamp") or "",
+                        json.dumps(e, separators=(",", ":")),
+                    )
+                    for e in events
+                ],
+            )
+            self.written += len(events)
+        if complete_since is not None:
+            self.complete_since = complete_since
+        if time.monotonic() - self.last_prune > BRAIN_EVENTS_PRUNE_INTERVAL:
+            await self.prune(db)
+        elif complete_since is not None:
+            await self._save_coverage(db)
+        await db.commit()
+
+    async def prune(self, db: aiosqlite.Connection):
+        """Drop events past retention; coverage cannot reach before the cutoff."""
+        self.last_prune = time.monotonic()
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=BRAIN_EVENTS_RETENTION_DAYS)).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        await db.execute("DELETE FROM brain_events WHERE created_at < ?", (cutoff,))
+        if self.complete_since is not None and self.complete_since < cutoff:
+            self.complete_since = cutoff
+        await self._save_coverage(db)
+
+    async def _save_coverage(self, db: aiosqlite.Connection):
+        if self.complete_since is not None:
+            await db.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('brain_events_complete_since', ?)",
+                (self.complete_since,),
+            )
+
+    async def query(
+        self, db: aiosqlite.Connection, filters: dict, since: str | None, until: str | None,
+        limit: int, offset: int = 0, before_id: int | None = None,
+    ) -> tuple[list, int, bool]:
+        """Return (events newest first, matching total, whether complete).
+
+        Keyset paging: pass the last ``id`` of a page as ``before_id``.
+        When not complete, a full page is still the correct newest rows,
+        but ``total`` only counts the mirrored range.
+        """
+        complete_since = await self.coverage(db)
+        if complete_since is None:
+            return [], 0, False
+        where, args = [], []
+        for name, column in BRAIN_EVENT_FILTERS.items():
+            if filters.get(name) is not None:
+                where.append(f"{column} = ?")
+                args.append(filters[name])
+        if until is not None:
+            where.append("created_at <= ?")
+            args.append(until)
+        # Only the contiguous range counts toward an answer
+        lower = max(since or "", complete_since)
+        where.append("created_at >= ?")
+        args.append(lower)
+        count_where = " AND ".join(where)
+        if before_id is not None:
+            where.append("id < ?")
+            args.append(before_id)
+        sql = f"SELECT data FROM brain_events WHERE {' AND '.join(where)} ORDER BY id DESC LIMIT ? OFFSET ?"
+        async with db.execute(sql, (*args, limit, offset)) as cursor:
+            rows = [json.loads(row[0]) for row in await cursor.fetchall()]
+        count_args = args[:-1] if before_id is not None else args
+        async with db.execute(f"SELECT COUNT(*) FROM brain_events WHERE {count_where}", count_args) as cursor:
+            total = (await cursor.fetchone())[0]
+        # Rows and total are exact only if the requested range does not
+        # reach past the mirrored one
+        complete = complete_since == "" or (since is not None and since >= complete_since)
+        return rows, total, complete
+
+    def stats(self) -> dict:
+        return {
+            "complete_since": self.complete_since,
+            "written": self.written,
+            "served_local": self.served_local,
+            "served_upstream": self.served_upstream,
+            "retention_days": BRAIN_EVENTS_RETENTION_DAYS,
+        }
+
+
+brain_event_mirror = BrainEventMirror()
+
+
+async def mirror_brain_events(app, events: list, complete_since: str | None = None):
+    """Persist brain events to the mirror; failures are logged, not raised."""
+    if not events and complete_since is None:
+        return
+    try:
+        await brain_event_mirror.write(app.state.db, events, complete_since)
+    except Exception as exc:
+        logger.warning("Brain event mirror write failed: %s", exc)
+
+
 # ---------------------------------------------------------------------------
 # File Watcher (events.jsonl sync)
 # ---------------------------------------------------------------------------
@@ -842,7 +2793,7 @@ async def watch_events_file(app: FastAPI):
                             continue
                         try:
                             event = json.loads(line)
-                            was_new = await insert_event(db, event)
+                            was_new = await insert_event(db, event, app.state.aggregator)
                             if was_new:
                                 await manager.broadcast({"type": "event", "data": event})
                         except json.JSONDecodeError:
@@ -862,163 +2813,438 @@ async def watch_events_file(app: FastAPI):
         logger.error("File watcher error: %s", exc)
 
 
-async def poll_brain(app: FastAPI):
-    """Background task that polls the brain server and broadcasts updates via WebSocket."""
-    brain_config = app.state.brain_config
-    if not brain_config.get("url"):
-        logger.info("Brain URL not configured, brain polling disabled")
-        return
+# name: (base, min, max interval seconds, WebSocket topics, brain path prefixes)
+BRAIN_RESOURCES = {
+    "health": (60, 30, 300, ("brain_health", "sync_status", "brain_knowledge", "brain_state"),
+               ("/health", "/api/brain-stats", "/api/sync-status")),
+    "instances": (30, 10, 120, ("brain_instances", "instance_agent_event", "brain_state"),
+                  ("/api/instances",)),
+    "projects": (120, 60, 600, ("brain_projects", "brain_briefs", "brain_sessions", "brain_state"),
+                 ("/api/projects", "/api/briefs", "/api/sessions")),
+    "events": (15, 5, 120, ("brain_events",), ("/api/events",)),
+    "tasks": (60, 20, 300, ("brain_tasks",), ("/api/tasks",)),
+}
+# Longest wait between attempts while the brain is failing.
+BRAIN_ERROR_BACKOFF_MAX = 300
+# A REST read keeps its resource polled for this long.
+BRAIN_INTEREST_TTL = 120
+
+
+class ResourceSchedule:
+    """Adaptive interval for one polled brain resource.
+
+    A changed payload halves the interval (down to ``min``); an
+    unchanged one doubles it (up to ``max``); a failure doubles it up
+    to ``BRAIN_ERROR_BACKOFF_MAX``.
+    """
+
+    def __init__(self, name: str, base: float, minimum: float, maximum: float, topics: tuple):
+        self.name = name
+        self.base = base
+        self.min = minimum
+        self.max = maximum
+        self.topics = topics
+        self.interval = base
+        self.next_due = 0.0
+        self.fingerprint: int | None = None
+        self.failures = 0
+        self.unchanged = 0
+        self.runs = 0
+        self.last_result: str | None = None
+        self.last_duration: float | None = None
+
+    def record(self, data, now: float, duration: float):
+        self.runs += 1
+        self.last_duration = round(duration, 3)
+        if data is None:
+            self.failures += 1
+            self.last_result = "error"
+            self.interval = min(max(self.interval, self.base) * 2, BRAIN_ERROR_BACKOFF_MAX)
+        else:
+            fingerprint = hash(json.dumps(data, sort_keys=True, default=str))
+            if self.fingerprint is not None and fingerprint == self.fingerprint:
+                self.unchanged += 1
+                self.last_result = "unchanged"
+                self.interval = min(self.interval * 2, self.max)
+            else:
+                self.last_result = "changed" if self.fingerprint is not None else "initial"
+                if self.fingerprint is not None:
+                    self.interval = max(min(self.interval, self.base) / 2, self.min)
+                else:
+                    self.interval = self.base
+                self.unchanged = 0
+            self.failures = 0
+            self.fingerprint = fingerprint
+        self.next_due = now + self.interval
+
+
+class BrainScheduler:
+    """Tracks who watches each brain resource and when it is next due.
+
+    Interest comes from WebSocket clients subscribed to a resource's
+    topics, REST reads through ``brain_request`` (kept for
+    ``BRAIN_INTEREST_TTL``), and interest reported by other workers.
+    Unwatched resources are paused; a new watcher wakes the poller.
+    """
+
+    def __init__(self):
+        self.resources = {
+            name: ResourceSchedule(name, base, lo, hi, topics)
+            for name, (base, lo, hi, topics, _) in BRAIN_RESOURCES.items()
+        }
+        self._prefixes = [
+            (prefix, name) for name, spec in BRAIN_RESOURCES.items() for prefix in spec[4]
+        ]
+        self.rest_hits: dict[str, float] = {}
+        self.remote_hits: dict[str, float] = {}
+        self._wake: asyncio.Event | None = None
+
+    def resource_for(self, path: str) -> str | None:
+        for prefix, name in self._prefixes:
+            if path.startswith(prefix):
+                return name
+        return None
+
+    def note_rest(self, path: str):
+        name = self.resource_for(path)
+        if name is None:
+            return
+        was_watched = self.watched(name)
+        self.rest_hits[name] = time.monotonic()
+        if not was_watched:
+            self.wake()
+
+    def note_remote(self, resources: list):
+        now = time.monotonic()
+        for name in resources:
+            if name in self.resources:
+                self.remote_hits[name] = now
+        self.wake()
+
+    def ws_watchers(self, name: str) -> int:
+        topics = self.resources[name].topics
+        return sum(
+            1 for client in manager.clients.values()
+            if any(client.wants(topic) for topic in topics)
+        )
+
+    def watched(self, name: str) -> bool:
+        now = time.monotonic()
+        for hits in (self.rest_hits, self.remote_hits):
+            if now - hits.get(name, float("-inf")) < BRAIN_INTEREST_TTL:
+                return True
+        return self.ws_watchers(name) > 0
+
+    def local_interest(self) -> list[str]:
+        """Resources this worker's clients watch (reported to the leader)."""
+        now = time.monotonic()
+        return [
+            name for name in self.resources
+            if self.ws_watchers(name) or now - self.rest_hits.get(name, float("-inf")) < BRAIN_INTEREST_TTL
+        ]
+
+    def wake(self):
+        if self._wake is not None:
+            self._wake.set()
+
+    def poll_now(self, name: str):
+        """Make ``name`` due immediately (if watched) and wake the poller."""
+        self.resources[name].next_due = 0.0
+        self.wake()
+
+    async def sleep_until_due(self):
+        """Sleep until the next watched resource is due or interest changes."""
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        now = time.monotonic()
+        pending = [r.next_due for r in self.resources.values() if self.watched(r.name)]
+        # Re-check at least every 30s so expiring REST interest pauses resources
+        timeout = min([due - now for due in pending] + [30.0])
+        self._wake.clear()
+        try:
+            async with asyncio.timeout(max(timeout, 0.05)):
+                await self._wake.wait()
+        except TimeoutError:
+            pass
+
+    def describe(self) -> dict:
+        now = time.monotonic()
+        resources = {}
+        for name, r in self.resources.items():
+            rest = self.rest_hits.get(name)
+            remote = self.remote_hits.get(name)
+            watched = self.watched(name)
+            resources[name] = {
+                "state": "active" if watched else "paused",
+                "interval_s": r.interval,
+                "base_s": r.base,
+                "bounds_s": [r.min, r.max],
+                "next_in_s": round(max(r.next_due - now, 0.0), 1) if watched else None,
+                "last_result": r.last_result,
+                "last_duration_s": r.last_duration,
+                "failures": r.failures,
+                "unchanged_streak": r.unchanged,
+                "runs": r.runs,
+                "watchers": {
+                    "websocket_clients": self.ws_watchers(name),
+                    "rest_hit_age_s": round(now - rest, 1) if rest is not None else None,
+                    "remote_hit_age_s": round(now - remote, 1) if remote is not None else None,
+                },
+            }
+        return {"resources": resources, "interest_ttl_s": BRAIN_INTEREST_TTL}
 
-    # Polling intervals (seconds)
-    INSTANCE_INTERVAL = 30
-    HEALTH_INTERVAL = 60
-    PROJECTS_INTERVAL = 120
-    EVENTS_INTERVAL = 15
-    TASKS_INTERVAL = 60
 
-    last_instances = 0.0
-    last_health = 0.0
-    last_projects = 0.0
-    last_events = 0.0
-    last_tasks = 0.0
+brain_scheduler = BrainScheduler()
 
-    logger.info(
-        "Brain polling started (instances: %ds, health: %ds, projects/briefs: %ds, events: %ds, tasks: %ds)",
-        INSTANCE_INTERVAL, HEALTH_INTERVAL, PROJECTS_INTERVAL, EVENTS_INTERVAL, TASKS_INTERVAL,
-    )
 
+async def report_brain_interest():
+    """Tell the leader which brain resources this worker's clients watch."""
     while True:
-        await asyncio.sleep(5)  # Check every 5 seconds what needs refreshing
-        now = asyncio.get_event_loop().time()
-
-        try:
-            # Health check (every 60s)
-            if now - last_health >= HEALTH_INTERVAL:
-                health = await brain_request(app, "/health")
-                stats = await brain_request(app, "/api/brain-stats")
-                if health or stats:
-                    await manager.broadcast({
-                        "type": "brain_health",
-                        "data": {**(health or {}), **(stats or {})},
-                    })
+        interest = brain_scheduler.local_interest()
+        if interest:
+            fabric.publish("interest", resources=interest)
+        await asyncio.sleep(15)
+
+
+brain_poll_stats = {
+    "cycles": 0,
+    "last_cycle_s": None,
+    "max_cycle_s": 0.0,
+    "total_cycle_s": 0.0,
+    "requests": 0,
+    "instances_covered": 0,
+}
 
-                # Sync status
-                try:
-                    sync_data = await build_sync_status(app)
-                    await manager.broadcast({"type": "sync_status", "data": sync_data})
-                except Exception:
-                    pass
 
-                # Knowledge stats
-                try:
-                    knowledge_data = await build_knowledge_state()
-                    await manager.broadcast({"type": "brain_knowledge", "data": knowledge_data})
-                except Exception:
-                    pass
+def build_brain_poll_stats() -> dict:
+    cycles = brain_poll_stats["cycles"]
+    return {
+        **{k: v for k, v in brain_poll_stats.items() if k != "total_cycle_s"},
+        "avg_cycle_s": round(brain_poll_stats["total_cycle_s"] / cycles, 3) if cycles else None,
+        "concurrency": BRAIN_CONCURRENCY,
+    }
 
-                last_health = now
 
-            # Instances (every 30s -- real-time feel)
-            if now - last_instances >= INSTANCE_INTERVAL:
-                data = await brain_request(
-                    app, "/api/instances", params={"include_stale": "false"}
-                )
-                if data:
-                    await manager.broadcast({
-                        "type": "brain_instances",
-                        "data": data,
-                    })
+async def poll_brain(app: FastAPI):
+    """Background task that polls the brain server and broadcasts updates via WebSocket.
 
-                    # Fetch agent data for active instances with a current_brief
-                    # Limit to 5 instances per cycle to avoid N+1 explosion
-                    active_instances = [
-                        inst for inst in (data.get("instances") or [])
-                        if inst.get("status") == "active" and inst.get("current_brief")
-                    ][:5]
+    ``brain_scheduler`` decides when each resource is due: only resources
+    someone watches are polled, and their intervals adapt to how often
+    the data changes and whether the brain answers.
 
-                    for inst in active_instances:
-                        inst_id = inst.get("id")
-                        if not inst_id:
-                            continue
-                        try:
-                            agent_data = await brain_request(
-                                app, f"/api/instances/{inst_id}/agents"
-                            )
-                            log_data = await brain_request(
-                                app, f"/api/instances/{inst_id}/log",
-                                params={"limit": "20"},
-                            )
-                            if agent_data or log_data:
-                                await manager.broadcast({
-                                    "type": "instance_agent_event",
-                                    "data": {
-                                        "instance_id": inst_id,
-                                        "agents": agent_data,
-                                        "log": log_data,
-                                    },
-                                })
-                        except Exception as exc:
-                            logger.warning(
-                                "Failed to fetch agent data for instance %s: %s",
-                                inst_id, exc,
-                            )
+    Each cycle runs the due sections concurrently, and every upstream
+    request inside them (including the per-instance agents/log fan-out
+    for all active instances) shares a semaphore of
+    ``DASHBOARD_BRAIN_CONCURRENCY`` slots. Cycle durations are recorded
+    in ``brain_poll_stats``.
+    """
+    brain_config = app.state.brain_config
+    if not brain_config.get("url"):
+        logger.info("Brain URL not configured, brain polling disabled")
+        return
+    snapshot = app.state.brain_snapshot
+    sem = asyncio.Semaphore(BRAIN_CONCURRENCY)
+
+    async def fetch(path: str, params: dict = None):
+        async with sem:
+            brain_poll_stats["requests"] += 1
+            return await brain_request(app, path, params=params, refresh=True)
+
+    async def poll_health():
+        health, stats = await asyncio.gather(fetch("/health"), fetch("/api/brain-stats"))
+        if health or stats:
+            health_data = {**(health or {}), **(stats or {})}
+            snapshot.update("health", health_data)
+            await manager.broadcast({
+                "type": "brain_health",
+                "data": health_data,
+            })
 
-                last_instances = now
+        # Sync status
+        try:
+            async with sem:
+                brain_poll_stats["requests"] += 1
+                sync_data = await build_sync_status(app, refresh=True)
+            # Offline results replace the cached status too, so the
+            # bootstrap does not keep serving "online" through an outage
+            snapshot.update("sync", sync_data)
+            await manager.broadcast({"type": "sync_status", "data": sync_data})
+        except Exception:
+            pass
 
-            # Projects + Briefs + Sessions (every 120s -- less frequent)
-            if now - last_projects >= PROJECTS_INTERVAL:
-                projects = await brain_request(app, "/api/projects")
-                briefs = await brain_request(app, "/api/briefs")
-                sessions = await brain_request(
-                    app, "/api/sessions", params={"days": "7"},
-                )
+        # Knowledge stats
+        try:
+            knowledge_data = await build_knowledge_state()
+            await manager.broadcast({"type": "brain_knowledge", "data": knowledge_data})
+        except Exception:
+            pass
+        return (health, stats) if health or stats else None
 
-                if projects:
-                    await manager.broadcast({
-                        "type": "brain_projects",
-                        "data": projects,
-                    })
-                if briefs:
-                    await manager.broadcast({
-                        "type": "brain_briefs",
-                        "data": briefs,
-                    })
-                if sessions:
-                    await manager.broadcast({
-                        "type": "brain_sessions",
-                        "data": sessions,
-                    })
-                last_projects = now
+    async def poll_instance(inst_id: str):
+        try:
+            agent_data, log_data = await asyncio.gather(
+                fetch(f"/api/instances/{inst_id}/agents"),
+                fetch(f"/api/instances/{inst_id}/log", {"limit": "20"}),
+            )
+            if agent_data or log_data:
+                await manager.broadcast({
+                    "type": "instance_agent_event",
+                    "data": {
+                        "instance_id": inst_id,
+                        "agents": agent_data,
+                        "log": log_data,
+                    },
+                })
+        except Exception as exc:
+            logger.warning(
+                "Failed to fetch agent data for instance %s: %s",
+                inst_id, exc,
+            )
 
-            # Events (every 15s -- high-frequency feed)
-            if now - last_events >= EVENTS_INTERVAL:
-                events_data = await brain_request(
-                    app, "/api/events", params={"limit": "50"}
-                )
-                if events_data:
-                    await manager.broadcast({
-                        "type": "brain_events",
-                        "data": events_data,
-                    })
-                last_events = now
+    async def poll_instances():
+        data = await fetch("/api/instances", {"include_stale": "false"})
+        if not data:
+            return None
+        snapshot.update("instances", data)
+        await manager.publish_state("brain_instances", data)
+
+        # Agent data for every active instance with a current_brief; the
+        # semaphore bounds the fan-out instead of a fixed instance cap
+        active_ids = [
+            inst.get("id") for inst in (data.get("instances") or [])
+            if inst.get("status") == "active" and inst.get("current_brief") and inst.get("id")
+        ]
+        await asyncio.gather(*(poll_instance(inst_id) for inst_id in active_ids))
+        brain_poll_stats["instances_covered"] = len(active_ids)
+        return data
+
+    async def poll_projects():
+        projects, briefs, sessions = await asyncio.gather(
+            fetch("/api/projects"),
+            fetch("/api/briefs"),
+            fetch("/api/sessions", {"days": "7"}),
+        )
+        snapshot.update("projects", projects)
+        snapshot.update("briefs", briefs)
+        snapshot.update("sessions", sessions)
+        if projects:
+            await manager.broadcast({
+                "type": "brain_projects",
+                "data": projects,
+            })
+        if briefs:
+            await manager.broadcast({
+                "type": "brain_briefs",
+                "data": briefs,
+            })
+        if sessions:
+            await manager.broadcast({
+                "type": "brain_sessions",
+                "data": sessions,
+            })
+        return (projects, briefs, sessions) if projects or briefs or sessions else None
+
+    async def poll_events():
+        log = brain_event_log
+        if not log.sse_connected or log.catch_up:
+            # Gap-fill: only events at or after the high-water mark
+            params = {"limit": str(BRAIN_EVENTS_FETCH_LIMIT)}
+            if log.since is not None:
+                params["since"] = log.since
+            else:
+                params["limit"] = str(log.window)
+            events_data = await fetch("/api/events", params)
+            if events_data is None:
+                return None
+            log.catch_up = False
+            events = events_data.get("events") or []
+            log.meta = {k: v for k, v in events_data.items() if k != "events"}
+            # The first fetch seeds history; it is not broadcast as live events
+            seeding = not log.seeded
+            log.seeded = True
+            page_full = len(events) >= int(params["limit"])
+            new = log.merge(events, "poll")
+            if "since" in params and page_full:
+                logger.warning("Brain events gap-fill hit the %d-event page limit", BRAIN_EVENTS_FETCH_LIMIT)
+            # A full page may have skipped older events: the mirror is only
+            # complete from its oldest event on
+            complete_since = None
+            if page_full:
+                complete_since = min(e.get("created_at") or "" for e in events)
+            elif "since" not in params:
+                complete_since = ""
+            elif brain_event_mirror.complete_since is None:
+                complete_since = params["since"]
+            await mirror_brain_events(app, new, complete_since)
+            if not seeding:
+                for event in new:
+                    await manager.broadcast({"type": "brain_event", "data": event})
+        payload = log.payload()
+        if payload["events"]:
+            snapshot.update("events", payload)
+            await manager.publish_state("brain_events", payload)
+        return payload
+
+    async def poll_tasks():
+        tasks_data = await fetch("/api/tasks", {"limit": "100"})
+        if tasks_data:
+            snapshot.update("tasks", tasks_data)
+            await manager.publish_state("brain_tasks", tasks_data)
+        return tasks_data
+
+    pollers = {
+        "health": poll_health,
+        "instances": poll_instances,
+        "projects": poll_projects,
+        "events": poll_events,
+        "tasks": poll_tasks,
+    }
+    scheduler = brain_scheduler
+    logger.info(
+        "Brain polling started (adaptive, %s, concurrency: %d)",
+        ", ".join(f"{r.name}: {r.base:g}s" for r in scheduler.resources.values()),
+        BRAIN_CONCURRENCY,
+    )
 
-            # Tasks (every 60s)
-            if now - last_tasks >= TASKS_INTERVAL:
-                tasks_data = await brain_request(
-                    app, "/api/tasks", params={"limit": "100"}
+    first_cycle = True
+    brain_state_sent = False
+    try:
+        while True:
+            # Fetch everything immediately at startup so the bootstrap
+            # snapshot fills; afterwards only watched resources that are due
+            now = time.monotonic()
+            due = [
+                r for r in scheduler.resources.values()
+                if first_cycle or (r.next_due <= now and scheduler.watched(r.name))
+            ]
+            first_cycle = False
+            if due:
+                results = await asyncio.gather(
+                    *(pollers[r.name]() for r in due), return_exceptions=True
                 )
-                if tasks_data:
-                    await manager.broadcast({
-                        "type": "brain_tasks",
-                        "data": tasks_data,
-                    })
-                last_tasks = now
-
-        except asyncio.CancelledError:
-            logger.info("Brain polling stopped")
-            return
-        except Exception as exc:
-            logger.warning("Brain polling error: %s", exc)
+                elapsed = time.monotonic() - now
+                for resource, result in zip(due, results):
+                    if isinstance(result, Exception):
+                        logger.warning("Brain polling error (%s): %s", resource.name, result)
+                        result = None
+                    resource.record(result, now, elapsed)
+
+                brain_poll_stats["cycles"] += 1
+                brain_poll_stats["last_cycle_s"] = round(elapsed, 3)
+                brain_poll_stats["max_cycle_s"] = round(max(brain_poll_stats["max_cycle_s"], elapsed), 3)
+                brain_poll_stats["total_cycle_s"] += elapsed
+
+                # Clients that connected before the snapshot filled got no
+                # brain_state bootstrap; send it once it first has data
+                if not brain_state_sent:
+                    message = build_brain_state_message(snapshot)
+                    if message is not None:
+                        await manager.broadcast(message)
+                        brain_state_sent = True
+
+            await scheduler.sleep_until_due()
+    except asyncio.CancelledError:
+        logger.info("Brain polling stopped")
 
 
 async def stream_brain_events(app: FastAPI):
@@ -1038,31 +3264,40 @@ async def stream_brain_events(app: FastAPI):
 
     while True:
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(connect=10.0, read=None, write=None, pool=None)) as client:
-                async with client.stream("GET", url, headers=headers) as resp:
-                    if resp.status_code != 200:
-                        logger.warning("Brain SSE stream returned %d, retrying in %ds", resp.status_code, backoff)
-                        await asyncio.sleep(backoff)
-                        backoff = min(backoff * 2, 60)
+            async with http_clients.stream.stream("GET", url, headers=headers) as resp:
+                if resp.status_code != 200:
+                    logger.warning("Brain SSE stream returned %d, retrying in %ds", resp.status_code, backoff)
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, 60)
+                    continue
+
+                logger.info("Brain SSE bridge connected")
+                backoff = 5  # reset on successful connection
+                brain_event_log.sse_connected = True
+                # Fetch whatever arrived between the last poll and now
+                brain_event_log.catch_up = True
+                brain_scheduler.poll_now("events")
+
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data: "):
                         continue
-
-                    logger.info("Brain SSE bridge connected")
-                    backoff = 5  # reset on successful connection
-
-                    async for line in resp.aiter_lines():
-                        if not line.startswith("data: "):
+                    try:
+                        event_data = json.loads(line[6:])
+                        # Skip keepalive/status messages
+                        if "event_name" not in event_data:
                             continue
-                        try:
-                            event_data = json.loads(line[6:])
-                            # Skip keepalive/status messages
-                            if "event_name" not in event_data:
+                        # Events without an id cannot be deduplicated or
+                        # mirrored; they are still passed on
+                        if event_data.get("id") is not None:
+                            if not brain_event_log.merge([event_data], "sse"):
                                 continue
-                            await manager.broadcast({
-                                "type": "brain_event",
-                                "data": event_data,
-                            })
-                        except (json.JSONDecodeError, TypeError):
-                            continue
+                            await mirror_brain_events(app, [event_data])
+                        await manager.broadcast({
+                            "type": "brain_event",
+                            "data": event_data,
+                        })
+                    except (json.JSONDecodeError, TypeError):
+                        continue
 
         except asyncio.CancelledError:
             logger.info("Brain SSE bridge stopped")
@@ -1071,6 +3306,11 @@ async def stream_brain_events(app: FastAPI):
             logger.warning("Brain SSE bridge error: %s, retrying in %ds", exc, backoff)
             await asyncio.sleep(backoff)
             backoff = min(backoff * 2, 60)
+        finally:
+            if brain_event_log.sse_connected:
+                # Polling fills the gap until the stream is back
+                brain_event_log.sse_connected = False
+                brain_scheduler.poll_now("events")
 
 
 async def refresh_pricing_periodically(app: FastAPI):
@@ -1180,9 +3420,10 @@ async def build_agents_state(db: aiosqlite.Connection) -> dict:
                 agents[agent_name]["active"] = True
 
     # Compute levels and RPG stats
+    rpg_stats = compute_all_rpg_stats(agents)
     for name, data in agents.items():
         data["level"] = get_level(data["invocations"])
-        data["rpg_stats"] = compute_rpg_stats(data, agents)
+        data["rpg_stats"] = rpg_stats[name]
 
     return agents
 
@@ -1321,12 +3562,31 @@ async def build_context_window_state(db: aiosqlite.Connection) -> dict:
     return result
 
 
-async def build_sync_status(app):
+async def build_sync_status(app, refresh: bool = False):
     """Build sync pipeline status from brain server."""
-    data = await brain_request(app, "/api/sync-status")
+    data = await brain_request(app, "/api/sync-status", refresh=refresh)
     if data:
-        return {**data, "status": "online"}
-    return {"status": "offline", "last_push": None, "last_pull": None, "queue_depth": 0}
+        return {**data, "status": "online", "breaker": brain_breaker.stats()}
+    return offline_sync_status()
+
+
+def offline_sync_status() -> dict:
+    return {
+        "status": "offline", "last_push": None, "last_pull": None, "queue_depth": 0,
+        "breaker": brain_breaker.stats(),
+    }
+
+
+def cached_sync_status(snapshot: "BrainSnapshot") -> dict:
+    """Snapshot sync status for the WebSocket bootstrap.
+
+    The cached copy is only as fresh as the last health poll, so while
+    the brain breaker is open it is reported offline instead.
+    """
+    data = snapshot.get("sync")
+    if data is None or brain_breaker.state == "open":
+        return offline_sync_status()
+    return data
 
 
 def build_team_status():
@@ -1383,49 +3643,127 @@ def build_team_status():
     return {"active": False, "teammates": [], "team_name": "", "coordination_log": [], "file_ownership": {}}
 
 
-async def build_knowledge_state():
-    """Build knowledge base state from local brain DB."""
-    knowledge_db = os.path.join(os.path.expanduser("~"), ".igris", "memory", "knowledge.db")
-    if not os.path.exists(knowledge_db):
-        return {"status": "unavailable", "learnings_count": 0, "errors_count": 0, "patterns_count": 0, "recent": []}
-    try:
-        async with aiosqlite.connect(f"file:{knowledge_db}?mode=ro", uri=True) as db:
-            db.row_factory = aiosqlite.Row
-            # Counts
-            cur = await db.execute("SELECT COUNT(*) as c FROM learnings")
+KNOWLEDGE_DB = os.path.join(os.path.expanduser("~"), ".igris", "memory", "knowledge.db")
+
+
+def _knowledge_unavailable() -> dict:
+    return {"status": "unavailable", "learnings_count": 0, "errors_count": 0, "patterns_count": 0, "recent": []}
+
+
+class KnowledgeStore:
+    """Long-lived read-only view of the local brain knowledge DB.
+
+    Keeps a single ``mode=ro`` connection open and caches the derived
+    state keyed on ``PRAGMA data_version`` plus the file's mtime/size, so
+    repeated calls skip the COUNT(*) and DISTINCT scans entirely while
+    the knowledge base is unchanged. The connection is reopened if the
+    file is replaced (inode change) and dropped if it disappears.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: aiosqlite.Connection | None = None
+        self._file_id: tuple | None = None
+        self._cache_key: tuple | None = None
+        self._state: dict | None = None
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def _open(self, file_id: tuple):
+        await self._close_conn()
+        self._conn = await aiosqlite.connect(f"file:{self.path}?mode=ro", uri=True)
+        self._file_id = file_id
+
+    async def _close_conn(self):
+        if self._conn is not None:
+            try:
+                await self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._file_id = None
+        self._cache_key = None
+        self._state = None
+
+    async def _query(self) -> dict:
+        db = self._conn
+        async with db.execute("SELECT COUNT(*) FROM learnings") as cur:
             row = await cur.fetchone()
-            learnings_count = row[0] if row else 0
+        learnings_count = row[0] if row else 0
 
-            cur = await db.execute("SELECT COUNT(*) as c FROM errors")
+        async with db.execute("SELECT COUNT(*) FROM errors") as cur:
             row = await cur.fetchone()
-            errors_count = row[0] if row else 0
+        errors_count = row[0] if row else 0
 
-            # Pattern categories
-            cur = await db.execute(
-                "SELECT DISTINCT category FROM learnings WHERE category IS NOT NULL AND category != ''"
-            )
-            rows = await cur.fetchall()
-            patterns_count = len(rows)
+        # Pattern categories
+        async with db.execute(
+            "SELECT COUNT(DISTINCT category) FROM learnings WHERE category IS NOT NULL AND category != ''"
+        ) as cur:
+            row = await cur.fetchone()
+        patterns_count = row[0] if row else 0
 
-            # Recent learnings
-            cur = await db.execute(
-                "SELECT id, project, category, title, created_at FROM learnings ORDER BY created_at DESC LIMIT 10"
-            )
+        # Recent learnings
+        async with db.execute(
+            "SELECT id, project, category, title, created_at FROM learnings ORDER BY created_at DESC LIMIT 10"
+        ) as cur:
             rows = await cur.fetchall()
-            recent = [
-                {"id": r[0], "project": r[1], "category": r[2], "title": r[3], "created_at": r[4]}
-                for r in rows
-            ]
+        recent = [
+            {"id": r[0], "project": r[1], "category": r[2], "title": r[3], "created_at": r[4]}
+            for r in rows
+        ]
+
+        return {
+            "status": "connected",
+            "learnings_count": learnings_count,
+            "errors_count": errors_count,
+            "patterns_count": patterns_count,
+            "recent": recent,
+        }
+
+    async def get_state(self) -> dict:
+        """Return knowledge state, re-querying only when the DB has changed."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            async with self._lock:
+                await self._close_conn()
+            return _knowledge_unavailable()
+
+        async with self._lock:
+            try:
+                file_id = (st.st_dev, st.st_ino)
+                if self._conn is None or file_id != self._file_id:
+                    await self._open(file_id)
+
+                async with self._conn.execute("PRAGMA data_version") as cur:
+                    row = await cur.fetchone()
+                cache_key = (row[0], st.st_mtime_ns, st.st_size)
+
+                if self._state is not None and cache_key == self._cache_key:
+                    self.hits += 1
+                    return dict(self._state)
+
+                self.misses += 1
+                self._state = await self._query()
+                self._cache_key = cache_key
+                return dict(self._state)
+            except Exception as exc:
+                logger.warning("Knowledge DB read failed: %s", exc)
+                await self._close_conn()
+                return _knowledge_unavailable()
+
+    async def close(self):
+        async with self._lock:
+            await self._close_conn()
 
-            return {
-                "status": "connected",
-                "learnings_count": learnings_count,
-                "errors_count": errors_count,
-                "patterns_count": patterns_count,
-                "recent": recent,
-            }
-    except Exception:
-        return {"status": "unavailable", "learnings_count": 0, "errors_count": 0, "patterns_count": 0, "recent": []}
+
+knowledge_store = KnowledgeStore(KNOWLEDGE_DB)
+
+
+async def build_knowledge_state():
+    """Build knowledge base state from local brain DB (cached, see KnowledgeStore)."""
+    return await knowledge_store.get_state()
 
 
 async def build_skill_heatmap(db, range_key="all", project_slug=None):
@@ -1521,6 +3859,141 @@ async def build_filtered_recent_events(
     return events
 
 
+async def build_events_page(db: aiosqlite.Connection, range_key: str, limit: int = 50) -> list:
+    """Recent events for a range via SQL (all ranges)."""
+    if range_key == "all":
+        return await build_recent_events(db, limit=limit)
+    return await build_filtered_recent_events(db, range_key, limit=limit)
+
+
+def encode_cursor(*parts) -> str:
+    """Encode keyset values as an opaque, URL-safe paging cursor."""
+    raw = json.dumps(list(parts), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, types: tuple) -> list:
+    """Decode a cursor produced by ``encode_cursor``; 400 on anything else.
+
+    ``types`` gives the expected type of each keyset value in order.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        parts = json.loads(raw)
+    except (ValueError, TypeError):
+        parts = None
+    if (
+        not isinstance(parts, list)
+        or len(parts) != len(types)
+        or not all(
+            isinstance(part, expected) and not isinstance(part, bool)
+            for part, expected in zip(parts, types)
+        )
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return parts
+
+
+def parse_timestamp_param(value: str | None, name: str) -> str | None:
+    """Validate an ISO-8601 ``since``/``until`` query value; 400 if malformed."""
+    if value is None:
+        return None
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} timestamp")
+    return value
+
+
+def count_in_days(
+    day_counts: dict, range_start: str | None, range_key: str,
+    since: str | None = None, until: str | None = None,
+) -> int:
+    """Sum a per-day rollup over a range and optional since/until bounds.
+
+    Bounds are applied at day granularity, so a since/until that falls
+    mid-day makes the result an upper-bound approximation.
+    """
+    since_day = since[:10] if since else None
+    until_day = until[:10] if until else None
+    total = 0
+    for date, count in day_counts.items():
+        if range_key == "today" and date != range_start:
+            continue
+        if range_key == "week" and date < range_start:
+            continue
+        if since_day and date < since_day:
+            continue
+        if until_day and date > until_day:
+            continue
+        total += count
+    return total
+
+
+def build_events_where(range_key: str, since: str | None = None, until: str | None = None) -> tuple:
+    """Return ``AND ...`` clause and params for range plus since/until bounds."""
+    date_clause, params = build_date_where(range_key)
+    params = list(params)
+    clauses = date_clause
+    if since:
+        clauses += " AND ts >= ?"
+        params.append(since)
+    if until:
+        clauses += " AND ts < ?"
+        params.append(until)
+    return clauses, params
+
+
+async def query_events(
+    db: aiosqlite.Connection,
+    range_key: str = "all",
+    limit: int = 50,
+    since: str | None = None,
+    until: str | None = None,
+    before_id: int | None = None,
+) -> tuple:
+    """Keyset page of events, newest first.
+
+    ``since`` is inclusive and ``until`` exclusive (ISO timestamps).
+    ``before_id`` continues from a previous page without an OFFSET scan.
+    Returns ``(events, next_before_id)``; the latter is None on the
+    last page.
+    """
+    clauses, params = build_events_where(range_key, since, until)
+    if before_id is not None:
+        clauses += " AND id < ?"
+        params.append(before_id)
+
+    rows = []
+    async with db.execute(
+        f"""SELECT id, ts, event, agent, agent_id, raw_type, duration_s,
+                  input_tokens, output_tokens, cache_read, cache_create
+           FROM events WHERE 1=1 {clauses}
+           ORDER BY id DESC LIMIT ?""",
+        (*params, limit + 1),
+    ) as cursor:
+        async for row in cursor:
+            rows.append(row)
+
+    next_before_id = rows[limit - 1][0] if len(rows) > limit else None
+    events = []
+    for row in rows[:limit]:
+        event = {
+            "ts": row[1],
+            "event": row[2],
+            "agent": row[3],
+            "agent_id": row[4],
+            "raw_type": row[5],
+            "duration_s": row[6],
+            "input_tokens": row[7],
+            "output_tokens": row[8],
+            "cache_read": row[9],
+            "cache_create": row[10],
+        }
+        events.append(event)
+    return events, next_before_id
+
+
 async def build_filtered_agents_state(
     db: aiosqlite.Connection, range_key: str
 ) -> dict:
@@ -1604,63 +4077,580 @@ async def build_filtered_agents_state(
                 agents[agent_name]["active"] = True
 
     # Compute levels for agents without DB level data, and RPG stats
+    rpg_stats = compute_all_rpg_stats(agents)
     for name, data in agents.items():
         if "level" not in data:
             data["level"] = get_level(0)
-        data["rpg_stats"] = compute_rpg_stats(data, agents)
+        data["rpg_stats"] = rpg_stats[name]
 
     return agents
 
 
-async def build_filtered_state(app: FastAPI, range_key: str = "today") -> dict:
-    """Build complete state payload filtered by date range."""
-    db = app.state.db
-    budget_config = app.state.budget_config
+async def build_filtered_state(app: FastAPI, range_key: str = "today") -> dict:
+    """Build complete state payload filtered by date range.
+
+    Concurrent builds for the same range share one aggregation pass.
+    """
+    return await inflight.do(("state", range_key), _build_filtered_state, app, range_key)
+
+
+async def _build_filtered_state(app: FastAPI, range_key: str) -> dict:
+    db = app.state.db
+    budget_config = app.state.budget_config
+
+    aggregator = getattr(app.state, "aggregator", None)
+    if aggregator is not None:
+        recent_events = aggregator.recent_events(range_key)
+        if recent_events is None:
+            recent_events = await build_events_page(db, range_key)
+        return {
+            "agents": aggregator.agents_state(range_key),
+            "budget": aggregator.budget_state(budget_config),
+            "recent_events": recent_events,
+            "totals": aggregator.totals(range_key),
+            "context_window": aggregator.context_window_state(),
+            "skill_heatmap": aggregator.skill_heatmap(range_key),
+            "range": range_key,
+        }
+
+    if range_key == "all":
+        agents = await build_agents_state(db)
+        totals = await build_totals(db)
+        recent_events = await build_recent_events(db)
+    else:
+        agents = await build_filtered_agents_state(db, range_key)
+        totals = await build_filtered_totals(db, range_key)
+        recent_events = await build_filtered_recent_events(db, range_key)
+
+    budget = await build_budget_state(db, budget_config)  # Always daily
+    context_window = await build_context_window_state(db)
+    skill_heatmap = await build_skill_heatmap(db, range_key)
+
+    return {
+        "agents": agents,
+        "budget": budget,
+        "recent_events": recent_events,
+        "totals": totals,
+        "context_window": context_window,
+        "skill_heatmap": skill_heatmap,
+        "range": range_key,
+    }
+
+
+def build_server_metrics(app: FastAPI) -> dict:
+    """Server-side performance counters (compression, caches, transports)."""
+    snapshot = getattr(app.state, "brain_snapshot", None)
+    return {
+        "compression": build_compression_stats(),
+        "knowledge_cache": {"hits": knowledge_store.hits, "misses": knowledge_store.misses},
+        "single_flight": inflight.stats(),
+        "brain_cache": brain_cache.stats(),
+        "brain_breaker": brain_breaker.stats(),
+        "http_clients": http_clients.stats(),
+        "brain_poll": build_brain_poll_stats(),
+        "brain_events": {**brain_event_log.stats(), "mirror": brain_event_mirror.stats()},
+        "websocket": manager.stats(),
+        "sse": sse_hub.stats(),
+        "workers": {
+            "configured": WORKERS,
+            "pid": os.getpid(),
+            "leader": not fabric.enabled or app.state.leader_lock.held,
+            "fabric": fabric.stats(),
+        },
+        "brain_snapshot_age": snapshot.ages(*snapshot.sections) if snapshot else {},
+    }
+
+
+async def build_full_state(app: FastAPI) -> dict:
+    """Build the complete state payload for API and WebSocket initial send."""
+    db = app.state.db
+    budget_config = app.state.budget_config
+
+    agents = await build_agents_state(db)
+    budget = await build_budget_state(db, budget_config)
+    recent_events = await build_recent_events(db)
+    totals = await build_totals(db)
+    context_window = await build_context_window_state(db)
+    skill_heatmap = await build_skill_heatmap(db)
+
+    return {
+        "agents": agents,
+        "budget": budget,
+        "recent_events": recent_events,
+        "totals": totals,
+        "context_window": context_window,
+        "skill_heatmap": skill_heatmap,
+    }
+
+
+# ---------------------------------------------------------------------------
+# In-Memory Aggregates
+# ---------------------------------------------------------------------------
+
+_metrics_file_cache = {"mtime": None, "agents": {}}
+
+
+def load_metrics_file_agents() -> dict:
+    """Return the ``agents`` map from agent-metrics.json, re-read only on mtime change."""
+    try:
+        mtime = os.stat(METRICS_FILE).st_mtime_ns
+    except OSError:
+        _metrics_file_cache.update(mtime=None, agents={})
+        return {}
+    if mtime != _metrics_file_cache["mtime"]:
+        try:
+            with open(METRICS_FILE, "r") as f:
+                agents = json.load(f).get("agents", {})
+        except (json.JSONDecodeError, OSError):
+            agents = {}
+        _metrics_file_cache.update(mtime=mtime, agents=agents)
+    return _metrics_file_cache["agents"]
+
+
+class AgentTotals:
+    """Running stop-event totals for one agent (one day or all-time)."""
+
+    __slots__ = ("count", "input", "output", "cache_read", "cache_create", "duration", "last_ts")
+
+    def __init__(self):
+        self.count = 0
+        self.input = 0
+        self.output = 0
+        self.cache_read = 0
+        self.cache_create = 0
+        self.duration = 0.0
+        self.last_ts = None
+
+    def add(self, count, input_tokens, output_tokens, cache_read, cache_create, duration, last_ts):
+        self.count += count
+        self.input += input_tokens
+        self.output += output_tokens
+        self.cache_read += cache_read
+        self.cache_create += cache_create
+        self.duration += duration
+        if last_ts is not None and (self.last_ts is None or last_ts > self.last_ts):
+            self.last_ts = last_ts
+
+    def merge(self, other: "AgentTotals"):
+        self.add(
+            other.count, other.input, other.output, other.cache_read,
+            other.cache_create, other.duration, other.last_ts,
+        )
+
+    def avg_duration(self) -> float:
+        return round(self.duration / self.count, 2) if self.count else 0
+
+
+class StateAggregator:
+    """Hot in-process copy of every aggregate the dashboard state needs.
+
+    Loaded once at startup from the SQLite rollups (GROUP BY agent/day,
+    daily_budget, agent_levels, skill counts, context tables) and then
+    updated per event by ``insert_event``. Reads serialize these
+    structures directly, so they cost O(agents x days in range) no matter
+    how many events are stored. SQLite remains the durable store and the
+    SQL builders remain the reference implementation.
+    """
+
+    RECENT_LIMIT = 500
+
+    def __init__(self):
+        self.agent_days: dict[str, dict[str, AgentTotals]] = {}
+        self.levels: dict[str, int] = {}
+        self.budget: dict[str, int] = {}
+        self.skill_days: dict[str, dict[tuple, int]] = {}
+        self.open_starts: dict[str, str] = {}
+        self.stopped_ids: set = set()
+        self.context_window: dict | None = None
+        self.context_breakdown: dict | None = None
+        # (id, session_date, row), oldest first
+        self.recent: deque = deque(maxlen=self.RECENT_LIMIT)
+        self.event_days: dict[str, int] = {}
+        self.history_len = 0
+        # Highest events.id folded in by load(); apply_event skips at or below
+        self.loaded_through = 0
+        # Events applied while a resync load is running, replayed on swap
+        self.journal: list | None = None
+
+    @classmethod
+    async def load(cls, db: aiosqlite.Connection) -> "StateAggregator":
+        """Build an aggregator from the database rollups."""
+        agg = cls()
+
+        async with db.execute("SELECT COALESCE(MAX(id), 0) FROM events") as cursor:
+            agg.loaded_through = (await cursor.fetchone())[0]
+
+        async with db.execute(
+            """SELECT agent, session_date, COUNT(*),
+                      COALESCE(SUM(input_tokens), 0),
+                      COALESCE(SUM(output_tokens), 0),
+                      COALESCE(SUM(cache_read), 0),
+                      COALESCE(SUM(cache_create), 0),
+                      COALESCE(SUM(duration_s), 0),
+                      MAX(ts)
+               FROM events WHERE event = 'stop'
+               GROUP BY agent, session_date"""
+        ) as cursor:
+            async for row in cursor:
+                day = agg.agent_days.setdefault(row[1], {})
+                day.setdefault(row[0], AgentTotals()).add(*row[2:])
+
+        async with db.execute("SELECT agent, total_invocations FROM agent_levels") as cursor:
+            async for row in cursor:
+                agg.levels[row[0]] = row[1]
+
+        async with db.execute(
+            """SELECT date, total_input_tokens + total_output_tokens
+                            + total_cache_read + total_cache_create
+               FROM daily_budget"""
+        ) as cursor:
+            async for row in cursor:
+                agg.budget[row[0]] = row[1]
+
+        async with db.execute(
+            """SELECT session_date, skill_name, COALESCE(project_slug, ''), COUNT(*)
+               FROM skill_invocations GROUP BY session_date, skill_name, project_slug"""
+        ) as cursor:
+            async for row in cursor:
+                day = agg.skill_days.setdefault(row[0], {})
+                key = (row[1], row[2])
+                day[key] = day.get(key, 0) + row[3]
+
+        async with db.execute(
+            """SELECT agent_id, agent FROM events
+               WHERE event = 'start'
+               AND agent_id NOT IN (
+                   SELECT agent_id FROM events WHERE event = 'stop' AND agent_id != ''
+               )
+               AND agent_id != ''"""
+        ) as cursor:
+            async for row in cursor:
+                agg.open_starts[row[0]] = row[1]
+
+        # Every agent_id that ever stopped, so a late or replayed start for it
+        # is never counted as active (matches the SQL NOT IN subquery).
+        async with db.execute(
+            "SELECT DISTINCT agent_id FROM events WHERE event = 'stop' AND agent_id != ''"
+        ) as cursor:
+            async for row in cursor:
+                agg.stopped_ids.add(row[0])
+
+        async with db.execute(
+            """SELECT context_used, context_max, context_remaining, model_id
+               FROM context_window WHERE id = 1"""
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row:
+            agg.context_window = {
+                "context_used": row[0],
+                "context_max": row[1],
+                "context_remaining": row[2],
+                "model_id": row[3],
+            }
 
-    if range_key == "all":
-        agents = await build_agents_state(db)
-        totals = await build_totals(db)
-        recent_events = await build_recent_events(db)
-    else:
-        agents = await build_filtered_agents_state(db, range_key)
-        totals = await build_filtered_totals(db, range_key)
-        recent_events = await build_filtered_recent_events(db, range_key)
+        async with db.execute(
+            f"SELECT {', '.join(CONTEXT_BREAKDOWN_FIELDS)} FROM context_breakdown WHERE id = 1"
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row:
+            agg.context_breakdown = dict(zip(CONTEXT_BREAKDOWN_FIELDS, row))
 
-    budget = await build_budget_state(db, budget_config)  # Always daily
-    context_window = await build_context_window_state(db)
-    skill_heatmap = await build_skill_heatmap(db, range_key)
+        async with db.execute(
+            "SELECT session_date, COUNT(*) FROM events GROUP BY session_date"
+        ) as cursor:
+            async for row in cursor:
+                agg.event_days[row[0]] = row[1]
+        agg.history_len = sum(agg.event_days.values())
 
-    return {
-        "agents": agents,
-        "budget": budget,
-        "recent_events": recent_events,
-        "totals": totals,
-        "context_window": context_window,
-        "skill_heatmap": skill_heatmap,
-        "range": range_key,
-    }
+        recent = []
+        async with db.execute(
+            """SELECT id, session_date, ts, event, agent, agent_id, raw_type, duration_s,
+                      input_tokens, output_tokens, cache_read, cache_create
+               FROM events ORDER BY id DESC LIMIT ?""",
+            (cls.RECENT_LIMIT,),
+        ) as cursor:
+            async for row in cursor:
+                recent.append((row[0], row[1], {
+                    "ts": row[2],
+                    "event": row[3],
+                    "agent": row[4],
+                    "agent_id": row[5],
+                    "raw_type": row[6],
+                    "duration_s": row[7],
+                    "input_tokens": row[8],
+                    "output_tokens": row[9],
+                    "cache_read": row[10],
+                    "cache_create": row[11],
+                }))
+        agg.recent.extend(reversed(recent))
 
+        logger.info(
+            "State aggregator loaded (%d agents, %d days, %d events)",
+            len(agg.levels), len(agg.agent_days), agg.history_len,
+        )
+        return agg
+
+    def replace_with(self, fresh: "StateAggregator"):
+        """Adopt a freshly loaded aggregator's state in place.
+
+        Callers hold references to this object (``insert_event`` captures
+        it before awaiting the insert), so the swap happens on ``self``
+        rather than on ``app.state``. Events journaled during the load are
+        replayed; those the load already counted are skipped by id.
+        """
+        journal = self.journal or []
+        self.__dict__.update(fresh.__dict__)
+        self.journal = None
+        for applied in journal:
+            self.apply_event(**applied)
+
+    # -- Ingest ---------------------------------------------------------------
+
+    def apply_event(
+        self,
+        event_id: int,
+        row: dict,
+        session_date: str,
+        level_count: int | None = None,
+        context: dict | None = None,
+        breakdown: dict | None = None,
+        skill: tuple | None = None,
+    ):
+        """Fold one newly inserted event into the aggregates.
+
+        ``row`` has the same shape as the recent-events payload. The
+        optional arguments carry the side-table values ``insert_event``
+        just wrote so both stores stay in lockstep.
+        """
+        if event_id is not None and event_id <= self.loaded_through:
+            return
+        if self.journal is not None:
+            self.journal.append({
+                "event_id": event_id, "row": row, "session_date": session_date,
+                "level_count": level_count, "context": context,
+                "breakdown": breakdown, "skill": skill,
+            })
+        self.recent.append((event_id, session_date, row))
+        self.event_days[session_date] = self.event_days.get(session_date, 0) + 1
+        self.history_len += 1
+
+        agent = row["agent"]
+        agent_id = row["agent_id"]
+        event_type = row["event"]
+
+        if event_type == "start" and agent_id and agent_id not in self.stopped_ids:
+            self.open_starts[agent_id] = agent
+
+        if event_type == "stop":
+            day = self.agent_days.setdefault(session_date, {})
+            day.setdefault(agent, AgentTotals()).add(
+                1, row["input_tokens"], row["output_tokens"], row["cache_read"],
+                row["cache_create"], row["duration_s"], row["ts"],
+            )
+            self.budget[session_date] = self.budget.get(session_date, 0) + (
+                row["input_tokens"] + row["output_tokens"] + row["cache_read"] + row["cache_create"]
+            )
+            if agent_id:
+                self.open_starts.pop(agent_id, None)
+                self.stopped_ids.add(agent_id)
+            if level_count is not None:
+                self.levels[agent] = level_count
+            if context is not None:
+                self.context_window = dict(context)
+            if breakdown is not None:
+                self.context_breakdown = dict(breakdown)
+
+        if skill is not None:
+            day = self.skill_days.setdefault(session_date, {})
+            day[skill] = day.get(skill, 0) + 1
+
+    # -- Reads ----------------------------------------------------------------
+
+    def _range_totals(self, range_key: str) -> dict[str, AgentTotals]:
+        start = get_date_range(range_key)
+        merged: dict[str, AgentTotals] = {}
+        for date, day in self.agent_days.items():
+            if range_key == "today" and date != start:
+                continue
+            if range_key == "week" and date < start:
+                continue
+            for agent, totals in day.items():
+                merged.setdefault(agent, AgentTotals()).merge(totals)
+        return merged
+
+    def active_agents(self) -> set:
+        return set(self.open_starts.values())
+
+    def agents_state(self, range_key: str) -> dict:
+        """Same payload as build_agents_state / build_filtered_agents_state."""
+        file_agents = load_metrics_file_agents()
+        totals = self._range_totals(range_key)
+        active = self.active_agents()
+        agents = {}
+
+        if range_key == "all":
+            for name, data in file_agents.items():
+                agents[name] = {
+                    "invocations": data.get("invocations", 0),
+                    "total_input_tokens": data.get("total_input_tokens", 0),
+                    "total_output_tokens": data.get("total_output_tokens", 0),
+                    "total_cache_read_tokens": data.get("total_cache_read_tokens", 0),
+                    "total_cache_create_tokens": data.get("total_cache_create_tokens", 0),
+                    "avg_duration_seconds": data.get("avg_duration_seconds", 0),
+                    "success_rate": data.get("success_rate", 1.0),
+                    "last_used": data.get("last_used"),
+                    "active": False,
+                }
+            for name, t in totals.items():
+                if name not in agents:
+                    agents[name] = {
+                        "invocations": t.count,
+                        "total_input_tokens": t.input,
+                        "total_output_tokens": t.output,
+                        "total_cache_read_tokens": t.cache_read,
+                        "total_cache_create_tokens": t.cache_create,
+                        "avg_duration_seconds": t.avg_duration(),
+                        "success_rate": 1.0,
+                        "last_used": t.last_ts,
+                        "active": False,
+                    }
+            for name, data in agents.items():
+                if name in self.levels:
+                    data["invocations"] = max(self.levels[name], data["invocations"])
+                data["active"] = name in active
+                data["level"] = get_level(data["invocations"])
+        else:
+            for name, data in file_agents.items():
+                agents[name] = {
+                    "invocations": 0,
+                    "total_input_tokens": 0,
+                    "total_output_tokens": 0,
+                    "total_cache_read_tokens": 0,
+                    "total_cache_create_tokens": 0,
+                    "avg_duration_seconds": 0,
+                    "success_rate": data.get("success_rate", 1.0),
+                    "last_used": None,
+                    "active": False,
+                }
+            for name, t in totals.items():
+                data = agents.setdefault(name, {"success_rate": 1.0, "active": False})
+                data["invocations"] = t.count
+                data["total_input_tokens"] = t.input
+                data["total_output_tokens"] = t.output
+                data["total_cache_read_tokens"] = t.cache_read
+                data["total_cache_create_tokens"] = t.cache_create
+                data["avg_duration_seconds"] = t.avg_duration()
+                data["last_used"] = t.last_ts
+            for name, data in agents.items():
+                data["active"] = name in active
+                data["level"] = get_level(self.levels.get(name, 0))
+
+        rpg_stats = compute_all_rpg_stats(agents)
+        for name, data in agents.items():
+            data["rpg_stats"] = rpg_stats[name]
+        return agents
+
+    def totals(self, range_key: str) -> dict:
+        """Same payload as build_totals / build_filtered_totals."""
+        count = input_tokens = output_tokens = cache = 0
+        for t in self._range_totals(range_key).values():
+            count += t.count
+            input_tokens += t.input
+            output_tokens += t.output
+            cache += t.cache_read + t.cache_create
+        return {
+            "total_invocations": count,
+            "total_input_tokens": input_tokens,
+            "total_output_tokens": output_tokens,
+            "total_cache_tokens": cache,
+        }
 
-async def build_full_state(app: FastAPI) -> dict:
-    """Build the complete state payload for API and WebSocket initial send."""
-    db = app.state.db
-    budget_config = app.state.budget_config
+    def recent_events_page(self, range_key: str, limit: int = 50) -> tuple | None:
+        """Newest-first ``(events, next_before_id)``, or None if the ring cannot answer.
+
+        ``next_before_id`` is the id of the last returned row when more
+        matching rows may follow, else None.
+        """
+        start = get_date_range(range_key)
+        events = []
+        last_id = None
+        for event_id, session_date, row in reversed(self.recent):
+            if range_key == "today" and session_date != start:
+                continue
+            if range_key == "week" and session_date < start:
+                continue
+            if len(events) == limit:
+                return events, last_id
+            events.append(dict(row))
+            last_id = event_id
+        if self.history_len > len(self.recent):
+            return None  # Older matching rows may exist beyond the ring
+        return events, None
+
+    def recent_events(self, range_key: str, limit: int = 50) -> list | None:
+        """Newest-first recent events, or None if the ring cannot answer."""
+        page = self.recent_events_page(range_key, limit)
+        return page[0] if page is not None else None
+
+    def count_events(self, range_key: str = "all", since: str | None = None, until: str | None = None) -> int:
+        """Event count from the per-day rollup (day granularity for since/until)."""
+        return count_in_days(self.event_days, get_date_range(range_key), range_key, since, until)
+
+    def count_skill(
+        self, skill_name: str, project_slug: str | None = None,
+        since: str | None = None, until: str | None = None,
+    ) -> int:
+        """Invocation count for one skill from the per-day rollup."""
+        day_counts = {}
+        for date, day in self.skill_days.items():
+            for (name, project), count in day.items():
+                if name == skill_name and (not project_slug or project == project_slug):
+                    day_counts[date] = day_counts.get(date, 0) + count
+        return count_in_days(day_counts, None, "all", since, until)
+
+    def budget_state(self, budget_config: dict) -> dict:
+        """Same payload as build_budget_state."""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        ceiling = budget_config.get("daily_token_budget", 1000000)
+        consumed = self.budget.get(today, 0)
+        ratio = consumed / ceiling if ceiling > 0 else 0.0
+        return {
+            "consumed": consumed,
+            "ceiling": ceiling,
+            "ratio": round(ratio, 4),
+            "warning_threshold": budget_config.get("warning_threshold", 0.75),
+            "critical_threshold": budget_config.get("critical_threshold", 0.90),
+        }
 
-    agents = await build_agents_state(db)
-    budget = await build_budget_state(db, budget_config)
-    recent_events = await build_recent_events(db)
-    totals = await build_totals(db)
-    context_window = await build_context_window_state(db)
-    skill_heatmap = await build_skill_heatmap(db)
+    def context_window_state(self) -> dict:
+        """Same payload as build_context_window_state."""
+        result = dict(self.context_window) if self.context_window else {
+            "context_used": 0,
+            "context_max": 200000,
+            "context_remaining": 200000,
+            "model_id": "",
+        }
+        if self.context_breakdown:
+            result["breakdown"] = dict(self.context_breakdown)
+        return result
 
-    return {
-        "agents": agents,
-        "budget": budget,
-        "recent_events": recent_events,
-        "totals": totals,
-        "context_window": context_window,
-        "skill_heatmap": skill_heatmap,
-    }
+    def skill_heatmap(self, range_key: str = "all", project_slug: str | None = None) -> dict:
+        """Same payload as build_skill_heatmap."""
+        now = datetime.now(timezone.utc)
+        today = now.strftime("%Y-%m-%d")
+        week_ago = (now - timedelta(days=7)).strftime("%Y-%m-%d")
+        skills: dict[str, int] = {}
+        for date, day in self.skill_days.items():
+            if range_key == "today" and date != today:
+                continue
+            if range_key == "week" and date < week_ago:
+                continue
+            for (skill_name, project), count in day.items():
+                if project_slug and project != project_slug:
+                    continue
+                skills[skill_name] = skills.get(skill_name, 0) + count
+        skills = dict(sorted(skills.items(), key=lambda item: item[1], reverse=True))
+        return {"skills": skills, "total": sum(skills.values())}
 
 
 # ---------------------------------------------------------------------------
@@ -1674,35 +4664,47 @@ async def lifespan(app: FastAPI):
     # Initialize SQLite
     logger.info("Connecting to database: %s", DB_PATH)
     app.state.db = await aiosqlite.connect(DB_PATH)
-    await init_db(app.state.db)
+    if fabric.enabled:
+        # Several worker processes share the file
+        await app.state.db.execute("PRAGMA busy_timeout = 5000")
+        await app.state.db.execute("PRAGMA journal_mode = WAL")
+    # Workers starting together take turns on schema init and file sync
+    async with startup_lock():
+        await init_db(app.state.db)
+
+        # Verify skill_invocations table exists
+        async with app.state.db.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='skill_invocations'"
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row:
+            logger.info("skill_invocations table verified")
+        else:
+            logger.warning("skill_invocations table NOT found after init_db")
 
-    # Verify skill_invocations table exists
-    async with app.state.db.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='skill_invocations'"
-    ) as cursor:
-        row = await cursor.fetchone()
-    if row:
-        logger.info("skill_invocations table verified")
-    else:
-        logger.warning("skill_invocations table NOT found after init_db")
+        # Load budget config
+        app.state.budget_config = load_budget_config()
+        logger.info(
+            "Budget config: ceiling=%d, warn=%.0f%%, crit=%.0f%%",
+            app.state.budget_config["daily_token_budget"],
+            app.state.budget_config["warning_threshold"] * 100,
+            app.state.budget_config["critical_threshold"] * 100,
+        )
 
-    # Load budget config
-    app.state.budget_config = load_budget_config()
-    logger.info(
-        "Budget config: ceiling=%d, warn=%.0f%%, crit=%.0f%%",
-        app.state.budget_config["daily_token_budget"],
-        app.state.budget_config["warning_threshold"] * 100,
-        app.state.budget_config["critical_threshold"] * 100,
-    )
+        # Load initial state from agent-metrics.json
+        await load_metrics_state(app.state.db)
+
+        # Sync from events.jsonl
+        await sync_events_from_file(app.state.db)
 
-    # Load initial state from agent-metrics.json
-    await load_metrics_state(app.state.db)
+        # Backfill context_window from events file if table is empty
+        await backfill_context_window(app.state.db)
 
-    # Sync from events.jsonl
-    await sync_events_from_file(app.state.db)
+    # Resume incremental brain event fetches from the local mirror
+    brain_event_log.since = await brain_event_mirror.load(app.state.db)
 
-    # Backfill context_window from events file if table is empty
-    await backfill_context_window(app.state.db)
+    # Hot aggregates for state reads; SQLite stays the durable store
+    app.state.aggregator = await StateAggregator.load(app.state.db)
 
     # Fetch and cache pricing data
     app.state.pricing, app.state.pricing_source = await fetch_pricing()
@@ -1711,8 +4713,9 @@ async def lifespan(app: FastAPI):
 
     # Initialize brain proxy client
     app.state.brain_config = load_brain_config()
+    app.state.brain_snapshot = BrainSnapshot()
     app.state.brain_client = (
-        httpx.AsyncClient(timeout=10.0)
+        http_clients.request
         if app.state.brain_config.get("url")
         else None
     )
@@ -1721,43 +4724,210 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Brain proxy disabled (no URL configured)")
 
-    # Start file watcher background task
-    watcher_task = asyncio.create_task(watch_events_file(app))
+    # Start background tasks. The watcher, brain poller and SSE bridge run
+    # in one worker only: directly when single-worker, else in the elected
+    # leader, with every worker joining the fabric.
     pricing_task = asyncio.create_task(refresh_pricing_periodically(app))
-    brain_task = asyncio.create_task(poll_brain(app))
-    sse_bridge_task = asyncio.create_task(stream_brain_events(app))
+    app.state.leader_lock = LeaderLock(LEADER_LOCK_FILE)
+    app.state.leader_tasks = []
+    fabric_tasks = []
+    if fabric.enabled:
+        register_fabric_handlers(app)
+        fabric_tasks = [
+            asyncio.create_task(fabric.run_client()),
+            asyncio.create_task(run_leader_election(app)),
+            asyncio.create_task(report_brain_interest()),
+        ]
+    else:
+        app.state.leader_tasks.extend(start_leader_tasks(app))
 
     logger.info("Crimson Arena server ready")
 
     yield
 
     # Shutdown
-    watcher_task.cancel()
-    pricing_task.cancel()
-    brain_task.cancel()
-    sse_bridge_task.cancel()
-    try:
-        await watcher_task
-    except asyncio.CancelledError:
-        pass
-    try:
-        await pricing_task
-    except asyncio.CancelledError:
-        pass
-    try:
-        await brain_task
-    except asyncio.CancelledError:
-        pass
-    try:
-        await sse_bridge_task
-    except asyncio.CancelledError:
-        pass
-    if app.state.brain_client:
-        await app.state.brain_client.aclose()
+    background = [pricing_task, *fabric_tasks, *app.state.leader_tasks]
+    for task in background:
+        task.cancel()
+    for task in background:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await fabric.close()
+    app.state.leader_lock.release()
+    await http_clients.close()
+    await manager.shutdown()
+    await knowledge_store.close()
     await app.state.db.close()
     logger.info("Crimson Arena server stopped")
 
 
+# ---------------------------------------------------------------------------
+# Response Compression
+# ---------------------------------------------------------------------------
+
+compression_stats = {
+    "br": {"responses": 0, "bytes_in": 0, "bytes_out": 0},
+    "gzip": {"responses": 0, "bytes_in": 0, "bytes_out": 0},
+    "identity": {"responses": 0, "bytes_in": 0, "bytes_out": 0},
+}
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Accept-Encoding header -> {content-coding: q}."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported content-coding from an Accept-Encoding header."""
+    accepted = parse_accept_encoding(accept_encoding)
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def etag_for_encoding(etag: str, encoding: str) -> str:
+    """ETag for another content-coding of the same resource: ``"tag-br"``."""
+    prefix = "W/" if etag.startswith("W/") else ""
+    tag = etag.removeprefix("W/").strip('"')
+    return f'{prefix}"{tag}-{encoding}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(part.strip().removeprefix("W/") == wanted for part in if_none_match.split(","))
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def _record_compression(encoding: str, bytes_in: int, bytes_out: int):
+    stats = compression_stats[encoding]
+    stats["responses"] += 1
+    stats["bytes_in"] += bytes_in
+    stats["bytes_out"] += bytes_out
+
+
+def build_compression_stats() -> dict:
+    """Compression counters with per-encoding ratios for the metrics endpoint."""
+    result = {}
+    for encoding, stats in compression_stats.items():
+        ratio = stats["bytes_out"] / stats["bytes_in"] if stats["bytes_in"] else None
+        result[encoding] = {**stats, "ratio": round(ratio, 4) if ratio is not None else None}
+    result["min_size"] = COMPRESS_MIN_SIZE
+    result["thread_min_size"] = COMPRESS_THREAD_MIN_SIZE
+    result["gzip_level"] = GZIP_LEVEL
+    result["brotli_quality"] = BROTLI_QUALITY if brotli is not None else None
+    result["ws_per_message_deflate"] = WS_PER_MESSAGE_DEFLATE
+    return result
+
+
+class JSONCompressionMiddleware:
+    """Compress JSON responses with br/gzip based on Accept-Encoding.
+
+    Only single-message ``application/json`` bodies at or above
+    ``minimum_size`` are compressed; everything else (streamed bodies,
+    static files, responses that already carry a Content-Encoding)
+    passes through untouched. Bodies of ``thread_min_size`` or more are
+    compressed off the event loop. A compressed body's ETag is made weak,
+    since the bytes differ from the identity representation.
+    """
+
+    def __init__(
+        self, app, minimum_size: int = COMPRESS_MIN_SIZE,
+        thread_min_size: int = COMPRESS_THREAD_MIN_SIZE,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_min_size = thread_min_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or not content_type.startswith("application/json"):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if message.get("more_body", False):
+                # Streamed (StreamingResponse etc.): forward chunks as they come
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if len(body) < self.minimum_size:
+                _record_compression("identity", len(body), len(body))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            if len(body) >= self.thread_min_size:
+                compressed = await asyncio.to_thread(compress_body, body, encoding)
+            else:
+                compressed = compress_body(body, encoding)
+            _record_compression(encoding, len(body), len(compressed))
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = "W/" + etag
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+
 # ---------------------------------------------------------------------------
 # FastAPI Application
 # ---------------------------------------------------------------------------
@@ -1774,7 +4944,9 @@ app.add_middleware(
     allow_origins=["http://127.0.0.1:8001", "http://localhost:8001"],
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Before-Id"],
 )
+app.add_middleware(JSONCompressionMiddleware, minimum_size=COMPRESS_MIN_SIZE)
 
 
 # ---------------------------------------------------------------------------
@@ -1804,6 +4976,26 @@ class AgentEvent(BaseModel):
     context_breakdown: Optional[dict] = None
 
 
+# Upper bound on sub-requests in one POST /api/batch.
+BATCH_MAX_REQUESTS = 20
+# Per sub-request time limit; a slow one gets 504 without holding up the rest.
+BATCH_TIMEOUT = 10.0
+# Routes that never finish (streams) or would recurse.
+BATCH_EXCLUDED_PATHS = ("/api/batch", "/api/brain/events/stream")
+
+
+class BatchSubRequest(BaseModel):
+    """One GET inside a batch: an /api/ path plus optional query params."""
+
+    path: str = Field(..., pattern="^/api/")
+    params: Optional[dict[str, str | int | float | bool]] = None
+    id: Optional[str] = None
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchSubRequest] = Field(..., min_length=1, max_length=BATCH_MAX_REQUESTS)
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -1832,7 +5024,9 @@ async def get_state(range: str = Query(default="today", pattern="^(today|week|al
 async def get_agents(range: str = Query(default="today", pattern="^(today|week|all)$")):
     """Agent summary with levels and RPG stats, filtered by time range."""
     db = app.state.db
-    if range == "all":
+    if app.state.aggregator is not None:
+        agents = app.state.aggregator.agents_state(range)
+    elif range == "all":
         agents = await build_agents_state(db)
     else:
         agents = await build_filtered_agents_state(db, range)
@@ -1842,8 +5036,9 @@ async def get_agents(range: str = Query(default="today", pattern="^(today|week|a
 @app.get("/api/budget")
 async def get_budget():
     """Today's budget consumption vs ceiling."""
-    db = app.state.db
-    budget = await build_budget_state(db, app.state.budget_config)
+    if app.state.aggregator is not None:
+        return JSONResponse(app.state.aggregator.budget_state(app.state.budget_config))
+    budget = await build_budget_state(app.state.db, app.state.budget_config)
     return JSONResponse(budget)
 
 
@@ -1851,14 +5046,43 @@ async def get_budget():
 async def get_events(
     limit: int = Query(default=50, ge=1, le=500),
     range: str = Query(default="today", pattern="^(today|week|all)$"),
+    since: Optional[str] = Query(default=None, max_length=40),
+    until: Optional[str] = Query(default=None, max_length=40),
+    before_id: Optional[str] = Query(default=None, max_length=200),
 ):
-    """Recent events filtered by time range."""
+    """Recent events filtered by time range, newest first.
+
+    Paging is keyset based: pass the ``X-Next-Before-Id`` response header
+    back as ``before_id`` to fetch the next page. ``X-Total-Count`` comes
+    from the per-day rollup (day granularity when since/until are set).
+    """
     db = app.state.db
-    if range == "all":
-        events = await build_recent_events(db, limit=limit)
+    aggregator = app.state.aggregator
+    since = parse_timestamp_param(since, "since")
+    until = parse_timestamp_param(until, "until")
+    cursor_id = decode_cursor(before_id, (int,))[0] if before_id else None
+
+    page = None
+    if aggregator is not None and not (since or until or before_id):
+        page = aggregator.recent_events_page(range, limit=limit)
+    if page is None:
+        page = await query_events(
+            db, range, limit=limit, since=since, until=until, before_id=cursor_id,
+        )
+    events, next_before_id = page
+
+    if aggregator is not None:
+        total = aggregator.count_events(range, since=since, until=until)
     else:
-        events = await build_filtered_recent_events(db, range, limit=limit)
-    return JSONResponse(events)
+        clauses, params = build_events_where(range, since, until)
+        async with db.execute(f"SELECT COUNT(*) FROM events WHERE 1=1 {clauses}", params) as cur:
+            row = await cur.fetchone()
+        total = row[0] if row else 0
+
+    headers = {"X-Total-Count": str(total)}
+    if next_before_id is not None:
+        headers["X-Next-Before-Id"] = encode_cursor(next_before_id)
+    return JSONResponse(events, headers=headers)
 
 
 @app.get("/api/pricing")
@@ -1874,26 +5098,80 @@ async def get_pricing():
     })
 
 
+@app.post("/api/batch")
+async def batch(request: Request, body: BatchRequest):
+    """Run several GET /api/ requests concurrently and return every result.
+
+    Sub-requests go through the app in-process, so brain reads share
+    ``brain_cache`` and single-flight with everything else. Each result
+    carries its own status; one failing sub-request does not fail the
+    batch.
+    """
+    for sub in body.requests:
+        path = sub.path.split("?", 1)[0]
+        if ".." in path or path.rstrip("/") in BATCH_EXCLUDED_PATHS:
+            raise HTTPException(status_code=400, detail=f"Path not allowed in batch: {sub.path}")
+
+    async def run(client: httpx.AsyncClient, sub: BatchSubRequest) -> dict:
+        result = {"id": sub.id, "path": sub.path}
+        try:
+            async with asyncio.timeout(BATCH_TIMEOUT):
+                resp = await client.get(sub.path, params=sub.params)
+        except TimeoutError:
+            return {**result, "status": 504, "body": {"detail": "Sub-request timed out"}}
+        except Exception as exc:
+            logger.warning("Batch sub-request %s failed: %s", sub.path, exc)
+            return {**result, "status": 500, "body": {"detail": "Internal Server Error"}}
+        result["status"] = resp.status_code
+        if "age" in resp.headers:
+            result["age"] = int(resp.headers["age"])
+        try:
+            result["body"] = resp.json()
+        except ValueError:
+            result["body"] = resp.text
+        return result
+
+    # A raising route becomes its own 500 instead of failing the batch
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://batch", headers={"Accept-Encoding": "identity"},
+    ) as client:
+        results = await asyncio.gather(*(run(client, sub) for sub in body.requests))
+    return JSONResponse({"responses": results})
+
+
+@app.get("/api/server-metrics")
+async def get_server_metrics():
+    """Dashboard server performance counters."""
+    return JSONResponse(build_server_metrics(app))
+
+
+@app.get("/api/debug/brain-schedule")
+async def get_brain_schedule():
+    """Live brain polling schedule: interval, state and watchers per resource."""
+    return JSONResponse(brain_scheduler.describe())
+
+
 # ---------------------------------------------------------------------------
 # Brain Proxy Endpoints
 # ---------------------------------------------------------------------------
 
 
 @app.get("/api/brain/health")
-async def brain_health(request: Request):
+async def brain_health(request: Request, response: Response):
     """Check brain server health and return stats."""
-    health = await brain_request(request.app, "/health")
-    stats = await brain_request(request.app, "/api/brain-stats")
+    health = await brain_request(request.app, "/health", response=response)
+    stats = await brain_request(request.app, "/api/brain-stats", response=response)
     if not health and not stats:
         return {"status": "offline", "message": "Brain server unreachable"}
     return {**(health or {}), **(stats or {}), "status": "ok"}
 
 
 @app.get("/api/brain/instances")
-async def brain_instances(request: Request):
+async def brain_instances(request: Request, response: Response):
     """List active Claude Code instances from brain server."""
     data = await brain_request(
-        request.app, "/api/instances", params={"include_stale": "false"}
+        request.app, "/api/instances", params={"include_stale": "false"}, response=response,
     )
     if data is None:
         return {"instances": [], "count": 0, "status": "offline"}
@@ -1901,14 +5179,14 @@ async def brain_instances(request: Request):
 
 
 @app.get("/api/brain/instances/{instance_id}")
-async def brain_instance_detail(instance_id: str, request: Request):
+async def brain_instance_detail(instance_id: str, request: Request, response: Response):
     """Get detail for a specific instance from brain server.
 
     Proxies to the brain server's instance endpoint. Returns 404 if
     the brain server is unreachable or the instance is not found.
     """
     data = await brain_request(
-        request.app, f"/api/instances/{instance_id}"
+        request.app, f"/api/instances/{instance_id}", response=response,
     )
     if data is None:
         raise HTTPException(status_code=404, detail="Instance not found or brain offline")
@@ -1916,9 +5194,9 @@ async def brain_instance_detail(instance_id: str, request: Request):
 
 
 @app.get("/api/brain/projects")
-async def brain_projects(request: Request):
+async def brain_projects(request: Request, response: Response):
     """List registered projects from brain server."""
-    data = await brain_request(request.app, "/api/projects")
+    data = await brain_request(request.app, "/api/projects", response=response)
     if data is None:
         return {"projects": [], "count": 0, "status": "offline"}
     return data
@@ -1927,6 +5205,7 @@ async def brain_projects(request: Request):
 @app.get("/api/brain/briefs")
 async def brain_briefs(
     request: Request,
+    response: Response,
     status: Optional[Literal["Ready", "In Progress", "Done", "Blocked", "Draft"]] = None,
     project: Optional[str] = Query(default=None, min_length=1, max_length=100),
 ):
@@ -1937,7 +5216,7 @@ async def brain_briefs(
     if project:
         params["project"] = project
     data = await brain_request(
-        request.app, "/api/briefs", params=params if params else None
+        request.app, "/api/briefs", params=params if params else None, response=response,
     )
     if data is None:
         return {"briefs": [], "summary": {}, "count": 0, "status": "offline"}
@@ -1945,14 +5224,14 @@ async def brain_briefs(
 
 
 @app.get("/api/brain/sessions")
-async def brain_sessions(request: Request, days: int = Query(default=7, ge=1, le=365)):
+async def brain_sessions(request: Request, response: Response, days: int = Query(default=7, ge=1, le=365)):
     """List recent sessions from brain server."""
     data = await brain_request(
-        request.app, "/api/sessions", params={"days": str(days)}
+        request.app, "/api/sessions", params={"days": str(days)}, response=response, raw=True,
     )
     if data is None:
         return {"sessions": [], "count": 0, "status": "offline"}
-    return data
+    return passthrough_response(request, data, response)
 
 
 @app.get("/api/sync-status")
@@ -1962,9 +5241,9 @@ async def get_sync_status(request: Request):
 
 
 @app.get("/api/brain/instances/{instance_id}/agents")
-async def brain_instance_agents(instance_id: str, request: Request):
+async def brain_instance_agents(instance_id: str, request: Request, response: Response):
     """Per-instance aggregated agent stats from brain server."""
-    data = await brain_request(request.app, f"/api/instances/{instance_id}/agents")
+    data = await brain_request(request.app, f"/api/instances/{instance_id}/agents", response=response)
     if data is None:
         return {"instance_id": instance_id, "agents": [], "status": "offline"}
     return data
@@ -1974,22 +5253,24 @@ async def brain_instance_agents(instance_id: str, request: Request):
 async def brain_instance_log(
     instance_id: str,
     request: Request,
+    response: Response,
     limit: int = Query(default=50, ge=1, le=500),
 ):
     """Per-instance execution event log from brain server."""
     data = await brain_request(
         request.app,
         f"/api/instances/{instance_id}/log",
-        params={"limit": str(limit)},
+        params={"limit": str(limit)}, response=response, raw=True,
     )
     if data is None:
         return {"instance_id": instance_id, "events": [], "count": 0, "status": "offline"}
-    return data
+    return passthrough_response(request, data, response)
 
 
 @app.get("/api/brain/agent-metrics/summary")
 async def brain_agent_metrics_summary(
     request: Request,
+    response: Response,
     project_slug: str = Query(default=None),
 ):
     """Cross-instance agent performance summary from brain server.
@@ -2002,7 +5283,7 @@ async def brain_agent_metrics_summary(
     data = await brain_request(
         request.app,
         "/api/agent-metrics/summary",
-        params=params if params else None,
+        params=params if params else None, response=response,
     )
     if data is None:
         return {"agents": [], "recent_by_agent": {}, "status": "offline"}
@@ -2012,13 +5293,14 @@ async def brain_agent_metrics_summary(
 @app.get("/api/brain/agent-metrics/by-project")
 async def brain_agent_metrics_by_project(
     request: Request,
+    response: Response,
     agent: str = Query(..., min_length=1),
 ):
     """Per-project token/duration breakdown for a single agent."""
     data = await brain_request(
         request.app,
         "/api/agent-metrics/by-project",
-        params={"agent": agent},
+        params={"agent": agent}, response=response,
     )
     if data is None:
         return {"agent": agent, "projects": [], "status": "offline"}
@@ -2040,6 +5322,7 @@ async def get_brain_knowledge():
 @app.get("/api/brain/events")
 async def brain_events(
     request: Request,
+    response: Response,
     event_name: str = Query(default=None),
     component: str = Query(default=None),
     project: str = Query(default=None),
@@ -2048,28 +5331,64 @@ async def brain_events(
     until: str = Query(default=None),
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    before_id: int = Query(default=None),
 ):
-    """Proxy to brain /api/events with optional filters."""
-    params = {}
-    if event_name is not None:
-        params["event_name"] = event_name
-    if component is not None:
-        params["component"] = component
-    if project is not None:
-        params["project"] = project
-    if instance_id is not None:
-        params["instance_id"] = instance_id
+    """Brain events with optional filters, served from the local mirror.
+
+    Ranges the mirror does not fully hold are proxied to brain
+    /api/events; if the brain is unreachable the mirror's partial
+    answer is returned instead. ``before_id`` pages by keyset (pass the
+    last ``id`` of the previous page; ``next_before_id`` in the reply).
+    """
+    filters = {
+        "event_name": event_name,
+        "component": component,
+        "project": project,
+        "instance_id": instance_id,
+    }
+    db = request.app.state.db
+    rows, total, complete = await brain_event_mirror.query(
+        db, filters, since, until, limit, offset, before_id,
+    )
+    local = {
+        "events": rows,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_before_id": rows[-1]["id"] if len(rows) == limit else None,
+        "source": "mirror",
+    }
+    if complete:
+        brain_event_mirror.served_local += 1
+        return local
+    # Past the mirrored range the local count is not the real total
+    partial = {**local, "total": None, "partial": True}
+
+    params = {name: value for name, value in filters.items() if value is not None}
     if since is not None:
         params["since"] = since
     if until is not None:
         params["until"] = until
+
+    if len(rows) == limit or before_id is not None:
+        # The page itself is right (or only pageable locally: the brain
+        # has no keyset paging); only the total comes from the brain
+        brain_event_mirror.served_local += 1
+        counted = await brain_request(
+            request.app, "/api/events", params={**params, "limit": "1", "offset": "0"}, response=response,
+        )
+        if counted is None or not isinstance(counted.get("total"), int):
+            return partial
+        return {**local, "total": counted["total"]}
+
     params["limit"] = str(limit)
     params["offset"] = str(offset)
-
-    data = await brain_request(request.app, "/api/events", params=params)
+    data = await brain_request(request.app, "/api/events", params=params, response=response, raw=True)
     if data is None:
-        return {"events": [], "total": 0, "limit": limit, "offset": offset}
-    return data
+        brain_event_mirror.served_local += 1
+        return partial
+    brain_event_mirror.served_upstream += 1
+    return passthrough_response(request, data, response)
 
 
 @app.get("/api/brain/events/stream")
@@ -2078,37 +5397,29 @@ async def brain_events_stream(
     component: str = Query(default=None),
     project: str = Query(default=None),
 ):
-    """SSE proxy to brain /api/events/stream."""
+    """Brain event stream (SSE), filtered by component and project."""
     brain_config = request.app.state.brain_config
     if not brain_config.get("url") or not request.app.state.brain_client:
         async def offline_generator():
             yield "data: {\"status\": \"offline\", \"message\": \"Brain server not configured\"}\n\n"
         return StreamingResponse(offline_generator(), media_type="text/event-stream")
 
-    url = f"{brain_config['url'].rstrip('/')}/api/events/stream"
-    headers = {}
-    if brain_config.get("api_key"):
-        headers["Authorization"] = f"Bearer {brain_config['api_key']}"
-    params = {}
-    if component is not None:
-        params["component"] = component
-    if project is not None:
-        params["project"] = project
+    # Served from the shared upstream held by stream_brain_events; no
+    # per-subscriber brain connection. Reconnects send Last-Event-ID.
+    sub = sse_hub.subscribe(component, project, request.headers.get("last-event-id"))
 
     async def event_generator():
         try:
-            async with httpx.AsyncClient(timeout=None) as client:
-                async with client.stream("GET", url, headers=headers, params=params) as resp:
-                    if resp.status_code != 200:
-                        yield f"data: {{\"status\": \"error\", \"code\": {resp.status_code}}}\n\n"
-                        return
-                    async for line in resp.aiter_lines():
-                        if await request.is_disconnected():
-                            break
-                        yield f"{line}\n"
-        except Exception as exc:
-            logger.warning("Brain SSE proxy error: %s", exc)
-            yield f"data: {{\"status\": \"error\", \"message\": \"Connection lost\"}}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    async with asyncio.timeout(SSE_KEEPALIVE):
+                        event_id, event = await sub.queue.get()
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"id: {event_id}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            sse_hub.unsubscribe(sub)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -2116,6 +5427,7 @@ async def brain_events_stream(
 @app.get("/api/brain/tasks")
 async def brain_tasks(
     request: Request,
+    response: Response,
     status: str = Query(default=None),
     task_type: str = Query(default=None),
     project_slug: str = Query(default=None),
@@ -2139,16 +5451,16 @@ async def brain_tasks(
     params["limit"] = str(limit)
     params["offset"] = str(offset)
 
-    data = await brain_request(request.app, "/api/tasks", params=params)
+    data = await brain_request(request.app, "/api/tasks", params=params, response=response, raw=True)
     if data is None:
         return {"tasks": [], "total": 0, "limit": limit, "offset": offset, "summary": {}}
-    return data
+    return passthrough_response(request, data, response)
 
 
 @app.get("/api/brain/projects/{slug}/budget")
-async def brain_project_budget(slug: str, request: Request):
+async def brain_project_budget(slug: str, request: Request, response: Response):
     """Per-project budget with cost enrichment from cached pricing."""
-    data = await brain_request(request.app, f"/api/projects/{slug}/budget")
+    data = await brain_request(request.app, f"/api/projects/{slug}/budget", response=response)
     if data is None:
         return {
             "project_slug": slug,
@@ -2239,20 +5551,38 @@ async def brain_project_budget_set(slug: str, request: Request):
     )
     if data is None:
         raise HTTPException(status_code=502, detail="Brain server unreachable")
+    brain_cache.invalidate(f"/api/projects/{slug}/budget")
     return data
 
 
 @app.get("/api/skills")
 async def get_skills(range: str = "all", project: str = None):
     """Skill invocation heatmap data, optionally filtered by project slug."""
+    if app.state.aggregator is not None and range in ("today", "week", "all"):
+        return JSONResponse(app.state.aggregator.skill_heatmap(range, project_slug=project))
     db = app.state.db
     return JSONResponse(await build_skill_heatmap(db, range, project_slug=project))
 
 
 @app.get("/api/skills/{skill_name}/usage")
-async def get_skill_usage(skill_name: str, project: str = None, limit: int = 20):
-    """Recent invocations for a specific skill, optionally filtered by project."""
+async def get_skill_usage(
+    skill_name: str,
+    project: str = None,
+    limit: int = Query(default=20, ge=1, le=500),
+    since: Optional[str] = Query(default=None, max_length=40),
+    until: Optional[str] = Query(default=None, max_length=40),
+    before_id: Optional[str] = Query(default=None, max_length=200),
+):
+    """Recent invocations for a specific skill, optionally filtered by project.
+
+    Keyset paged on (ts, id): pass ``next_before_id`` from the response as
+    ``before_id`` to continue. ``total`` comes from the aggregator's
+    per-day rollup when available (day granularity for since/until).
+    """
     db = app.state.db
+    since = parse_timestamp_param(since, "since")
+    until = parse_timestamp_param(until, "until")
+    cursor_ts, cursor_id = decode_cursor(before_id, (str, int)) if before_id else (None, None)
     try:
         where_clauses = ["skill_name = ?"]
         params: list = [skill_name]
@@ -2260,37 +5590,56 @@ async def get_skill_usage(skill_name: str, project: str = None, limit: int = 20)
         if project:
             where_clauses.append("project_slug = ?")
             params.append(project)
+        if since:
+            where_clauses.append("ts >= ?")
+            params.append(since)
+        if until:
+            where_clauses.append("ts < ?")
+            params.append(until)
+        filter_sql = " WHERE " + " AND ".join(where_clauses)
+        filter_params = list(params)
+
+        if cursor_ts is not None:
+            where_clauses.append("(ts < ? OR (ts = ? AND id < ?))")
+            params.extend([cursor_ts, cursor_ts, cursor_id])
 
         where_sql = " WHERE " + " AND ".join(where_clauses)
-        params.append(limit)
+        params.append(limit + 1)
 
         cursor = await db.execute(
-            f"SELECT ts, session_date, project_slug FROM skill_invocations{where_sql} ORDER BY ts DESC LIMIT ?",
+            f"SELECT ts, session_date, project_slug, id FROM skill_invocations{where_sql} "
+            "ORDER BY ts DESC, id DESC LIMIT ?",
             params,
         )
         rows = await cursor.fetchall()
         invocations = [
             {"ts": r[0], "session_date": r[1], "project_slug": r[2]}
-            for r in rows
+            for r in rows[:limit]
         ]
-
-        # Total count for this skill (with same filters minus limit).
-        count_params = params[:-1]  # exclude limit
-        count_cursor = await db.execute(
-            f"SELECT COUNT(*) FROM skill_invocations{where_sql}",
-            count_params,
+        next_before_id = (
+            encode_cursor(rows[limit - 1][0], rows[limit - 1][3]) if len(rows) > limit else None
         )
-        count_row = await count_cursor.fetchone()
-        total = count_row[0] if count_row else 0
+
+        aggregator = app.state.aggregator
+        if aggregator is not None:
+            total = aggregator.count_skill(skill_name, project, since=since, until=until)
+        else:
+            count_cursor = await db.execute(
+                f"SELECT COUNT(*) FROM skill_invocations{filter_sql}",
+                filter_params,
+            )
+            count_row = await count_cursor.fetchone()
+            total = count_row[0] if count_row else 0
 
         return JSONResponse({
             "skill_name": skill_name,
             "total": total,
             "invocations": invocations,
+            "next_before_id": next_before_id,
         })
     except Exception as exc:
         logger.warning("get_skill_usage failed: %s", exc)
-        return JSONResponse({"skill_name": skill_name, "total": 0, "invocations": []})
+        return JSONResponse({"skill_name": skill_name, "total": 0, "invocations": [], "next_before_id": None})
 
 
 @app.post("/api/event")
@@ -2304,7 +5653,7 @@ async def post_event(event: AgentEvent):
     event_dict = event.model_dump()
 
     try:
-        await insert_event(db, event_dict)
+        await insert_event(db, event_dict, app.state.aggregator)
     except Exception as exc:
         logger.error("Failed to insert event: %s", exc)
         return JSONResponse(
@@ -2332,80 +5681,98 @@ async def post_event(event: AgentEvent):
     return JSONResponse({"status": "ok"})
 
 
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time dashboard updates.
-
-    On connect: sends full state as initial message.
-    On events: receives broadcasts from the ConnectionManager.
-    """
-    await manager.connect(websocket)
+BRAIN_STATE_SECTIONS = ("health", "instances", "projects", "briefs", "sessions")
 
-    try:
-        # Send full state as initial bootstrap payload
-        state = await build_filtered_state(app, range_key="today")
-        await websocket.send_json({"type": "state", "data": state})
 
-        # Send initial brain state if brain is configured
-        if app.state.brain_config.get("url"):
-            try:
-                health = await brain_request(app, "/health")
-                stats = await brain_request(app, "/api/brain-stats")
-                instances = await brain_request(
-                    app, "/api/instances", params={"include_stale": "false"}
-                )
-                projects = await brain_request(app, "/api/projects")
-                briefs = await brain_request(app, "/api/briefs")
-                sessions = await brain_request(
-                    app, "/api/sessions", params={"days": "7"},
-                )
-                await websocket.send_json({
-                    "type": "brain_state",
-                    "data": {
-                        "health": {**(health or {}), **(stats or {})},
-                        "instances": instances,
-                        "projects": projects,
-                        "briefs": briefs,
-                        "sessions": sessions,
-                    },
-                })
-            except Exception as exc:
-                logger.warning("Failed to send initial brain state: %s", exc)
+def build_brain_state_message(snapshot: BrainSnapshot) -> dict | None:
+    """Composite brain_state message from the snapshot; None while it is empty."""
+    if not any(snapshot.get(name) for name in BRAIN_STATE_SECTIONS):
+        return None
+    return {
+        "type": "brain_state",
+        "data": {name: snapshot.get(name) or ({} if name == "health" else None)
+                 for name in BRAIN_STATE_SECTIONS},
+        "age": snapshot.ages(*BRAIN_STATE_SECTIONS),
+    }
 
-        # Send initial new section data
-        try:
-            sync_data = await build_sync_status(app)
-            await websocket.send_json({"type": "sync_status", "data": sync_data})
-        except Exception:
-            pass
 
+async def send_ws_bootstrap(websocket: WebSocket, client: ClientConnection):
+    """Queue the initial sections a freshly connected client subscribes to."""
+    # Send full state as initial bootstrap payload
+    if client.wants("state"):
+        state = await build_filtered_state(app, range_key="today")
+        manager.send(websocket, {"type": "state", "data": state})
+
+    # Brain sections come from the poll_brain snapshot: no upstream calls,
+    # each tagged with its age in seconds
+    snapshot = getattr(app.state, "brain_snapshot", None)
+    if snapshot is None:
+        snapshot = BrainSnapshot()
+    if client.wants("brain_state"):
+        message = build_brain_state_message(snapshot)
+        if message is not None:
+            manager.send(websocket, message)
+
+    # Send initial new section data
+    if client.wants("sync_status"):
+        sync_data = cached_sync_status(snapshot)
+        manager.send(websocket, {"type": "sync_status", "data": sync_data, "age": snapshot.age("sync")})
+
+    if client.wants("team_status"):
         try:
             team_data = build_team_status()
-            await websocket.send_json({"type": "team_status", "data": team_data})
+            manager.send(websocket, {"type": "team_status", "data": team_data})
         except Exception:
             pass
 
+    if client.wants("brain_knowledge"):
         try:
             knowledge_data = await build_knowledge_state()
-            await websocket.send_json({"type": "brain_knowledge", "data": knowledge_data})
+            manager.send(websocket, {"type": "brain_knowledge", "data": knowledge_data})
         except Exception:
             pass
 
-        # Send initial brain events (last 50)
-        try:
-            brain_events_data = await brain_request(app, "/api/events", params={"limit": "50"})
-            if brain_events_data:
-                await websocket.send_json({"type": "brain_events", "data": brain_events_data})
-        except Exception as exc:
-            logger.warning("Failed to send brain events: %s", exc)
+    # Send initial brain events (last 50) and tasks
+    for topic, section in (("brain_events", "events"), ("brain_tasks", "tasks")):
+        if client.wants(topic) and snapshot.get(section):
+            manager.send_snapshot(websocket, topic, age=snapshot.age(section))
 
-        # Send initial brain tasks
-        try:
-            brain_tasks_data = await brain_request(app, "/api/tasks", params={"limit": "100"})
-            if brain_tasks_data:
-                await websocket.send_json({"type": "brain_tasks", "data": brain_tasks_data})
-        except Exception as exc:
-            logger.warning("Failed to send brain tasks: %s", exc)
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    """WebSocket endpoint for real-time dashboard updates.
+
+    On connect: sends the bootstrap sections the client subscribes to.
+    On events: receives matching broadcasts from the ConnectionManager.
+
+    Clients choose topics with ``/ws?topics=event,skill_event&project=x``
+    or at any time with ``{"type": "subscribe", "topics": [...],
+    "filters": {...}}`` / ``{"type": "unsubscribe", "topics": [...]}``.
+    With no subscription every topic is delivered.
+
+    ``?deltas=1`` (or ``"deltas": true`` in a subscribe message) switches
+    brain_instances/brain_tasks/brain_events to ``<topic>_delta`` frames
+    carrying ``base_version``/``version``; ``{"type": "resync"}``
+    requests fresh snapshots.
+
+    The first frame is ``{"type": "hello", "data": {"epoch", "seq",
+    "resumed"}}``. Broadcasts carry a global ``seq``; reconnecting with
+    ``?epoch=E&last_seq=N`` replays the missed frames instead of the
+    bootstrap when the server still has them.
+
+    ``?batch=1`` coalesces event bursts into ``events_batch`` frames
+    (``{"topic", "seq", "data": [...]}``) flushed every
+    DASHBOARD_WS_COALESCE_MS. ``?max_fps=N`` caps the connection at N
+    frames per second across all topics (and stretches the coalescing
+    window to 1/N).
+    """
+    client = await manager.connect(websocket)
+    brain_scheduler.wake()
+
+    try:
+        # A resumed client already got its missed frames from connect()
+        if not client.resumed:
+            await send_ws_bootstrap(websocket, client)
 
         # Keep connection alive; read messages to detect disconnects
         while True:
@@ -2413,14 +5780,45 @@ async def websocket_endpoint(websocket: WebSocket):
             data = await websocket.receive_text()
             # Echo back pong for keepalive (support both raw "ping" and JSON {"type":"ping"})
             if data == "ping":
-                await websocket.send_json({"type": "pong"})
+                manager.send(websocket, {"type": "pong"})
             else:
                 try:
                     parsed = json.loads(data)
-                    if isinstance(parsed, dict) and parsed.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
                 except (json.JSONDecodeError, TypeError):
-                    pass
+                    continue
+                if not isinstance(parsed, dict):
+                    continue
+                msg_type = parsed.get("type")
+                if msg_type == "ping":
+                    manager.send(websocket, {"type": "pong"})
+                elif msg_type in ("subscribe", "unsubscribe"):
+                    if msg_type == "subscribe":
+                        client.subscribe(parsed.get("topics"), parsed.get("filters"))
+                        brain_scheduler.wake()
+                        if "deltas" in parsed:
+                            client.deltas = bool(parsed["deltas"])
+                        if "batch" in parsed or "max_fps" in parsed:
+                            client.set_batching(
+                                parsed.get("batch", client.batch),
+                                parsed.get("max_fps", client.max_fps),
+                            )
+                    else:
+                        client.unsubscribe(parsed.get("topics"))
+                    manager.send(websocket, {
+                        "type": "subscribed",
+                        "data": {
+                            "topics": sorted(client.topics) if client.topics is not None else None,
+                            "filters": client.filters,
+                            "deltas": client.deltas,
+                            "batch": client.batch,
+                            "max_fps": client.max_fps,
+                        },
+                    })
+                elif msg_type == "resync":
+                    # Client lost track of a list topic; resend full snapshots
+                    for topic in parsed.get("topics") or list(DELTA_TOPICS):
+                        if topic in DELTA_TOPICS:
+                            manager.send_snapshot(websocket, topic)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -2457,4 +5855,6 @@ if __name__ == "__main__":
         port=port,
         reload=False,
         log_level="info",
+        workers=WORKERS,
+        ws_per_message_deflate=WS_PER_MESSAGE_DEFLATE,
     )
@@ -1,16 +1,48 @@
 """Tests for BR-021 heatmap no-data fixes in server.py."""
 
 import asyncio
+import json
+import zlib
 import sys
 import os
+from types import SimpleNamespace
 
 import pytest
 import aiosqlite
+from fastapi import Response
 
 # Ensure dashboard package is importable
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from server import SCHEMA_SQL, insert_event, build_skill_heatmap, init_db
+from server import (
+    SCHEMA_SQL,
+    insert_event,
+    build_skill_heatmap,
+    init_db,
+    KnowledgeStore,
+    JSONCompressionMiddleware,
+    negotiate_encoding,
+    SingleFlight,
+    brain_request,
+    StateAggregator,
+    build_agents_state,
+    build_filtered_agents_state,
+    build_totals,
+    build_filtered_totals,
+    build_budget_state,
+    build_context_window_state,
+    build_events_page,
+    get_level,
+    compute_rpg_stats,
+    compute_all_rpg_stats,
+    query_events,
+    decode_cursor,
+    get_events,
+    get_skill_usage,
+    ConnectionManager,
+)
+import server
+from datetime import datetime, timezone, timedelta
 
 
 @pytest.fixture
@@ -167,3 +199,1911 @@ class TestStartupVerification:
             assert row[0] == "skill_invocations"
 
         event_loop.run_until_complete(_test())
+
+
+class TestKnowledgeStore:
+    """Knowledge DB state is cached until the database changes."""
+
+    def _make_db(self, path):
+        import sqlite3
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE learnings (id INTEGER PRIMARY KEY, project TEXT, category TEXT,
+                                    title TEXT, created_at TEXT);
+            CREATE TABLE errors (id INTEGER PRIMARY KEY);
+            INSERT INTO learnings (project, category, title, created_at)
+                VALUES ('arena', 'perf', 'Cache counts', '2026-02-17');
+            """
+        )
+        conn.commit()
+        return conn
+
+    def test_repeated_calls_hit_cache(self, tmp_path, event_loop):
+        path = str(tmp_path / "knowledge.db")
+        self._make_db(path).close()
+        store = KnowledgeStore(path)
+
+        async def _test():
+            first = await store.get_state()
+            second = await store.get_state()
+            await store.close()
+            return first, second
+
+        first, second = event_loop.run_until_complete(_test())
+        assert first == second
+        assert first["status"] == "connected"
+        assert first["learnings_count"] == 1
+        assert first["patterns_count"] == 1
+        assert store.misses == 1
+        assert store.hits == 1
+
+    def test_refreshes_after_external_write(self, tmp_path, event_loop):
+        path = str(tmp_path / "knowledge.db")
+        writer = self._make_db(path)
+        store = KnowledgeStore(path)
+
+        async def _test():
+            before = await store.get_state()
+            writer.execute("INSERT INTO errors DEFAULT VALUES")
+            writer.commit()
+            after = await store.get_state()
+            await store.close()
+            return before, after
+
+        before, after = event_loop.run_until_complete(_test())
+        writer.close()
+        assert before["errors_count"] == 0
+        assert after["errors_count"] == 1
+        assert store.misses == 2
+
+    def test_missing_file_is_unavailable(self, tmp_path, event_loop):
+        store = KnowledgeStore(str(tmp_path / "missing.db"))
+        result = event_loop.run_until_complete(store.get_state())
+        assert result["status"] == "unavailable"
+
+
+class TestJSONCompression:
+    """JSON responses are compressed above the size threshold only."""
+
+    def _client(self, **options):
+        from fastapi import FastAPI
+        from fastapi.responses import JSONResponse, StreamingResponse
+        from fastapi.testclient import TestClient
+
+        mini = FastAPI()
+        mini.add_middleware(JSONCompressionMiddleware, minimum_size=512, **options)
+
+        @mini.get("/big")
+        async def big():
+            return JSONResponse(
+                {"events": [{"agent": "forger", "event": "stop"}] * 200},
+                headers={"ETag": '"events-7"'},
+            )
+
+        @mini.get("/ndjson")
+        async def ndjson():
+            async def gen():
+                for n in range(3):
+                    yield json.dumps({"n": n, "pad": "x" * 1024}) + "\n"
+            return StreamingResponse(gen(), media_type="application/json")
+
+        @mini.get("/small")
+        async def small():
+            return JSONResponse({"status": "ok"})
+
+        @mini.get("/stream")
+        async def stream():
+            async def gen():
+                yield "data: " + "x" * 2048 + "\n\n"
+            return StreamingResponse(gen(), media_type="text/event-stream")
+
+        return TestClient(mini)
+
+    def test_negotiate_prefers_gzip_without_brotli_or_on_q0(self):
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("br;q=0, gzip") == "gzip"
+        assert negotiate_encoding("identity") is None
+
+    def test_large_json_is_gzipped(self):
+        resp = self._client().get("/big", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["vary"]
+        assert len(resp.json()["events"]) == 200
+
+    def test_small_json_is_not_compressed(self):
+        resp = self._client().get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+        assert resp.json() == {"status": "ok"}
+
+    def test_event_stream_passes_through(self):
+        resp = self._client().get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+
+    def test_streamed_json_is_not_buffered(self):
+        resp = self._client().get("/ndjson", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+        assert [json.loads(line)["n"] for line in resp.text.splitlines()] == [0, 1, 2]
+
+    def test_compressed_etag_is_weak(self):
+        client = self._client()
+        assert client.get("/big", headers={"Accept-Encoding": "identity"}).headers["etag"] == '"events-7"'
+        assert client.get("/big", headers={"Accept-Encoding": "gzip"}).headers["etag"] == 'W/"events-7"'
+
+    def test_large_bodies_compress_in_a_thread(self, monkeypatch):
+        threaded = []
+        real_to_thread = asyncio.to_thread
+
+        async def to_thread(fn, *args):
+            threaded.append(fn)
+            return await real_to_thread(fn, *args)
+
+        monkeypatch.setattr(asyncio, "to_thread", to_thread)
+        resp = self._client(thread_min_size=4096).get("/big", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert len(resp.json()["events"]) == 200
+        assert threaded == [server.compress_body]
+
+
+class TestSingleFlight:
+    """Concurrent identical calls share one in-flight computation."""
+
+    def test_concurrent_calls_share_one_execution(self, event_loop):
+        calls = []
+
+        async def slow(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return {"value": value}
+
+        flight = SingleFlight()
+
+        async def _test():
+            return await asyncio.gather(*(flight.do("k", slow, 1) for _ in range(10)))
+
+        results = event_loop.run_until_complete(_test())
+        assert len(calls) == 1
+        assert all(r == {"value": 1} for r in results)
+        assert flight.stats() == {"calls": 1, "shared": 9, "in_flight": 0}
+
+    def test_sequential_calls_are_not_cached(self, event_loop):
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            return len(calls)
+
+        flight = SingleFlight()
+        first = event_loop.run_until_complete(flight.do("k", fn))
+        second = event_loop.run_until_complete(flight.do("k", fn))
+        assert (first, second) == (1, 2)
+
+    def test_brain_requests_coalesce_by_path_and_params(self, event_loop, monkeypatch):
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+
+        class FakeResponse:
+            status_code = 200
+
+            def json(self):
+                return {"ok": True}
+
+        class FakeClient:
+            def __init__(self):
+                self.calls = []
+
+            async def get(self, url, params=None, headers=None):
+                self.calls.append((url, params))
+                await asyncio.sleep(0.01)
+                return FakeResponse()
+
+        client = FakeClient()
+        fake_app = SimpleNamespace(
+            state=SimpleNamespace(brain_config={"url": "http://brain"}, brain_client=client)
+        )
+
+        async def _test():
+            return await asyncio.gather(
+                *(brain_request(fake_app, "/api/tasks", {"limit": "100"}) for _ in range(5)),
+                *(brain_request(fake_app, "/api/events", {"limit": "50"}) for _ in range(5)),
+            )
+
+        results = event_loop.run_until_complete(_test())
+        assert len(client.calls) == 2
+        assert all(r == {"ok": True} for r in results)
+
+
+class TestStateAggregator:
+    """The in-memory aggregator matches the SQL builders."""
+
+    @pytest.fixture(autouse=True)
+    def _no_metrics_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "METRICS_FILE", str(tmp_path / "agent-metrics.json"))
+
+    def _events(self):
+        now = datetime.now(timezone.utc)
+        today = now.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        old = (now - timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        return [
+            {"ts": old, "event": "start", "agent": "forger", "agent_id": "a1"},
+            {"ts": old, "event": "stop", "agent": "forger", "agent_id": "a1",
+             "duration_s": 12.5, "input_tokens": 100, "output_tokens": 50,
+             "cache_read": 10, "cache_create": 5},
+            {"ts": today, "event": "start", "agent": "forger", "agent_id": "a2"},
+            {"ts": today, "event": "stop", "agent": "forger", "agent_id": "a2",
+             "duration_s": 3.0, "input_tokens": 200, "output_tokens": 80,
+             "cache_read": 40, "cache_create": 0},
+            {"ts": today, "event": "start", "agent": "sentinel", "agent_id": "b1"},
+            {"ts": today, "event": "stop", "agent": "orchestrator", "agent_id": "",
+             "input_tokens": 7, "output_tokens": 3, "context_used": 5000,
+             "context_max": 200000, "context_remaining": 195000, "model_id": "opus",
+             "context_breakdown": {"system_prompt": 100, "messages": 400}},
+            {"ts": today, "event": "skill_invoke", "agent": "orchestrator",
+             "skill_name": "/hunt", "project_slug": "arena"},
+            {"ts": old, "event": "skill_invoke", "agent": "orchestrator",
+             "skill_name": "/scan", "project_slug": "other"},
+        ]
+
+    def _assert_matches_sql(self, db, agg, event_loop):
+        async def _sql(range_key):
+            if range_key == "all":
+                agents = await build_agents_state(db)
+                totals = await build_totals(db)
+            else:
+                agents = await build_filtered_agents_state(db, range_key)
+                totals = await build_filtered_totals(db, range_key)
+            return {
+                "agents": agents,
+                "totals": totals,
+                "recent": await build_events_page(db, range_key),
+                "skills": await build_skill_heatmap(db, range_key),
+                "skills_arena": await build_skill_heatmap(db, range_key, project_slug="arena"),
+            }
+
+        budget_config = {"daily_token_budget": 1000}
+        for range_key in ("today", "week", "all"):
+            expected = event_loop.run_until_complete(_sql(range_key))
+            assert agg.agents_state(range_key) == expected["agents"]
+            assert agg.totals(range_key) == expected["totals"]
+            assert agg.recent_events(range_key) == expected["recent"]
+            assert agg.skill_heatmap(range_key) == expected["skills"]
+            assert agg.skill_heatmap(range_key, project_slug="arena") == expected["skills_arena"]
+
+        assert agg.budget_state(budget_config) == event_loop.run_until_complete(
+            build_budget_state(db, budget_config)
+        )
+        assert agg.context_window_state() == event_loop.run_until_complete(
+            build_context_window_state(db)
+        )
+
+    def test_incremental_updates_match_sql(self, db, event_loop):
+        agg = event_loop.run_until_complete(StateAggregator.load(db))
+        for event in self._events():
+            event_loop.run_until_complete(insert_event(db, event, agg))
+        assert agg.active_agents() == {"sentinel"}
+        self._assert_matches_sql(db, agg, event_loop)
+
+    def test_load_from_rollups_matches_sql(self, db, event_loop):
+        for event in self._events():
+            event_loop.run_until_complete(insert_event(db, event))
+        agg = event_loop.run_until_complete(StateAggregator.load(db))
+        self._assert_matches_sql(db, agg, event_loop)
+
+    def test_duplicate_events_are_not_double_counted(self, db, event_loop):
+        agg = event_loop.run_until_complete(StateAggregator.load(db))
+        event = self._events()[3]
+        event_loop.run_until_complete(insert_event(db, event, agg))
+        event_loop.run_until_complete(insert_event(db, event, agg))
+        assert agg.totals("all")["total_invocations"] == 1
+        self._assert_matches_sql(db, agg, event_loop)
+
+    def test_metrics_file_agents_match_sql(self, db, event_loop, tmp_path):
+        with open(server.METRICS_FILE, "w") as f:
+            json.dump({"agents": {
+                "forger": {"invocations": 9, "total_output_tokens": 999, "success_rate": 0.9},
+                "idle": {"invocations": 0},
+            }}, f)
+        agg = event_loop.run_until_complete(StateAggregator.load(db))
+        for event in self._events():
+            event_loop.run_until_complete(insert_event(db, event, agg))
+        self._assert_matches_sql(db, agg, event_loop)
+
+    def test_start_after_restart_for_already_stopped_id_is_inactive(self, db, event_loop):
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        event_loop.run_until_complete(insert_event(
+            db, {"ts": today, "event": "stop", "agent": "forger", "agent_id": "x1"},
+        ))
+        agg = event_loop.run_until_complete(StateAggregator.load(db))
+        event_loop.run_until_complete(insert_event(
+            db, {"ts": today[:-6] + ".5+00:00", "event": "start", "agent": "forger", "agent_id": "x1"}, agg,
+        ))
+        assert agg.active_agents() == set()
+        self._assert_matches_sql(db, agg, event_loop)
+
+    def test_recent_events_use_stored_session_date(self, db, event_loop):
+        agg = event_loop.run_until_complete(StateAggregator.load(db))
+        event_loop.run_until_complete(insert_event(
+            db, {"ts": 1771322400, "event": "start", "agent": "forger"}, agg,
+        ))
+        events = agg.recent_events("today")
+        assert [e["ts"] for e in events] == [1771322400]
+
+    def test_resync_recovers_events_missed_over_the_fabric(self, event_loop, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "DB_PATH", str(tmp_path / "shared.db"))
+        events = self._events()
+
+        async def _setup():
+            conn = await aiosqlite.connect(server.DB_PATH)
+            await conn.executescript(SCHEMA_SQL)
+            await conn.commit()
+            agg = await StateAggregator.load(conn)
+            for event in events[:3]:
+                await insert_event(conn, event, agg)
+            # Written by another worker whose aggregate messages never arrived
+            for event in events[3:]:
+                await insert_event(conn, event)
+            return conn, agg
+
+        conn, agg = event_loop.run_until_complete(_setup())
+        app = SimpleNamespace(state=SimpleNamespace(aggregator=agg, aggregator_resync=asyncio.Lock()))
+        try:
+            event_loop.run_until_complete(server.resync_aggregator(app))
+            assert app.state.aggregator is agg and agg.journal is None
+            self._assert_matches_sql(conn, agg, event_loop)
+        finally:
+            event_loop.run_until_complete(conn.close())
+
+    def test_journaled_events_replay_once_after_resync(self, db, event_loop):
+        events = self._events()
+        agg = event_loop.run_until_complete(StateAggregator.load(db))
+        agg.journal = []
+        for event in events[:4]:
+            event_loop.run_until_complete(insert_event(db, event, agg))
+        fresh = event_loop.run_until_complete(StateAggregator.load(db))
+        # Applied after the resync snapshot was taken
+        for event in events[4:]:
+            event_loop.run_until_complete(insert_event(db, event, agg))
+        agg.replace_with(fresh)
+        assert agg.journal is None
+        self._assert_matches_sql(db, agg, event_loop)
+
+    def test_recent_events_fall_back_when_ring_is_exhausted(self, event_loop):
+        agg = StateAggregator()
+        agg.history_len = agg.RECENT_LIMIT + 10
+        assert agg.recent_events("all", limit=5) is None
+
+
+class TestLevelsAndRpgStats:
+    """Bisect levels and batched RPG stats match the reference definitions."""
+
+    def _reference_level(self, invocations):
+        level = (0, "Trainee", 0)
+        for entry in server.LEVEL_THRESHOLDS:
+            if invocations >= entry[0]:
+                level = entry
+        next_at = next((t for t, _n, _tier in server.LEVEL_THRESHOLDS if t > invocations), None)
+        return level, next_at
+
+    def test_level_boundaries(self):
+        for invocations in [-1, 0, 4, 5, 14, 15, 99, 100, 199, 200, 5000]:
+            (threshold, name, tier), next_at = self._reference_level(invocations)
+            level = get_level(invocations)
+            assert level["name"] == name
+            assert level["tier"] == tier
+            assert level["next_at"] == (next_at if next_at else threshold)
+        assert get_level(10)["progress"] == 0.5
+        assert get_level(500)["progress"] == 1.0
+
+    def _agents(self, count):
+        return {
+            f"agent-{i}": {
+                "total_output_tokens": (i * 7919) % 5000,
+                "avg_duration_seconds": (i * 31) % 97 + 0.5,
+                "total_input_tokens": i * 13,
+                "total_cache_read_tokens": (i * 17) % 300,
+                "total_cache_create_tokens": i % 11,
+                "success_rate": 1.0 - (i % 5) / 10,
+            }
+            for i in range(count)
+        }
+
+    @pytest.mark.parametrize("count", [0, 1, 5, 200])
+    def test_batch_matches_per_agent(self, count):
+        agents = self._agents(count)
+        batch = compute_all_rpg_stats(agents)
+        assert batch == {name: compute_rpg_stats(data, agents) for name, data in agents.items()}
+
+    def test_python_fallback_matches(self, monkeypatch):
+        agents = self._agents(200)
+        expected = compute_all_rpg_stats(agents)
+        monkeypatch.setattr(server, "np", None)
+        server._rpg_cache.clear()
+        assert compute_all_rpg_stats(agents) == expected
+
+
+class TestKeysetPagination:
+    """Events and skill usage page with opaque keyset cursors."""
+
+    def _seed(self, db, event_loop, agg=None):
+        async def _go():
+            for i in range(25):
+                await insert_event(db, {
+                    "ts": f"2026-02-17T10:{i:02d}:00+00:00",
+                    "event": "skill_invoke",
+                    "agent": "orchestrator",
+                    "skill_name": "/hunt",
+                    "project_slug": "arena" if i % 2 else "other",
+                }, agg)
+        event_loop.run_until_complete(_go())
+
+    def _use_state(self, monkeypatch, db, agg):
+        monkeypatch.setattr(server.app.state, "db", db, raising=False)
+        monkeypatch.setattr(server.app.state, "aggregator", agg, raising=False)
+
+    def test_query_events_pages_without_gaps(self, db, event_loop):
+        self._seed(db, event_loop)
+        seen = []
+        before_id = None
+        while True:
+            events, before_id = event_loop.run_until_complete(
+                query_events(db, "all", limit=10, before_id=before_id)
+            )
+            seen.extend(e["ts"] for e in events)
+            if before_id is None:
+                break
+        assert len(seen) == 25
+        assert seen == sorted(seen, reverse=True)
+
+    def test_query_events_since_until(self, db, event_loop):
+        self._seed(db, event_loop)
+        events, next_id = event_loop.run_until_complete(query_events(
+            db, "all", limit=50,
+            since="2026-02-17T10:05:00+00:00", until="2026-02-17T10:10:00+00:00",
+        ))
+        assert [e["ts"][11:16] for e in events] == ["10:09", "10:08", "10:07", "10:06", "10:05"]
+        assert next_id is None
+
+    @pytest.mark.parametrize("use_aggregator", [False, True])
+    def test_events_route_cursor_and_total(self, db, event_loop, monkeypatch, use_aggregator):
+        agg = event_loop.run_until_complete(StateAggregator.load(db)) if use_aggregator else None
+        self._seed(db, event_loop, agg)
+        self._use_state(monkeypatch, db, agg)
+
+        resp = event_loop.run_until_complete(get_events(limit=20, range="all", since=None, until=None, before_id=None))
+        first = json.loads(resp.body)
+        assert len(first) == 20
+        assert resp.headers["x-total-count"] == "25"
+
+        cursor = resp.headers["x-next-before-id"]
+        resp = event_loop.run_until_complete(get_events(limit=20, range="all", since=None, until=None, before_id=cursor))
+        second = json.loads(resp.body)
+        assert len(second) == 5
+        assert "x-next-before-id" not in resp.headers
+        assert second[0]["ts"] < first[-1]["ts"]
+
+    @pytest.mark.parametrize("use_aggregator", [False, True])
+    def test_skill_usage_cursor_and_total(self, db, event_loop, monkeypatch, use_aggregator):
+        agg = event_loop.run_until_complete(StateAggregator.load(db)) if use_aggregator else None
+        self._seed(db, event_loop, agg)
+        self._use_state(monkeypatch, db, agg)
+
+        def _page(before_id):
+            resp = event_loop.run_until_complete(get_skill_usage(
+                "/hunt", project="arena", limit=5, since=None, until=None, before_id=before_id,
+            ))
+            return json.loads(resp.body)
+
+        pages = [_page(None)]
+        while pages[-1]["next_before_id"]:
+            pages.append(_page(pages[-1]["next_before_id"]))
+
+        assert pages[0]["total"] == 12
+        timestamps = [inv["ts"] for page in pages for inv in page["invocations"]]
+        assert len(timestamps) == 12
+        assert len(set(timestamps)) == 12
+
+    def test_invalid_cursor_is_rejected(self):
+        from fastapi import HTTPException
+        from server import encode_cursor
+        with pytest.raises(HTTPException):
+            decode_cursor("not-a-cursor", (int,))
+        for bad in (encode_cursor({"x": 1}), encode_cursor("abc"), encode_cursor(True)):
+            with pytest.raises(HTTPException) as exc:
+                decode_cursor(bad, (int,))
+            assert exc.value.status_code == 400
+        with pytest.raises(HTTPException):
+            decode_cursor(encode_cursor(5, "2026-02-17"), (str, int))
+        assert decode_cursor(encode_cursor("2026-02-17", 5), (str, int)) == ["2026-02-17", 5]
+
+    def test_malformed_since_is_rejected(self, db, event_loop, monkeypatch):
+        from fastapi import HTTPException
+        self._use_state(monkeypatch, db, None)
+        with pytest.raises(HTTPException) as exc:
+            event_loop.run_until_complete(
+                get_events(limit=20, range="all", since="garbage", until=None, before_id=None)
+            )
+        assert exc.value.status_code == 400
+
+    def test_sql_total_honours_since_until(self, db, event_loop, monkeypatch):
+        self._seed(db, event_loop)
+        self._use_state(monkeypatch, db, None)
+        resp = event_loop.run_until_complete(get_events(
+            limit=20, range="all", since="2026-02-17T10:05:00+00:00",
+            until="2026-02-17T10:10:00+00:00", before_id=None,
+        ))
+        assert len(json.loads(resp.body)) == 5
+        assert resp.headers["x-total-count"] == "5"
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, stalled=False, subprotocols=(), query_string=b""):
+        self.sent = []
+        self.raw = []
+        self.closed_with = None
+        self.stalled = stalled
+        self.accepted_subprotocol = None
+        self.hello = None
+        self.scope = {"subprotocols": list(subprotocols), "query_string": query_string}
+        self._release = asyncio.Event()
+
+    async def accept(self, subprotocol=None):
+        self.accepted_subprotocol = subprotocol
+
+    async def send_json(self, data):
+        if self.stalled:
+            await self._release.wait()
+        self.sent.append(data)
+
+    async def send_text(self, text):
+        if self.stalled:
+            await self._release.wait()
+        self._record(text, json.loads(text))
+
+    async def send_bytes(self, payload):
+        if self.stalled:
+            await self._release.wait()
+        if self.accepted_subprotocol == "arena.msgpack":
+            import msgpack
+            self._record(payload, msgpack.unpackb(payload, raw=False))
+        else:
+            self._record(payload, json.loads(zlib.decompress(payload)))
+
+    def _record(self, raw, message):
+        # The session handshake is kept apart so tests see only payload frames
+        if message.get("type") == "hello":
+            self.hello = message["data"]
+            return
+        self.raw.append(raw)
+        self.sent.append(message)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+class TestConnectionManagerQueues:
+    """Broadcast is a non-blocking enqueue; slow clients only hurt themselves."""
+
+    async def _drain(self):
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    def test_broadcast_does_not_wait_for_slow_client(self, event_loop):
+        mgr = ConnectionManager(queue_size=8, overflow_policy="drop_oldest")
+        fast, slow = FakeWebSocket(), FakeWebSocket(stalled=True)
+
+        async def _test():
+            await mgr.connect(fast)
+            await mgr.connect(slow)
+            loop = asyncio.get_running_loop()
+            elapsed = 0.0
+            for i in range(50):
+                start = loop.time()
+                await mgr.broadcast({"type": "event", "n": i})
+                elapsed += loop.time() - start
+                # Let the fast client's sender keep up between broadcasts
+                await self._drain()
+            stats = mgr.stats()
+            still_connected = slow in mgr.clients
+            await mgr.shutdown()
+            return elapsed, stats, still_connected
+
+        elapsed, stats, still_connected = event_loop.run_until_complete(_test())
+        assert elapsed < 0.1
+        assert [m["n"] for m in fast.sent] == list(range(50))
+        assert slow.sent == []
+        assert stats["dropped"] > 0
+        assert still_connected
+
+    def test_disconnect_policy_evicts_overflowing_client(self, event_loop):
+        mgr = ConnectionManager(queue_size=4, overflow_policy="disconnect")
+        fast, slow = FakeWebSocket(), FakeWebSocket(stalled=True)
+
+        async def _test():
+            await mgr.connect(fast)
+            await mgr.connect(slow)
+            for i in range(20):
+                await mgr.broadcast({"type": "event", "n": i})
+                await self._drain()
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        assert slow not in mgr.clients
+        assert slow.closed_with == 1013
+        assert len(fast.sent) == 20
+        assert mgr.stats()["evicted"] == 1
+
+    def test_failed_send_drops_client(self, event_loop):
+        class BrokenWebSocket(FakeWebSocket):
+            async def send_text(self, text):
+                raise RuntimeError("socket gone")
+
+        mgr = ConnectionManager(queue_size=4)
+        broken = BrokenWebSocket()
+
+        async def _test():
+            await mgr.connect(broken)
+            await mgr.broadcast({"type": "event"})
+            await self._drain()
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        assert broken not in mgr.clients
+
+    def test_broadcast_encodes_once_per_format(self, event_loop, monkeypatch):
+        calls = []
+        real_encode = server.encode_frame
+
+        def counting_encode(data, encoding="json"):
+            calls.append(encoding)
+            return real_encode(data, encoding)
+
+        monkeypatch.setattr(server, "encode_frame", counting_encode)
+        mgr = ConnectionManager(queue_size=8)
+        plain = [FakeWebSocket() for _ in range(5)]
+        packed = [FakeWebSocket(subprotocols=["arena.json.deflate"]) for _ in range(3)]
+
+        async def _test():
+            for ws in plain + packed:
+                await mgr.connect(ws)
+            await self._drain()
+            calls.clear()  # ignore the per-client hello frames
+            await mgr.broadcast({"type": "event", "payload": "x" * 500})
+            await self._drain()
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        assert sorted(calls) == ["json", "json.deflate"]
+        assert packed[0].accepted_subprotocol == "arena.json.deflate"
+        assert plain[0].accepted_subprotocol is None
+        assert all(ws.sent == [{"type": "event", "payload": "x" * 500, "seq": 1}] for ws in plain + packed)
+        assert all(isinstance(ws.raw[0], bytes) for ws in packed)
+        assert len(packed[0].raw[0]) < len(plain[0].raw[0])
+
+    def test_msgpack_subprotocol_keeps_schema(self, event_loop):
+        pytest.importorskip("msgpack")
+        mgr = ConnectionManager(queue_size=8)
+        ws = FakeWebSocket(subprotocols=["arena.msgpack", "arena.json"])
+        message = {"type": "brain_event", "data": {"id": 7, "tags": ["a", "b"], "ok": True}}
+
+        async def _test():
+            await mgr.connect(ws)
+            await mgr.broadcast(message)
+            await self._drain()
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        assert ws.accepted_subprotocol == "arena.msgpack"
+        assert isinstance(ws.raw[0], bytes)
+        assert ws.sent == [{**message, "seq": 1}]
+
+
+class TestTopicSubscriptions:
+    """Clients only receive the message types and entities they subscribe to."""
+
+    async def _drain(self):
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    def test_query_string_subscription_routes_by_topic_and_filter(self, event_loop):
+        mgr = ConnectionManager(queue_size=16)
+        everything = FakeWebSocket()
+        skills = FakeWebSocket(query_string=b"topics=skill_event&project=arena")
+
+        async def _test():
+            await mgr.connect(everything)
+            await mgr.connect(skills)
+            await mgr.broadcast({"type": "event", "data": {"agent": "a", "project_slug": "arena"}})
+            await mgr.broadcast({"type": "skill_event", "data": {"skill_name": "s", "project_slug": "other"}})
+            await mgr.broadcast({"type": "skill_event", "data": {"skill_name": "s", "project_slug": "arena"}})
+            await self._drain()
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        assert len(everything.sent) == 3
+        assert skills.sent == [
+            {"type": "skill_event", "data": {"skill_name": "s", "project_slug": "arena"}, "seq": 3}
+        ]
+
+    def test_subscribe_and_unsubscribe_update_topics(self):
+        client = server.ClientConnection(FakeWebSocket(), 4)
+        assert client.wants("brain_tasks")
+        client.subscribe(["brain_tasks", "not_a_topic"], {"instance_id": "i-1", "bogus": "x"})
+        assert client.topics == {"brain_tasks"}
+        assert client.filters == {"instance_id": "i-1"}
+        client.subscribe(["event"])
+        assert client.topics == {"brain_tasks", "event"}
+        assert client.filters == {"instance_id": "i-1"}
+        client.unsubscribe(["brain_tasks"])
+        assert client.wants("event") and not client.wants("brain_tasks")
+
+    def test_list_payloads_pass_entity_filters(self):
+        message = {"type": "brain_instances", "data": {"instances": [{"id": "x"}]}}
+        assert server.message_matches(message, {"instance_id": "i-1"})
+        single = {"type": "instance_agent_event", "data": {"instance_id": "i-2"}}
+        assert not server.message_matches(single, {"instance_id": "i-1"})
+
+    def test_bootstrap_sends_only_subscribed_sections(self, monkeypatch, tmp_path):
+        from fastapi.testclient import TestClient
+
+        monkeypatch.setattr(server.app.state, "brain_config", {}, raising=False)
+        monkeypatch.setattr(server, "METRICS_DIR", str(tmp_path))
+        client = TestClient(server.app)
+        with client.websocket_connect("/ws?topics=team_status") as ws:
+            hello = ws.receive_json()
+            first = ws.receive_json()
+            ws.send_text(json.dumps({"type": "ping"}))
+            second = ws.receive_json()
+        assert hello["type"] == "hello" and hello["data"]["resumed"] is False
+        assert first["type"] == "team_status"
+        assert second == {"type": "pong"}
+
+
+class TestDeltaUpdates:
+    """List topics publish id-keyed diffs to clients that opt in."""
+
+    async def _drain(self):
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    def test_diff_items(self):
+        previous = {1: {"id": 1, "s": "a"}, 2: {"id": 2, "s": "b"}}
+        delta = server.diff_items(previous, [{"id": 1, "s": "a"}, {"id": 2, "s": "c"}, {"id": 3}])
+        assert delta == {"added": [{"id": 3}], "changed": [{"id": 2, "s": "c"}], "removed": []}
+        assert server.diff_items(previous, [{"id": 2, "s": "b"}])["removed"] == [1]
+        assert server.diff_items({}, [{"name": "no id"}]) is None
+
+    def test_delta_clients_get_diffs_and_legacy_clients_get_snapshots(self, event_loop):
+        mgr = ConnectionManager(queue_size=16)
+        legacy = FakeWebSocket()
+        delta = FakeWebSocket(query_string=b"deltas=1")
+        tasks_v1 = {"tasks": [{"id": 1, "status": "open"}, {"id": 2, "status": "open"}], "count": 2}
+        tasks_v2 = {"tasks": [{"id": 1, "status": "done"}, {"id": 3, "status": "open"}], "count": 2}
+
+        async def _test():
+            await mgr.connect(legacy)
+            await mgr.connect(delta)
+            await mgr.publish_state("brain_tasks", tasks_v1)
+            await mgr.publish_state("brain_tasks", tasks_v1)  # unchanged: nothing sent
+            await mgr.publish_state("brain_tasks", tasks_v2)
+            await self._drain()
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        assert [m["data"] for m in legacy.sent] == [tasks_v1, tasks_v2]
+        assert delta.sent[0] == {"type": "brain_tasks", "version": 1, "seq": 1, "data": tasks_v1}
+        assert delta.sent[1] == {
+            "type": "brain_tasks_delta",
+            "base_version": 1,
+            "version": 2,
+            "seq": 2,
+            "data": {
+                "added": [{"id": 3, "status": "open"}],
+                "changed": [{"id": 1, "status": "done"}],
+                "removed": [2],
+            },
+        }
+
+    def test_client_behind_falls_back_to_snapshot(self, event_loop):
+        mgr = ConnectionManager(queue_size=1)
+        slow = FakeWebSocket(stalled=True, query_string=b"deltas=1")
+
+        async def _test():
+            await mgr.connect(slow)
+            for n in range(3):
+                await mgr.publish_state("brain_instances", {"instances": [{"id": "i", "n": n}]})
+            queued = [slow_frame.data for slow_frame in list(mgr.clients[slow].queue._queue)]
+            await mgr.shutdown()
+            return queued
+
+        queued = event_loop.run_until_complete(_test())
+        # Older frames were dropped, so the surviving frame must be a snapshot
+        assert queued == [
+            {"type": "brain_instances", "version": 3, "seq": 3, "data": {"instances": [{"id": "i", "n": 2}]}}
+        ]
+
+
+class TestReplayResume:
+    """Reconnects with last_seq replay missed broadcasts instead of a bootstrap."""
+
+    async def _drain(self):
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    def _reconnect(self, mgr, last_seq, epoch=None, topics=""):
+        query = f"last_seq={last_seq}&epoch={epoch or mgr.epoch}"
+        if topics:
+            query += f"&topics={topics}"
+        return FakeWebSocket(query_string=query.encode())
+
+    def test_resume_replays_only_missed_matching_frames(self, event_loop):
+        mgr = ConnectionManager(queue_size=32, replay_size=16)
+
+        async def _test():
+            for n in range(5):
+                await mgr.broadcast({"type": "event", "data": {"n": n}})
+            await mgr.broadcast({"type": "skill_event", "data": {"skill_name": "s"}})
+            ws = self._reconnect(mgr, last_seq=3, topics="event")
+            client = await mgr.connect(ws)
+            await self._drain()
+            await mgr.shutdown()
+            return ws, client
+
+        ws, client = event_loop.run_until_complete(_test())
+        assert client.resumed
+        assert ws.hello == {"epoch": mgr.epoch, "seq": 6, "resumed": True}
+        assert [m["seq"] for m in ws.sent] == [4, 5]
+
+    def test_gap_outside_ring_or_new_epoch_needs_bootstrap(self, event_loop):
+        mgr = ConnectionManager(queue_size=32, replay_size=4)
+
+        async def _test():
+            for n in range(10):
+                await mgr.broadcast({"type": "event", "data": {"n": n}})
+            old = await mgr.connect(self._reconnect(mgr, last_seq=2))
+            restarted = await mgr.connect(self._reconnect(mgr, last_seq=9, epoch="other"))
+            recent = await mgr.connect(self._reconnect(mgr, last_seq=7))
+            await mgr.shutdown()
+            return old, restarted, recent
+
+        old, restarted, recent = event_loop.run_until_complete(_test())
+        assert not old.resumed
+        assert not restarted.resumed
+        assert recent.resumed
+        assert mgr.stats()["replay"]["resumes"] == 1
+
+    def test_list_topics_replay_latest_snapshot_only(self, event_loop):
+        mgr = ConnectionManager(queue_size=32)
+
+        async def _test():
+            for n in range(3):
+                await mgr.publish_state("brain_tasks", {"tasks": [{"id": 1, "n": n}]})
+            ws = self._reconnect(mgr, last_seq=0)
+            await mgr.connect(ws)
+            await self._drain()
+            await mgr.shutdown()
+            return ws
+
+        ws = event_loop.run_until_complete(_test())
+        assert [m["version"] for m in ws.sent] == [3]
+
+
+class TestEventCoalescing:
+    """Batching clients get one events_batch frame per window."""
+
+    def test_burst_becomes_one_batch_for_opted_in_clients(self, event_loop):
+        mgr = ConnectionManager(queue_size=64, coalesce_ms=20)
+        legacy = FakeWebSocket()
+        batched = [FakeWebSocket(query_string=b"batch=1") for _ in range(3)]
+
+        async def _test():
+            await mgr.connect(legacy)
+            for ws in batched:
+                await mgr.connect(ws)
+            for n in range(10):
+                await mgr.broadcast({"type": "event", "data": {"n": n}})
+            await mgr.broadcast({"type": "brain_health", "data": {"ok": True}})
+            await asyncio.sleep(0.06)
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        assert len(legacy.sent) == 11
+        for ws in batched:
+            # The later-seq brain_health frame flushes the buffered events first
+            assert ws.sent[0] == {
+                "type": "events_batch",
+                "topic": "event",
+                "seq": 10,
+                "data": [{"n": n} for n in range(10)],
+            }
+            assert ws.sent[1]["type"] == "brain_health"  # not coalesced
+        assert batched[0].raw[0] is batched[1].raw[0]  # one shared encoding
+        assert mgr.events_coalesced == 30
+
+    def test_frames_never_skip_buffered_seqs(self, event_loop):
+        mgr = ConnectionManager(queue_size=64, coalesce_ms=20)
+        ws = FakeWebSocket(query_string=b"batch=1")
+
+        async def _test():
+            await mgr.connect(ws)
+            await mgr.broadcast({"type": "event", "data": {"n": 1}})
+            await mgr.broadcast({"type": "skill_event", "data": {"n": 2}})
+            await mgr.broadcast({"type": "event", "data": {"n": 3}})
+            await asyncio.sleep(0.05)
+            await mgr.shutdown()
+
+        event_loop.run_until_complete(_test())
+        # Runs in seq order: each frame's events are newer than the last seq sent
+        assert [(m["topic"], m["seq"], m["data"]) for m in ws.sent] == [
+            ("event", 1, [{"n": 1}]),
+            ("skill_event", 2, [{"n": 2}]),
+            ("event", 3, [{"n": 3}]),
+        ]
+
+    def test_max_fps_caps_all_frames_per_connection(self, event_loop):
+        mgr = ConnectionManager(queue_size=64, coalesce_ms=0)
+        capped = FakeWebSocket(query_string=b"max_fps=10")
+        free = FakeWebSocket()
+
+        async def _test():
+            await mgr.connect(capped)
+            await mgr.connect(free)
+            for n in range(5):
+                await mgr.broadcast({"type": "brain_health", "data": {"n": n}})
+            await asyncio.sleep(0.25)
+            sent = (len(capped.sent), len(free.sent))
+            await mgr.shutdown()
+            return sent
+
+        capped_sent, free_sent = event_loop.run_until_complete(_test())
+        assert free_sent == 5
+        assert 2 <= capped_sent <= 4  # ~10 frames/s over 0.25s
+
+    def test_max_fps_widens_the_window(self, event_loop):
+        mgr = ConnectionManager(queue_size=64, coalesce_ms=10)
+        ws = FakeWebSocket(query_string=b"batch=1&max_fps=5")
+
+        async def _test():
+            await mgr.connect(ws)
+            await mgr.broadcast({"type": "event", "data": {"n": 0}})
+            await asyncio.sleep(0.05)
+            early = list(ws.sent)
+            await asyncio.sleep(0.2)
+            await mgr.shutdown()
+            return early
+
+        early = event_loop.run_until_complete(_test())
+        assert early == []
+        assert [m["type"] for m in ws.sent] == ["events_batch"]
+
+
+class TestBrainSnapshotBootstrap:
+    """Bootstrap is served from the poll_brain snapshot with zero upstream calls."""
+
+    def test_bootstrap_reads_snapshot_without_brain_calls(self, monkeypatch, tmp_path):
+        from fastapi.testclient import TestClient
+
+        async def no_upstream(*args, **kwargs):
+            raise AssertionError("bootstrap must not call the brain")
+
+        snapshot = server.BrainSnapshot()
+        snapshot.update("health", {"status": "ok"})
+        snapshot.update("instances", {"instances": [{"id": "i-1"}]})
+        snapshot.update("sync", {"status": "online", "queue_depth": 3})
+        monkeypatch.setattr(server, "brain_request", no_upstream)
+        monkeypatch.setattr(server, "METRICS_DIR", str(tmp_path))
+        monkeypatch.setattr(server.app.state, "brain_snapshot", snapshot, raising=False)
+        monkeypatch.setattr(server.app.state, "brain_config", {"url": "http://brain"}, raising=False)
+
+        client = TestClient(server.app)
+        with client.websocket_connect("/ws?topics=brain_state,sync_status") as ws:
+            assert ws.receive_json()["type"] == "hello"
+            brain_state = ws.receive_json()
+            sync = ws.receive_json()
+
+        assert brain_state["type"] == "brain_state"
+        assert brain_state["data"]["instances"] == {"instances": [{"id": "i-1"}]}
+        assert brain_state["data"]["projects"] is None
+        assert set(brain_state["age"]) == {"health", "instances"}
+        assert sync["data"] == {"status": "online", "queue_depth": 3}
+
+    def test_open_breaker_reports_cached_sync_offline(self, monkeypatch):
+        breaker = server.CircuitBreaker(threshold=1, cooldown=30)
+        monkeypatch.setattr(server, "brain_breaker", breaker)
+        snapshot = server.BrainSnapshot()
+        snapshot.update("sync", {"status": "online", "queue_depth": 3})
+        assert server.cached_sync_status(snapshot)["status"] == "online"
+        breaker.record_failure("down")
+        assert server.cached_sync_status(snapshot)["status"] == "offline"
+
+    def test_brain_state_published_once_after_first_poll(self, event_loop, monkeypatch):
+        fail = {"on": True}
+
+        class Brain:
+            async def get(self, url, params=None, headers=None):
+                if fail["on"]:
+                    return SimpleNamespace(status_code=503, json=lambda: {})
+                return SimpleNamespace(status_code=200, json=lambda: {"instances": [{"id": "i-1"}]})
+
+        mgr = ConnectionManager(queue_size=8)
+        published = []
+        mgr.add_listener("brain_state", published.append)
+        scheduler = server.BrainScheduler()
+        monkeypatch.setattr(server, "manager", mgr)
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        monkeypatch.setattr(server, "brain_breaker", server.CircuitBreaker(threshold=100))
+        monkeypatch.setattr(server, "brain_scheduler", scheduler)
+        monkeypatch.setattr(server, "brain_poll_stats", dict(server.brain_poll_stats, cycles=0))
+        fake_app = SimpleNamespace(state=SimpleNamespace(
+            brain_config={"url": "http://brain"},
+            brain_client=Brain(),
+            brain_snapshot=server.BrainSnapshot(),
+        ))
+
+        async def _cycle():
+            for resource in scheduler.resources.values():
+                resource.next_due = 0.0
+            scheduler.note_rest("/api/instances")
+            scheduler.wake()
+            await asyncio.sleep(0.05)
+
+        async def _test():
+            task = asyncio.create_task(server.poll_brain(fake_app))
+            await asyncio.sleep(0.05)
+            # Startup poll failed: nothing to publish yet
+            assert published == []
+            fail["on"] = False
+            await _cycle()
+            await _cycle()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        event_loop.run_until_complete(_test())
+        assert len(published) == 1
+        assert published[0]["instances"] == {"instances": [{"id": "i-1"}]}
+
+    def test_failed_fetch_keeps_last_good_section(self):
+        snapshot = server.BrainSnapshot()
+        snapshot.update("tasks", {"tasks": [1]})
+        snapshot.update("tasks", None)
+        assert snapshot.get("tasks") == {"tasks": [1]}
+        assert snapshot.age("tasks") >= 0
+        assert snapshot.age("events") is None
+
+
+class TestWorkerFabric:
+    """Workers relay broadcasts and aggregate updates over a Unix socket hub."""
+
+    def test_leader_lock_is_exclusive(self, tmp_path):
+        first = server.LeaderLock(str(tmp_path / "leader.lock"))
+        second = server.LeaderLock(str(tmp_path / "leader.lock"))
+        assert first.try_acquire()
+        assert not second.try_acquire()
+        first.release()
+        assert second.try_acquire()
+        second.release()
+
+    def test_hub_relays_to_other_workers_only(self, event_loop, tmp_path):
+        path = str(tmp_path / "fabric.sock")
+        leader, follower = server.WorkerFabric(path), server.WorkerFabric(path)
+        got = {"leader": [], "follower": []}
+        leader.on("broadcast", lambda data: got["leader"].append(data))
+        follower.on("broadcast", lambda data: got["follower"].append(data))
+
+        async def _test():
+            await leader.serve_hub()
+            tasks = [asyncio.create_task(f.run_client()) for f in (leader, follower)]
+            for _ in range(100):
+                if leader._writer and follower._writer and len(leader._peers) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            leader.publish("broadcast", data={"type": "event", "n": 1})
+            follower.publish("broadcast", data={"type": "event", "n": 2})
+            for _ in range(100):
+                if got["leader"] and got["follower"]:
+                    break
+                await asyncio.sleep(0.01)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await follower.close()
+            await leader.close()
+
+        event_loop.run_until_complete(_test())
+        assert got == {"leader": [{"type": "event", "n": 2}], "follower": [{"type": "event", "n": 1}]}
+
+    def test_rejoin_runs_on_connect_and_requests_resync_after_drops(self, event_loop, tmp_path):
+        path = str(tmp_path / "fabric.sock")
+        leader, follower = server.WorkerFabric(path), server.WorkerFabric(path)
+        joins, resyncs = [], []
+        follower.on_connect = lambda: joins.append(1) or asyncio.sleep(0)
+        leader.on("resync", lambda: resyncs.append(1))
+        # Published while disconnected: peers never saw it
+        follower.publish("aggregate", event_id=1)
+        assert follower.dropped == 1
+
+        async def _wait(cond):
+            for _ in range(200):
+                if cond():
+                    return
+                await asyncio.sleep(0.01)
+
+        async def _test():
+            await leader.serve_hub()
+            tasks = [asyncio.create_task(f.run_client()) for f in (leader, follower)]
+            await _wait(lambda: len(joins) == 1 and resyncs)
+            # The hub cuts the follower loose; it rejoins and resyncs again
+            for peer in list(leader._peers):
+                peer.close()
+            await _wait(lambda: len(joins) == 2)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await follower.close()
+            await leader.close()
+
+        event_loop.run_until_complete(_test())
+        assert resyncs == [1]
+        assert len(joins) == 2 and follower.reconnects >= 1
+
+    def test_disabled_fabric_publish_is_a_noop(self):
+        disabled = server.WorkerFabric(None)
+        disabled.publish("broadcast", data={})
+        assert disabled.stats()["published"] == 0 and disabled.stats()["dropped"] == 0
+
+
+class TestSSEHub:
+    """One upstream brain stream fans out to filtered, replayable SSE subscribers."""
+
+    def test_filters_and_last_event_id_replay(self, event_loop):
+        hub = server.SSEHub(replay_size=10)
+
+        async def _test():
+            live = hub.subscribe(component="sync")
+            for n in range(4):
+                hub.publish({"event_name": "e", "component": "sync" if n % 2 else "api", "n": n})
+            first = [live.queue.get_nowait() for _ in range(live.queue.qsize())]
+            # Reconnect after the first delivered event, same filter
+            resumed = hub.subscribe(component="sync", last_event_id=first[0][0])
+            return first, [resumed.queue.get_nowait() for _ in range(resumed.queue.qsize())]
+
+        first, replayed = event_loop.run_until_complete(_test())
+        assert [event["n"] for _, event in first] == [1, 3]
+        assert [event["n"] for _, event in replayed] == [3]
+
+    def test_full_subscriber_queue_sheds_oldest(self, event_loop, monkeypatch):
+        monkeypatch.setattr(server, "SSE_QUEUE_SIZE", 2)
+        hub = server.SSEHub()
+
+        async def _test():
+            sub = hub.subscribe(project="arena")
+            for n in range(5):
+                hub.publish({"project_slug": "arena", "n": n})
+            return sub, [e["n"] for _, e in (sub.queue.get_nowait(), sub.queue.get_nowait())]
+
+        sub, kept = event_loop.run_until_complete(_test())
+        assert kept == [3, 4]
+        assert sub.dropped == 3
+
+    def test_manager_brain_event_broadcasts_feed_listeners(self, event_loop):
+        mgr = ConnectionManager(queue_size=4)
+        seen = []
+        mgr.add_listener("brain_event", seen.append)
+
+        async def _test():
+            await mgr.broadcast({"type": "brain_event", "data": {"id": 1}}, relay=False)
+            await mgr.broadcast({"type": "event", "data": {"id": 2}}, relay=False)
+
+        event_loop.run_until_complete(_test())
+        assert seen == [{"id": 1}]
+
+
+class FakeBrainClient:
+    """Brain HTTP client double returning a counter payload or a failure."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    async def get(self, url, params=None, headers=None):
+        self.calls += 1
+        status = 500 if self.fail else 200
+        calls = self.calls
+        return SimpleNamespace(status_code=status, json=lambda: {"version": calls})
+
+    def build_request(self, method, url, params=None, headers=None):
+        return SimpleNamespace(url=url, params=params, headers=headers)
+
+    async def send(self, request, stream=False):
+        resp = await self.get(request.url, params=request.params, headers=request.headers)
+        body = json.dumps(resp.json()).encode()
+
+        async def aiter_raw():
+            yield body
+
+        async def aclose():
+            pass
+
+        return SimpleNamespace(
+            status_code=resp.status_code, headers={"content-type": "application/json"},
+            aiter_raw=aiter_raw, aclose=aclose,
+        )
+
+
+class TestBrainCache:
+    """brain_request serves fresh, stale-while-revalidate and stale-if-error."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        monkeypatch.setattr(server, "brain_breaker", server.CircuitBreaker())
+        self.client = FakeBrainClient()
+        self.app = SimpleNamespace(
+            state=SimpleNamespace(brain_config={"url": "http://brain"}, brain_client=self.client)
+        )
+
+    def _age(self, key, seconds):
+        data, stored_at = server.brain_cache.entries[key]
+        server.brain_cache.entries[key] = (data, stored_at - seconds)
+
+    def test_fresh_entries_skip_upstream_and_set_age(self, event_loop):
+        response = Response()
+
+        async def _test():
+            first = await brain_request(self.app, "/api/tasks", {"limit": "5"})
+            second = await brain_request(self.app, "/api/tasks", {"limit": "5"}, response=response)
+            return first, second
+
+        assert event_loop.run_until_complete(_test()) == ({"version": 1}, {"version": 1})
+        assert self.client.calls == 1
+        assert response.headers["Age"] == "0"
+
+    def test_stale_entry_served_while_revalidating(self, event_loop):
+        key = ("/api/events", ())
+
+        async def _test():
+            await brain_request(self.app, "/api/events")
+            self._age(key, 20)  # past the 10s TTL, inside the SWR window
+            stale = await brain_request(self.app, "/api/events")
+            for _ in range(5):
+                await asyncio.sleep(0)
+            return stale, await brain_request(self.app, "/api/events")
+
+        stale, fresh = event_loop.run_until_complete(_test())
+        assert stale == {"version": 1}
+        assert fresh == {"version": 2}
+        assert self.client.calls == 2
+
+    def test_upstream_failure_falls_back_to_stale(self, event_loop):
+        key = ("/api/projects", ())
+        response = Response()
+
+        async def _test():
+            await brain_request(self.app, "/api/projects")
+            self._age(key, 1000)  # beyond TTL + SWR: must try upstream
+            self.client.fail = True
+            return await brain_request(self.app, "/api/projects", response=response)
+
+        assert event_loop.run_until_complete(_test()) == {"version": 1}
+        assert int(response.headers["Age"]) >= 1000
+        assert server.brain_cache.stale_if_error == 1
+
+    def test_refresh_bypasses_fresh_entry(self, event_loop):
+        async def _test():
+            await brain_request(self.app, "/health")
+            return await brain_request(self.app, "/health", refresh=True)
+
+        assert event_loop.run_until_complete(_test()) == {"version": 2}
+
+
+class TestPollBrainFanOut:
+    """poll_brain covers every active instance under a concurrency bound."""
+
+    def test_all_active_instances_polled_concurrently(self, event_loop, monkeypatch):
+        instances = [
+            {"id": f"i-{n}", "status": "active", "current_brief": "BR-1"} for n in range(15)
+        ]
+
+        class SlowBrain:
+            def __init__(self):
+                self.active = self.peak = 0
+
+            async def get(self, url, params=None, headers=None):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.02)
+                self.active -= 1
+                body = {"instances": instances} if url.endswith("/api/instances") else {"ok": True}
+                return SimpleNamespace(status_code=200, json=lambda: body)
+
+        brain = SlowBrain()
+        mgr = ConnectionManager(queue_size=8)
+        covered = []
+        mgr.add_listener("instance_agent_event", lambda data: covered.append(data["instance_id"]))
+        stats = dict(server.brain_poll_stats, cycles=0, max_cycle_s=0.0, total_cycle_s=0.0)
+        monkeypatch.setattr(server, "manager", mgr)
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        monkeypatch.setattr(server, "brain_poll_stats", stats)
+        monkeypatch.setattr(server, "BRAIN_CONCURRENCY", 4)
+        fake_app = SimpleNamespace(state=SimpleNamespace(
+            brain_config={"url": "http://brain"},
+            brain_client=brain,
+            brain_snapshot=server.BrainSnapshot(),
+        ))
+
+        async def _test():
+            task = asyncio.create_task(server.poll_brain(fake_app))
+            for _ in range(200):
+                if stats["cycles"]:
+                    break
+                await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        event_loop.run_until_complete(_test())
+        assert sorted(covered) == sorted(i["id"] for i in instances)
+        assert brain.peak == 4
+        # ~40 requests at 20ms each: sequential would take ~0.8s
+        assert stats["last_cycle_s"] < 0.5
+        assert stats["instances_covered"] == 15
+
+
+class TestBrainScheduler:
+    """Brain polling follows demand and adapts to how often data changes."""
+
+    def test_intervals_adapt_to_changes_and_failures(self):
+        r = server.ResourceSchedule("tasks", 60, 20, 300, ("brain_tasks",))
+        r.record({"tasks": [1]}, 0.0, 0.01)
+        assert (r.last_result, r.interval, r.next_due) == ("initial", 60, 60)
+        r.record({"tasks": [1]}, 60.0, 0.01)
+        r.record({"tasks": [1]}, 180.0, 0.01)
+        assert (r.last_result, r.interval, r.unchanged) == ("unchanged", 240, 2)
+        r.record({"tasks": [1]}, 420.0, 0.01)
+        assert r.interval == 300
+        r.record({"tasks": [1, 2]}, 720.0, 0.01)
+        assert (r.last_result, r.interval) == ("changed", 30)
+        r.record({"tasks": [1, 2, 3]}, 750.0, 0.01)
+        assert r.interval == 20
+        r.record(None, 770.0, 0.01)
+        r.record(None, 890.0, 0.01)
+        r.record(None, 1130.0, 0.01)
+        assert (r.last_result, r.failures, r.interval) == ("error", 3, server.BRAIN_ERROR_BACKOFF_MAX)
+
+    def test_interest_from_subscriptions_and_rest(self, event_loop, monkeypatch):
+        mgr = ConnectionManager(queue_size=8)
+        monkeypatch.setattr(server, "manager", mgr)
+        scheduler = server.BrainScheduler()
+        assert not any(scheduler.watched(name) for name in scheduler.resources)
+
+        async def _test():
+            await mgr.connect(FakeWebSocket(query_string=b"topics=brain_tasks"))
+
+        event_loop.run_until_complete(_test())
+        assert scheduler.watched("tasks")
+        assert not scheduler.watched("events")
+
+        scheduler.note_rest("/api/events")
+        scheduler.note_rest("/api/agent-metrics")
+        assert scheduler.watched("events")
+        assert scheduler.local_interest() == ["events", "tasks"]
+        described = scheduler.describe()["resources"]
+        assert described["projects"]["state"] == "paused"
+        assert described["tasks"]["watchers"]["websocket_clients"] == 1
+
+    def test_paused_resources_skipped_after_startup(self, event_loop, monkeypatch):
+        calls = []
+
+        class Brain:
+            async def get(self, url, params=None, headers=None):
+                calls.append(url.removeprefix("http://brain"))
+                return SimpleNamespace(status_code=200, json=lambda: {"ok": True})
+
+        scheduler = server.BrainScheduler()
+        monkeypatch.setattr(server, "manager", ConnectionManager(queue_size=8))
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        monkeypatch.setattr(server, "brain_scheduler", scheduler)
+        monkeypatch.setattr(server, "brain_poll_stats", dict(server.brain_poll_stats, cycles=0))
+        fake_app = SimpleNamespace(state=SimpleNamespace(
+            brain_config={"url": "http://brain"},
+            brain_client=Brain(),
+            brain_snapshot=server.BrainSnapshot(),
+        ))
+
+        async def _test():
+            task = asyncio.create_task(server.poll_brain(fake_app))
+            await asyncio.sleep(0.05)
+            startup = len(calls)
+            # Only tasks is watched; make it due now
+            scheduler.note_rest("/api/tasks")
+            scheduler.resources["tasks"].next_due = 0.0
+            scheduler.wake()
+            await asyncio.sleep(0.05)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return startup
+
+        startup = event_loop.run_until_complete(_test())
+        assert "/api/projects" in calls[:startup]
+        assert calls[startup:] == ["/api/tasks"]
+
+
+class TestCircuitBreaker:
+    """brain calls fail fast while the brain is down and probe to recover."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh(self, monkeypatch):
+        self.breaker = server.CircuitBreaker(threshold=3, cooldown=30)
+        monkeypatch.setattr(server, "brain_breaker", self.breaker)
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        self.client = FakeBrainClient()
+        self.app = SimpleNamespace(
+            state=SimpleNamespace(brain_config={"url": "http://brain"}, brain_client=self.client)
+        )
+
+    def test_opens_after_failures_and_fails_fast(self, event_loop):
+        self.client.fail = True
+
+        async def _test():
+            for n in range(10):
+                await brain_request(self.app, "/api/tasks", {"n": n})
+
+        event_loop.run_until_complete(_test())
+        assert self.client.calls == 3
+        stats = self.breaker.stats()
+        assert (stats["state"], stats["rejected"], stats["opens"]) == ("open", 7, 1)
+        assert server.offline_sync_status()["breaker"]["state"] == "open"
+
+    def test_half_open_probe_closes_or_reopens(self, event_loop):
+        self.client.fail = True
+
+        async def _calls(count):
+            return [await brain_request(self.app, "/api/tasks", {"n": n}) for n in range(count)]
+
+        event_loop.run_until_complete(_calls(3))
+        self.breaker.opened_at -= 30
+        event_loop.run_until_complete(_calls(2))
+        # One probe went through, failed, and re-opened the breaker
+        assert self.client.calls == 4
+        assert self.breaker.state == "open"
+
+        self.breaker.opened_at -= 30
+        self.client.fail = False
+        results = event_loop.run_until_complete(_calls(2))
+        assert results == [{"version": 5}, {"version": 6}]
+        assert self.breaker.state == "closed"
+
+    def test_non_json_200_falls_back_to_none(self, event_loop):
+        class GarbageClient:
+            async def get(self, url, params=None, headers=None):
+                return SimpleNamespace(status_code=200, json=lambda: json.loads("<html>"))
+
+            async def put(self, url, json=None, headers=None):
+                return await self.get(url)
+
+        self.app.state.brain_client = GarbageClient()
+
+        async def _test():
+            return (
+                await brain_request(self.app, "/api/tasks"),
+                await server.brain_put(self.app, "/api/projects/x/budget", {}),
+            )
+
+        assert event_loop.run_until_complete(_test()) == (None, None)
+        assert self.breaker.failures == 2
+
+    def test_slow_calls_hit_the_deadline(self, event_loop, monkeypatch):
+        class HangingClient:
+            async def get(self, url, params=None, headers=None):
+                await asyncio.sleep(10)
+
+        monkeypatch.setattr(server, "BRAIN_GET_DEADLINE", 0.05)
+        self.app.state.brain_client = HangingClient()
+        result = event_loop.run_until_complete(brain_request(self.app, "/api/tasks"))
+        assert result is None
+        assert self.breaker.failures == 1
+        assert "deadline" in self.breaker.last_error
+
+
+class TestHTTPClients:
+    """Shared upstream pools reuse keep-alive connections and report usage."""
+
+    def test_keepalive_reuses_one_connection(self, event_loop):
+        body = b'{"ok": true}'
+
+        async def handle(reader, writer):
+            while True:
+                try:
+                    await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                )
+                await writer.drain()
+
+        async def _test():
+            server_ = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server_.sockets[0].getsockname()[1]
+            clients = server.HTTPClients()
+            try:
+                for _ in range(5):
+                    resp = await clients.request.get(f"http://127.0.0.1:{port}/health")
+                    assert resp.json() == {"ok": True}
+                return clients.stats()
+            finally:
+                await clients.close()
+                server_.close()
+
+        stats = event_loop.run_until_complete(_test())
+        pool = stats["pools"]["request"]
+        assert pool["requests"] == 5
+        assert pool["connections_opened"] == 1
+        assert (pool["connections"], pool["idle"]) == (1, 1)
+        assert "stream" not in stats["pools"]
+
+
+class TestIncrementalBrainEvents:
+    """Brain events are fetched by since-cursor, deduplicated and sent once."""
+
+    def _event(self, n):
+        return {"id": n, "event_name": "task.done", "created_at": f"2026-01-01T00:00:{n:02d}Z"}
+
+    def test_merge_dedups_and_tracks_high_water(self):
+        log = server.BrainEventLog(window=3)
+        assert [e["id"] for e in log.merge([self._event(2), self._event(1)], "poll")] == [1, 2]
+        assert [e["id"] for e in log.merge([self._event(2), self._event(3)], "sse")] == [3]
+        log.merge([self._event(4)], "sse")
+        assert log.since == "2026-01-01T00:00:04Z"
+        assert [e["id"] for e in log.payload()["events"]] == [4, 3, 2]
+        assert (log.from_poll, log.from_sse, log.duplicates) == (2, 2, 1)
+
+    def _harness(self, monkeypatch, db, upstream, requests):
+        class Brain:
+            async def get(self, url, params=None, headers=None):
+                if url.endswith("/api/events"):
+                    requests.append(dict(params))
+                    since = params.get("since")
+                    body = {"events": [e for e in upstream if since is None or e["created_at"] >= since]}
+                else:
+                    body = {"ok": True}
+                return SimpleNamespace(status_code=200, json=lambda: body)
+
+        mgr = ConnectionManager(queue_size=8)
+        live = []
+        mgr.add_listener("brain_event", lambda data: live.append(data.get("id")))
+        log = server.BrainEventLog()
+        scheduler = server.BrainScheduler()
+        scheduler.note_rest("/api/events")
+        monkeypatch.setattr(server, "manager", mgr)
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        monkeypatch.setattr(server, "brain_breaker", server.CircuitBreaker())
+        monkeypatch.setattr(server, "brain_scheduler", scheduler)
+        monkeypatch.setattr(server, "brain_event_log", log)
+        monkeypatch.setattr(server, "brain_event_mirror", server.BrainEventMirror())
+        monkeypatch.setattr(server, "brain_poll_stats", dict(server.brain_poll_stats, cycles=0))
+        fake_app = SimpleNamespace(state=SimpleNamespace(
+            db=db,
+            brain_config={"url": "http://brain"},
+            brain_client=Brain(),
+            brain_snapshot=server.BrainSnapshot(),
+        ))
+        return live, log, scheduler, fake_app
+
+    def test_poll_fills_gaps_only_while_sse_is_down(self, event_loop, db, monkeypatch):
+        requests = []
+        upstream = [self._event(1), self._event(2)]
+        live, log, scheduler, fake_app = self._harness(monkeypatch, db, upstream, requests)
+
+        async def tick():
+            scheduler.poll_now("events")
+            await asyncio.sleep(0.03)
+
+        async def _test():
+            task = asyncio.create_task(server.poll_brain(fake_app))
+            await asyncio.sleep(0.03)  # seed: history only, nothing broadcast
+            upstream.append(self._event(3))
+            await tick()  # SSE down: gap-fill from the cursor
+            log.sse_connected, log.catch_up = True, False
+            upstream.append(self._event(4))
+            await tick()  # SSE up: no upstream fetch
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        event_loop.run_until_complete(_test())
+        assert requests == [
+            {"limit": "50"},
+            {"limit": "200", "since": "2026-01-01T00:00:02Z"},
+        ]
+        assert live == [3]
+        assert [e["id"] for e in fake_app.state.brain_snapshot.get("events")["events"]] == [3, 2, 1]
+        mirrored = event_loop.run_until_complete(server.brain_event_mirror.query(db, {}, None, None, 10))
+        assert [e["id"] for e in mirrored[0]] == [3, 2, 1]
+        assert server.brain_event_mirror.complete_since == ""
+
+
+    def test_seed_page_not_broadcast_after_early_sse_event(self, event_loop, db, monkeypatch):
+        requests = []
+        upstream = [self._event(1), self._event(2)]
+        live, log, scheduler, fake_app = self._harness(monkeypatch, db, upstream, requests)
+        # An SSE event (without created_at) lands before the first poll
+        log.merge([{"id": 99, "event_name": "x"}], "sse")
+
+        async def _test():
+            task = asyncio.create_task(server.poll_brain(fake_app))
+            await asyncio.sleep(0.03)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        event_loop.run_until_complete(_test())
+        assert requests == [{"limit": "50"}]
+        assert live == []
+        assert log.seeded
+
+    def test_sse_bridge_dedups_and_forwards_idless_events(self, event_loop, db, monkeypatch):
+        live, log, scheduler, fake_app = self._harness(monkeypatch, db, [], [])
+        lines = [
+            'data: {"id": 7, "event_name": "a", "created_at": "2026-01-01T00:00:07Z"}',
+            'data: {"id": 7, "event_name": "a", "created_at": "2026-01-01T00:00:07Z"}',
+            'data: {"event_name": "heartbeat.note"}',
+            'data: {"status": "keepalive"}',
+        ]
+
+        class Stream:
+            def __init__(self):
+                self.opened = 0
+
+            def stream(self, method, url, headers=None):
+                stream = self
+
+                class Ctx:
+                    async def __aenter__(self):
+                        stream.opened += 1
+                        if stream.opened > 1:
+                            await asyncio.sleep(10)
+                        return SimpleNamespace(status_code=200, aiter_lines=self.lines)
+
+                    async def lines(self):
+                        for line in lines:
+                            yield line
+
+                    async def __aexit__(self, *exc):
+                        return False
+
+                return Ctx()
+
+        monkeypatch.setattr(server, "http_clients", SimpleNamespace(stream=Stream()))
+
+        async def _test():
+            task = asyncio.create_task(server.stream_brain_events(fake_app))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        event_loop.run_until_complete(_test())
+        assert live == [7, None]
+        assert log.duplicates == 1
+
+
+class TestBrainEventMirror:
+    """/api/brain/events is answered from the local mirror when it can be."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh(self, monkeypatch):
+        self.mirror = server.BrainEventMirror()
+        monkeypatch.setattr(server, "brain_event_mirror", self.mirror)
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        monkeypatch.setattr(server, "brain_breaker", server.CircuitBreaker())
+
+    def _events(self, ids):
+        return [
+            {"id": n, "event_name": "task.done" if n % 2 else "brief.start",
+             "component": "tasks", "project_slug": "arena",
+             "created_at": f"2026-01-01T00:{n:02d}:00Z"}
+            for n in ids
+        ]
+
+    def _app(self, db, client):
+        return SimpleNamespace(state=SimpleNamespace(
+            db=db, brain_config={"url": "http://brain"}, brain_client=client,
+        ))
+
+    def test_filters_and_keyset_pages_served_locally(self, event_loop, db):
+        client = FakeBrainClient()
+        app = self._app(db, client)
+        request = SimpleNamespace(app=app)
+
+        async def _test():
+            await self.mirror.write(db, self._events(range(1, 11)), complete_since="")
+            first = await server.brain_events(
+                request, Response(), event_name="task.done", component=None, project="arena",
+                instance_id=None, since=None, until=None, limit=3, offset=0, before_id=None,
+            )
+            second = await server.brain_events(
+                request, Response(), event_name="task.done", component=None, project="arena",
+                instance_id=None, since=None, until=None, limit=3, offset=0,
+                before_id=first["next_before_id"],
+            )
+            return first, second
+
+        first, second = event_loop.run_until_complete(_test())
+        assert [e["id"] for e in first["events"]] == [9, 7, 5]
+        assert [e["id"] for e in second["events"]] == [3, 1]
+        assert (first["total"], first["source"], second["next_before_id"]) == (5, "mirror", None)
+        assert client.calls == 0
+
+    def test_retention_prunes_and_clamps_coverage(self, event_loop, db):
+        async def _test():
+            await self.mirror.write(db, self._events([1, 2]), complete_since="")
+            await self.mirror.prune(db)
+            async with db.execute("SELECT COUNT(*) FROM brain_events") as cursor:
+                return (await cursor.fetchone())[0]
+
+        assert event_loop.run_until_complete(_test()) == 0
+        assert self.mirror.complete_since > "2026-01-01"
+
+    def test_seeded_window_reports_upstream_total(self, event_loop, db):
+        class CountingBrain:
+            def __init__(self):
+                self.params = []
+                self.up = True
+
+            async def get(self, url, params=None, headers=None):
+                self.params.append(params)
+                body = {"events": [], "total": 1234}
+                return SimpleNamespace(status_code=200 if self.up else 500, json=lambda: body)
+
+        client = CountingBrain()
+        request = SimpleNamespace(app=self._app(db, client))
+        kwargs = dict(event_name=None, component=None, project=None, instance_id=None,
+                      since=None, until=None, limit=50, offset=0, before_id=None)
+
+        async def _test():
+            # A fresh start: only the 50-event seed page is mirrored
+            seed = self._events(range(1, 51))
+            await self.mirror.write(db, seed, complete_since=seed[0]["created_at"])
+            online = await server.brain_events(request, Response(), **kwargs)
+            server.brain_cache.entries.clear()
+            client.up = False
+            offline = await server.brain_events(request, Response(), **kwargs)
+            return online, offline
+
+        online, offline = event_loop.run_until_complete(_test())
+        assert (len(online["events"]), online["total"], online["source"]) == (50, 1234, "mirror")
+        assert client.params[0] == {"limit": "1", "offset": "0"}
+        assert len(offline["events"]) == 50
+        assert offline["total"] is None and offline["partial"]
+
+    def test_ranges_before_coverage_go_upstream(self, event_loop, db):
+        client = FakeBrainClient()
+        app = self._app(db, client)
+        request = SimpleNamespace(app=app)
+        kwargs = dict(event_name=None, component=None, project=None, instance_id=None,
+                      until=None, offset=0, before_id=None)
+
+        async def _test():
+            # A full gap-fill page: only events from 00:05 on are known complete
+            await self.mirror.write(db, self._events(range(5, 11)), complete_since="2026-01-01T00:05:00Z")
+            covered = await server.brain_events(
+                request, Response(), since="2026-01-01T00:06:00Z", limit=50, **kwargs)
+            older = await server.brain_events(request, Response(), since=None, limit=50, **kwargs)
+            client.fail = True
+            offline = await server.brain_events(
+                request, Response(), since="2026-01-01T00:00:00Z", limit=50, **kwargs)
+            return covered, older, offline
+
+        covered, older, offline = event_loop.run_until_complete(_test())
+        assert [e["id"] for e in covered["events"]] == [10, 9, 8, 7, 6]
+        assert json.loads(older.body) == {"version": 1}
+        assert offline["partial"] and len(offline["events"]) == 6
+        assert (self.mirror.served_local, self.mirror.served_upstream) == (2, 1)
+
+
+class TestBatchEndpoint:
+    """POST /api/batch runs GET sub-requests concurrently in one round trip."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+        monkeypatch.setattr(server, "DB_PATH", str(tmp_path / "arena.db"))
+        monkeypatch.setenv("HOME", str(tmp_path))
+        with TestClient(server.app) as c:
+            yield c
+
+    def test_sub_requests_return_together(self, client):
+        resp = client.post("/api/batch", json={"requests": [
+            {"id": "budget", "path": "/api/budget"},
+            {"id": "events", "path": "/api/brain/events", "params": {"limit": 5}},
+            {"id": "missing", "path": "/api/instances/nope/nothing"},
+        ]})
+        assert resp.status_code == 200
+        results = {r["id"]: r for r in resp.json()["responses"]}
+        assert results["budget"]["status"] == 200
+        assert results["events"]["status"] == 200
+        assert results["events"]["body"]["limit"] == 5
+        assert results["missing"]["status"] == 404
+
+    def test_operations_page_batch(self, client):
+        # The Flutter operations page loads every panel through one batch
+        resp = client.post("/api/batch", json={"requests": [
+            {"id": "health", "path": "/api/brain/health"},
+            {"id": "sync", "path": "/api/sync-status"},
+            {"id": "knowledge", "path": "/api/brain/knowledge"},
+            {"id": "projects", "path": "/api/brain/projects"},
+            {"id": "sessions", "path": "/api/brain/sessions", "params": {"days": "7"}},
+        ]})
+        assert resp.status_code == 200
+        results = {r["id"]: r for r in resp.json()["responses"]}
+        assert list(results) == ["health", "sync", "knowledge", "projects", "sessions"]
+        assert all(r["status"] == 200 for r in results.values())
+        assert results["health"]["body"]["status"] == "offline"
+
+    def test_raising_sub_request_fails_alone(self, client, monkeypatch):
+        async def broken(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(server, "brain_request", broken)
+        resp = client.post("/api/batch", json={"requests": [
+            {"id": "pricing", "path": "/api/pricing"},
+            {"id": "tasks", "path": "/api/brain/tasks"},
+        ]})
+        assert resp.status_code == 200
+        results = {r["id"]: r for r in resp.json()["responses"]}
+        assert results["pricing"]["status"] == 200
+        assert results["tasks"]["status"] == 500
+
+    def test_streams_recursion_and_non_api_paths_rejected(self, client):
+        for path in ("/api/batch", "/api/brain/events/stream", "/static/app.js"):
+            resp = client.post("/api/batch", json={"requests": [{"path": path}]})
+            assert resp.status_code in (400, 422), path
+
+
+class TestRawPassthrough:
+    """Pass-through proxy routes forward upstream bytes without decoding."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh(self, monkeypatch):
+        monkeypatch.setattr(server, "brain_cache", server.BrainCache())
+        monkeypatch.setattr(server, "brain_breaker", server.CircuitBreaker())
+
+    def _request(self, handler, **headers):
+        import httpx
+        app = SimpleNamespace(state=SimpleNamespace(
+            brain_config={"url": "http://brain"},
+            brain_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ))
+        return SimpleNamespace(app=app, headers=headers)
+
+    def test_gzip_body_and_etag_forwarded_verbatim(self, event_loop):
+        import gzip
+        import httpx
+        payload = json.dumps({"tasks": [{"id": n} for n in range(100)]}).encode()
+        wire = gzip.compress(payload)
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["accept-encoding"])
+            return httpx.Response(200, stream=httpx.ByteStream(wire), headers={
+                "Content-Type": "application/json", "Content-Encoding": "gzip", "ETag": '"t1"',
+            })
+
+        def call(**headers):
+            return event_loop.run_until_complete(server.brain_tasks(
+                self._request(handler, **headers), Response(), status=None, task_type=None,
+                project_slug=None, assignee=None, scope=None, limit=50, offset=0,
+            ))
+
+        gz = call(**{"accept-encoding": "gzip, br"})
+        assert gz.body == wire
+        assert (gz.headers["content-encoding"], gz.headers["etag"]) == ("gzip", '"t1"')
+        plain = call()
+        assert plain.body == payload and "content-encoding" not in plain.headers
+        assert plain.headers["etag"] == '"t1-identity"'
+        refused = call(**{"accept-encoding": "gzip;q=0, xgzip"})
+        assert refused.body == payload and refused.headers["etag"] == '"t1-identity"'
+        assert call(**{"accept-encoding": "gzip", "if-none-match": '"t1"'}).status_code == 304
+        assert call(**{"if-none-match": 'W/"t1-identity"'}).status_code == 304
+        assert call(**{"if-none-match": '"t1"'}).status_code == 200
+        # Served from the raw cache after the first fetch
+        assert seen == ["gzip"]
+        assert isinstance(next(iter(server.brain_cache.entries.values()))[0], server.RawBrainBody)